@@ -3,29 +3,413 @@ https://typer.tiangolo.com/tutorial/
 """
 
 import asyncio
-from datetime import datetime
+import json
+import logging
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Annotated, Literal
 
 import typer
+from pydantic import ValidationError
 
-from rfp_scraper.services import scrape_sam_gov
+from rfp_scraper import logging as rfp_logging
+from rfp_scraper.services import attachments, descriptions, incremental, multi_query, scrape_sam_gov, watch
+from rfp_scraper.services.checkpoint import ScrapeCheckpoint
+from rfp_scraper.services.http_client import DEFAULT_CLIENT_SETTINGS, ClientSettings, http2_available
+from rfp_scraper.services.metrics import ScrapeMetrics
+from rfp_scraper.services.quarantine import RecordQuarantine
+from rfp_scraper.services.rate_limit import TokenBucketRateLimiter
+from rfp_scraper.services.response_cache import DEFAULT_MAX_BYTES, DEFAULT_TTL_SECONDS, ResponseCache
+from rfp_scraper.services.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from rfp_scraper.services.search_filters import SearchFilters
+from rfp_scraper.services.sinks import JsonlSink, OpportunitySink, drain_pages
+from rfp_scraper.services.sqlite_store import OpportunityStore
 
 app = typer.Typer(no_args_is_help=True)
 
 scrape = typer.Typer(no_args_is_help=True)
 app.add_typer(scrape, name="scrape")
 
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR"]
+
 DEFAULT_START_DATE = datetime(year=2025, month=4, day=28)
 DEFAULT_END_DATE = datetime(year=2025, month=4, day=29)
+DEFAULT_INCREMENTAL_STATE_PATH = Path(".rfp_scraper/sam_gov_incremental_state.json")
+DEFAULT_DESCRIPTIONS_PATH = Path(".rfp_scraper/descriptions")
+DEFAULT_ATTACHMENTS_PATH = Path(".rfp_scraper/attachments")
+
+
+def _rate_limiter(requests_per_second: float | None, burst: int) -> TokenBucketRateLimiter | None:
+    if requests_per_second is None:
+        return None
+    try:
+        return TokenBucketRateLimiter(requests_per_second, burst)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+
+@app.callback()
+def app_callback(
+    log_profile: Annotated[
+        rfp_logging.LogProfile,
+        typer.Option(
+            envvar=rfp_logging.LOG_PROFILE_ENV_VAR,
+            help="dev adds the callsite to every log event; production only to warnings and errors, and writes logs "
+            "from a background thread.",
+        ),
+    ] = "dev",
+    log_level: LogLevel = "INFO",
+    log_sample_every: Annotated[
+        int, typer.Option(min=1, help="Only log every Nth per-page event (search responses and pagination).")
+    ] = 10,
+    log_limits: Annotated[
+        bool,
+        typer.Option(
+            help="Sample per-page events, coalesce repeated warnings and cap large log fields. --no-log-limits logs "
+            "everything in full."
+        ),
+    ] = True,
+) -> None:
+    limits = None
+    if log_limits:
+        limits = rfp_logging.LogVolumeLimits(
+            sample_every=dict.fromkeys(rfp_logging.DEFAULT_LOG_VOLUME_LIMITS.sample_every, log_sample_every)
+        )
+    rfp_logging.configure_logging(log_profile, logging.getLevelNamesMapping()[log_level], limits, force=True)
+
+
+@scrape.callback()
+def scrape_callback(
+    ctx: typer.Context,
+    max_connections: Annotated[
+        int, typer.Option(help="Open connections allowed at once per client.")
+    ] = DEFAULT_CLIENT_SETTINGS.max_connections,
+    max_keepalive_connections: Annotated[
+        int, typer.Option(help="Idle connections kept open for reuse.")
+    ] = DEFAULT_CLIENT_SETTINGS.max_keepalive_connections,
+    keepalive_expiry: Annotated[
+        float, typer.Option(help="Seconds an idle connection is kept open.")
+    ] = DEFAULT_CLIENT_SETTINGS.keepalive_expiry,
+    connect_timeout: float = DEFAULT_CLIENT_SETTINGS.connect_timeout,
+    read_timeout: float = DEFAULT_CLIENT_SETTINGS.read_timeout,
+    http2: Annotated[
+        bool, typer.Option(help="Multiplex requests over HTTP/2 (needs the http2 extra).")
+    ] = DEFAULT_CLIENT_SETTINGS.http2,
+) -> None:
+    """Scrape SAM.gov; the connection options here apply to every subcommand."""
+    if http2 and not http2_available():
+        raise typer.BadParameter("--http2 needs the h2 package: install rfp-scraper with the `http2` extra")
+    try:
+        ctx.obj = ClientSettings(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            http2=http2,
+        )
+    except ValidationError as e:
+        raise typer.BadParameter(str(e)) from e
 
 
 @scrape.command(name="sam")
-def scrape_sam_gov_command(start: datetime = DEFAULT_START_DATE, end: datetime = DEFAULT_END_DATE) -> None:
-    asyncio.get_event_loop().run_until_complete(
-        scrape_sam_gov.run_scraping(
-            start_date=start,
-            end_date=end,
+def scrape_sam_gov_command(
+    ctx: typer.Context,
+    start: Annotated[
+        datetime | None, typer.Option(help=f"Defaults to {DEFAULT_START_DATE:%Y-%m-%d}, or today with --watch.")
+    ] = None,
+    end: datetime = DEFAULT_END_DATE,
+    max_concurrent_requests: Annotated[int, typer.Option(min=1)] = scrape_sam_gov.DEFAULT_MAX_CONCURRENT_REQUESTS,
+    shard_days: Annotated[
+        int | None,
+        typer.Option(min=1, help="Split the range into shards of this many days, paged concurrently. Off by default."),
+    ] = None,
+    max_concurrent_shards: Annotated[int, typer.Option(min=1)] = scrape_sam_gov.DEFAULT_MAX_CONCURRENT_SHARDS,
+    requests_per_second: float | None = None,
+    burst: Annotated[int, typer.Option(min=1)] = 1,
+    max_retries: int = DEFAULT_RETRY_POLICY.max_retries,
+    retry_budget: int | None = None,
+    output: Annotated[Path | None, typer.Option(help="Write opportunities to this JSON Lines file.")] = None,
+    checkpoint: Annotated[
+        Path | None, typer.Option(help="Checkpoint file to record progress in. Defaults to <output>.checkpoint.json.")
+    ] = None,
+    resume: Annotated[bool, typer.Option(help="Continue the scrape recorded in the checkpoint file.")] = False,
+    incremental_mode: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Only fetch notices posted since the last incremental run (minus --overlap-days) up to now; "
+            "--start is used for the first run and --end is ignored. New or changed notices are appended to --output.",
+        ),
+    ] = False,
+    watch_mode: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            help="Keep running and poll for new notices like --incremental does, waiting between polls from "
+            "--min-poll-interval (after a poll that found something) up to --max-poll-interval (after quiet polls).",
+        ),
+    ] = False,
+    min_poll_interval: Annotated[float, typer.Option(help="Seconds between polls while notices keep coming.")] = (
+        watch.DEFAULT_POLL_SCHEDULE.min_interval_seconds
+    ),
+    max_poll_interval: Annotated[float, typer.Option(help="Longest wait between polls outside busy hours.")] = (
+        watch.DEFAULT_POLL_SCHEDULE.max_interval_seconds
+    ),
+    state: Annotated[Path, typer.Option(help="High-water mark state file for --incremental and --watch.")] = (
+        DEFAULT_INCREMENTAL_STATE_PATH
+    ),
+    overlap_days: Annotated[int, typer.Option(help="Days before the high-water mark to re-query.")] = (
+        incremental.DEFAULT_OVERLAP.days
+    ),
+    sqlite: Annotated[Path | None, typer.Option(help="Upsert opportunities into this SQLite database.")] = None,
+    parquet: Annotated[
+        Path | None,
+        typer.Option(help="Write opportunities to a Parquet dataset partitioned by posted month (needs pyarrow)."),
+    ] = None,
+    cache_dir: Annotated[
+        Path | None, typer.Option(help="Cache raw SAM.gov responses here and reuse them on repeat runs.")
+    ] = None,
+    cache_ttl_hours: float = DEFAULT_TTL_SECONDS / 3600,
+    cache_max_mb: int = DEFAULT_MAX_BYTES // (1024 * 1024),
+    json_backend: Annotated[
+        scrape_sam_gov.JsonBackend, typer.Option(help="JSON parser for search pages; orjson needs the orjson extra.")
+    ] = "pydantic",
+    quarantine: Annotated[
+        Path | None,
+        typer.Option(help="Append records that fail validation to this JSON Lines file instead of failing the page."),
+    ] = None,
+    fields: Annotated[
+        str | None,
+        typer.Option(
+            help="Comma-separated opportunity fields to decode and keep, e.g. title,naicsCode,responseDeadLine. "
+            "noticeId and postedDate are always kept."
+        ),
+    ] = None,
+    ptype: Annotated[
+        list[str] | None,
+        typer.Option(help="Procurement type code to match (u, p, a, r, s, o, g, k or i); repeat for several."),
+    ] = None,
+    notice_id: Annotated[str | None, typer.Option(help="Only this notice.")] = None,
+    solicitation_number: Annotated[str | None, typer.Option(help="Solicitation number to match.")] = None,
+    title: Annotated[str | None, typer.Option(help="Title to match.")] = None,
+    performance_state: Annotated[str | None, typer.Option(help="Two-letter place of performance state.")] = None,
+    performance_zip: Annotated[str | None, typer.Option(help="Five-digit place of performance ZIP code.")] = None,
+    set_aside: Annotated[str | None, typer.Option(help="Set-aside code, e.g. SBA or 8A.")] = None,
+    set_aside_description: Annotated[str | None, typer.Option(help="Set-aside description to match.")] = None,
+    naics: Annotated[str | None, typer.Option(help="NAICS code to match.")] = None,
+    classification_code: Annotated[str | None, typer.Option(help="Product service (classification) code.")] = None,
+    response_deadline_from: Annotated[datetime | None, typer.Option(help="Earliest response deadline.")] = None,
+    response_deadline_to: Annotated[datetime | None, typer.Option(help="Latest response deadline.")] = None,
+    queries: Annotated[
+        Path | None,
+        typer.Option(
+            help="JSON file with a list of saved queries ({name, filters}) to run together instead of the filter "
+            "options; notices matched by several queries are only written once."
+        ),
+    ] = None,
+    query_matches: Annotated[
+        Path | None, typer.Option(help="With --queries, write the names of the queries that matched each notice here.")
+    ] = None,
+    metrics_port: Annotated[
+        int | None,
+        typer.Option(
+            help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics while scraping (needs the "
+            "prometheus extra)."
+        ),
+    ] = None,
+) -> None:
+    if incremental_mode and (checkpoint is not None or resume or cache_dir is not None):
+        raise typer.BadParameter("--incremental cannot be combined with --checkpoint, --resume or --cache-dir")
+    if watch_mode and (incremental_mode or checkpoint is not None or resume or cache_dir is not None):
+        raise typer.BadParameter("--watch cannot be combined with --incremental, --checkpoint, --resume or --cache-dir")
+    if queries is not None and (incremental_mode or watch_mode or checkpoint is not None or resume):
+        raise typer.BadParameter("--queries cannot be combined with --incremental, --watch, --checkpoint or --resume")
+    if query_matches is not None and queries is None:
+        raise typer.BadParameter("--query-matches needs --queries")
+    if parquet is not None and (checkpoint is not None or resume or incremental_mode or watch_mode):
+        # Parquet files are only complete once the sink is closed, so a checkpoint or a high-water mark saved before
+        # that would run ahead of them and the buffered notices would never be fetched again.
+        raise typer.BadParameter("--parquet cannot be combined with --checkpoint, --resume, --incremental or --watch")
+    if start is None:
+        start = datetime.combine(datetime.now().date(), datetime.min.time()) if watch_mode else DEFAULT_START_DATE
+    try:
+        schedule = watch.PollSchedule(
+            min_interval_seconds=min_poll_interval,
+            max_interval_seconds=max_poll_interval,
+            busy_max_interval_seconds=min(watch.DEFAULT_POLL_SCHEDULE.busy_max_interval_seconds, max_poll_interval),
+        )
+    except ValidationError as e:
+        raise typer.BadParameter(str(e)) from e
+    if (
+        checkpoint is None
+        and output is not None
+        and parquet is None
+        and not incremental_mode
+        and not watch_mode
+        and queries is None
+    ):
+        checkpoint = output.with_name(f"{output.name}.checkpoint.json")
+    if resume and checkpoint is None:
+        raise typer.BadParameter("--resume needs --checkpoint or --output")
+
+    try:
+        filters = SearchFilters(
+            procurement_types=frozenset(ptype or ()),  # pyright: ignore[reportArgumentType]
+            notice_id=notice_id,
+            solicitation_number=solicitation_number,
+            title=title,
+            state=performance_state,
+            zip=performance_zip,
+            type_of_set_aside=set_aside,
+            type_of_set_aside_description=set_aside_description,
+            naics_code=naics,
+            classification_code=classification_code,
+            response_deadline_from=response_deadline_from.date() if response_deadline_from is not None else None,
+            response_deadline_to=response_deadline_to.date() if response_deadline_to is not None else None,
+        )
+    except ValidationError as e:
+        raise typer.BadParameter(str(e)) from e
+    if queries is not None and filters != SearchFilters():
+        raise typer.BadParameter("Filter options cannot be combined with --queries; put the filters in the queries")
+    projected_fields = [field.strip() for field in fields.split(",") if field.strip()] if fields is not None else None
+    if projected_fields is not None:
+        try:
+            _ = scrape_sam_gov.projected_opportunity_model(frozenset(projected_fields))
+        except ValueError as e:
+            raise typer.BadParameter(str(e)) from e
+    rate_limiter = _rate_limiter(requests_per_second, burst)
+
+    scrape_checkpoint = ScrapeCheckpoint.open(checkpoint, resume=resume) if checkpoint is not None else None
+    if output is None and scrape_checkpoint is not None and scrape_checkpoint.output_path is not None:
+        output = Path(scrape_checkpoint.output_path)
+
+    metrics = ScrapeMetrics()
+    options: scrape_sam_gov.ScrapeOptions = {
+        "filters": filters if filters != SearchFilters() else None,
+        "max_concurrent_requests": max_concurrent_requests,
+        "shard_size": timedelta(days=shard_days) if shard_days is not None else None,
+        "max_concurrent_shards": max_concurrent_shards,
+        "rate_limiter": rate_limiter,
+        "retry_policy": RetryPolicy(max_retries=max_retries, retry_budget=retry_budget),
+        "response_cache": ResponseCache(cache_dir, cache_ttl_hours * 3600, cache_max_mb * 1024 * 1024)
+        if cache_dir is not None
+        else None,
+        "client_settings": ctx.obj,
+        "json_backend": json_backend,
+        "fields": projected_fields,
+        "checkpoint": scrape_checkpoint,
+        "metrics": metrics,
+    }
+    with ExitStack() as stack:
+        if metrics_port is not None:
+            # Imported lazily since prometheus-client is an optional dependency.
+            from rfp_scraper.services.prometheus_export import start_metrics_server
+
+            metrics_server = start_metrics_server(metrics, metrics_port)
+            _ = stack.callback(metrics_server.shutdown)
+        if quarantine is not None:
+            options["quarantine"] = stack.enter_context(RecordQuarantine(quarantine))
+        sinks: list[OpportunitySink] = []
+        if output is not None:
+            sinks.append(
+                stack.enter_context(JsonlSink(output, scrape_checkpoint, append=incremental_mode or watch_mode))
+            )
+        if sqlite is not None:
+            sinks.append(stack.enter_context(OpportunityStore(sqlite)))
+        if parquet is not None:
+            # Imported lazily since pyarrow is an optional dependency.
+            from rfp_scraper.services.parquet_export import ParquetSink
+
+            sinks.append(stack.enter_context(ParquetSink(parquet)))
+
+        matches: dict[str, set[str]] = {}
+        if queries is not None:
+            pages = multi_query.iter_multi_query_pages(
+                multi_query.load_saved_queries(queries), start, end, matches=matches, **options
+            )
+        elif watch_mode:
+            pages = watch.watch_opportunity_pages(
+                incremental.IncrementalState.open(state),
+                start,
+                schedule=schedule,
+                overlap=timedelta(days=overlap_days),
+                **options,
+            )
+        elif incremental_mode:
+            pages = incremental.iter_new_opportunity_pages(
+                incremental.IncrementalState.open(state),
+                start,
+                overlap=timedelta(days=overlap_days),
+                **options,
+            )
+        else:
+            pages = scrape_sam_gov.iter_opportunity_pages(start_date=start, end_date=end, **options)
+        asyncio.get_event_loop().run_until_complete(drain_pages(pages, sinks, metrics))  # pyright: ignore[reportUnusedCallResult]
+
+    if query_matches is not None:
+        _ = query_matches.write_text(
+            json.dumps({notice_id: sorted(query_names) for notice_id, query_names in matches.items()}, indent=2)
+        )
+
+
+@scrape.command(name="descriptions")
+def scrape_descriptions_command(
+    ctx: typer.Context,
+    notices: Annotated[Path, typer.Argument(help="JSON Lines file of opportunities, e.g. the --output of scrape sam.")],
+    descriptions_dir: Annotated[
+        Path, typer.Option("--descriptions", help="Directory the descriptions are cached in.")
+    ] = DEFAULT_DESCRIPTIONS_PATH,
+    max_concurrent_requests: Annotated[int, typer.Option(min=1)] = descriptions.DEFAULT_MAX_CONCURRENT_REQUESTS,
+    requests_per_second: float | None = None,
+    burst: Annotated[int, typer.Option(min=1)] = 1,
+    max_retries: int = DEFAULT_RETRY_POLICY.max_retries,
+) -> None:
+    """Fetch the full description text of every notice in NOTICES that is not cached yet."""
+    rate_limiter = _rate_limiter(requests_per_second, burst)
+    with notices.open(encoding="utf-8") as notices_file:
+        notice_ids = [json.loads(line)["noticeId"] for line in notices_file if line.strip()]
+    summary = asyncio.get_event_loop().run_until_complete(
+        descriptions.hydrate_descriptions(
+            notice_ids,
+            descriptions.DescriptionStore(descriptions_dir),
+            max_concurrent_requests=max_concurrent_requests,
+            rate_limiter=rate_limiter,
+            retry_policy=RetryPolicy(max_retries=max_retries),
+            client_settings=ctx.obj,
+        )
+    )
+    if summary.cnt_failed:
+        raise typer.Exit(code=1)
+
+
+@scrape.command(name="attachments")
+def scrape_attachments_command(
+    ctx: typer.Context,
+    notices: Annotated[Path, typer.Argument(help="JSON Lines file of opportunities, e.g. the --output of scrape sam.")],
+    attachments_dir: Annotated[
+        Path, typer.Option("--attachments", help="Directory the attachments are stored in.")
+    ] = DEFAULT_ATTACHMENTS_PATH,
+    max_concurrent_downloads: Annotated[int, typer.Option(min=1)] = attachments.DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    max_connections_per_host: Annotated[int, typer.Option(min=1)] = attachments.DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    max_retries: int = DEFAULT_RETRY_POLICY.max_retries,
+) -> None:
+    """Download the resource links (solicitation documents) of every notice in NOTICES that are not stored yet."""
+    with notices.open(encoding="utf-8") as notices_file:
+        urls = [url for line in notices_file if line.strip() for url in attachments.resource_links(json.loads(line))]
+    summary = asyncio.get_event_loop().run_until_complete(
+        attachments.download_attachments(
+            urls,
+            attachments.AttachmentStore(attachments_dir),
+            max_concurrent_downloads=max_concurrent_downloads,
+            max_connections_per_host=max_connections_per_host,
+            retry_policy=RetryPolicy(max_retries=max_retries),
+            client_settings=ctx.obj,
         )
-    )  # pyright: ignore[reportUnusedCallResult]
+    )
+    if summary.cnt_failed:
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
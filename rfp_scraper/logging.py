@@ -1,15 +1,161 @@
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import suppress
+from typing import Any, Literal, TextIO, cast
 
 import structlog
+from pydantic import BaseModel, ConfigDict, Field
+from structlog.typing import EventDict, Processor, WrappedLogger
 
+LogProfile = Literal["dev", "production"]
+"""`dev` adds the callsite of every event; `production` only of warnings and errors, and writes from a thread."""
 
-def _configure_logging():
+LOG_PROFILE_ENV_VAR = "RFP_LOG_PROFILE"
+
+_CALLSITE_PARAMETERS = {
+    structlog.processors.CallsiteParameter.FILENAME,
+    structlog.processors.CallsiteParameter.FUNC_NAME,
+    structlog.processors.CallsiteParameter.LINENO,
+}
+_WARNING_METHODS = frozenset({"warning", "warn", "error", "exception", "critical", "fatal"})
+_ERROR_METHODS = frozenset({"error", "exception", "critical", "fatal"})
+# Containers nested deeper than this are rendered with `repr` and capped as one string.
+_MAX_CAPPED_DEPTH = 4
+# Rendered by later processors, which need them as they were passed (e.g. an exc_info tuple, not a list).
+_UNCAPPED_KEYS = frozenset({"exc_info", "stack_info"})
+
+
+class LogVolumeLimits(BaseModel):
+    """Limits that keep large backfills from writing gigabytes of logs.
+
+    Errors are never dropped, only their fields are capped.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    sample_every: dict[str, int] = Field(
+        default_factory=lambda: {"SAM.gov search pagination": 10, "SAM.gov search response": 10}
+    )
+    """Info and debug events only logged every Nth time, by event name; logged ones carry `sampled_every`."""
+    coalesce_window_seconds: float = Field(default=10.0, ge=0)
+    """Repeats of a warning (same logger and event) within this many seconds of the last logged one are dropped; the
+    next one logged carries their count as `cnt_coalesced`. 0 disables coalescing."""
+    max_field_chars: int = Field(default=2000, ge=1)
+    """Strings in event fields are cut to this many characters."""
+    max_field_items: int = Field(default=20, ge=1)
+    """Lists and dicts in event fields are cut to this many items."""
+
+
+DEFAULT_LOG_VOLUME_LIMITS = LogVolumeLimits()
+
+
+class _WarningCallsiteAdder:
+    """Adds callsite parameters to warnings and errors only.
+
+    Finding the callsite walks the stack on every event, which costs more than the rest of the pipeline for the
+    high-volume info and debug events of the scrape loops; the rare warnings are where the callsite matters.
+    """
+
+    def __init__(self) -> None:
+        # This module's own frame sits between structlog and the caller, so it is skipped as well.
+        self._adder = structlog.processors.CallsiteParameterAdder(_CALLSITE_PARAMETERS, additional_ignores=[__name__])
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        if method_name in _WARNING_METHODS:
+            return self._adder(logger, method_name, event_dict)
+        return event_dict
+
+
+class _EventSampler:
+    def __init__(self, sample_every: dict[str, int]):
+        self._sample_every = sample_every
+        self._counts: dict[str, int] = {}
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        event = event_dict.get("event")
+        if not isinstance(event, str) or method_name in _WARNING_METHODS:
+            return event_dict
+        every = self._sample_every.get(event, 1)
+        if every <= 1:
+            return event_dict
+        count = self._counts.get(event, 0)
+        self._counts[event] = count + 1
+        if count % every:
+            raise structlog.DropEvent
+        event_dict["sampled_every"] = every
+        return event_dict
+
+
+class _WarningCoalescer:
+    def __init__(self, window_seconds: float):
+        self._window_seconds = window_seconds
+        # (logger name, event) -> (when it was last logged, repeats dropped since)
+        self._last_logged: dict[tuple[Any, Any], tuple[float, int]] = {}
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        if method_name not in _WARNING_METHODS or method_name in _ERROR_METHODS:
+            return event_dict
+        key = (getattr(logger, "name", None), event_dict.get("event"))
+        now = time.monotonic()
+        logged_at, cnt_dropped = self._last_logged.get(key, (None, 0))
+        if logged_at is not None and now - logged_at < self._window_seconds:
+            self._last_logged[key] = (logged_at, cnt_dropped + 1)
+            raise structlog.DropEvent
+        if cnt_dropped:
+            event_dict["cnt_coalesced"] = cnt_dropped
+        self._last_logged[key] = (now, 0)
+        return event_dict
+
+
+def _cap(value: Any, limits: LogVolumeLimits, depth: int = 0) -> Any:
+    if isinstance(value, str):
+        if len(value) <= limits.max_field_chars:
+            return value
+        return f"{value[: limits.max_field_chars]}...[{len(value) - limits.max_field_chars} more chars]"
+    if not isinstance(value, list | tuple | dict):
+        return value
+    if depth >= _MAX_CAPPED_DEPTH:
+        return _cap(repr(value), limits, depth)  # pyright: ignore[reportUnknownArgumentType]
+    if isinstance(value, dict):
+        items = list(cast(dict[Any, Any], value).items())
+        capped_dict = {key: _cap(item, limits, depth + 1) for key, item in items[: limits.max_field_items]}
+        if len(items) > limits.max_field_items:
+            capped_dict["..."] = f"{len(items) - limits.max_field_items} more items"
+        return capped_dict
+    values = list(cast(list[Any] | tuple[Any, ...], value))
+    capped_list = [_cap(item, limits, depth + 1) for item in values[: limits.max_field_items]]
+    if len(values) > limits.max_field_items:
+        capped_list.append(f"...{len(values) - limits.max_field_items} more items")
+    return capped_list
+
+
+class _FieldCapper:
+    def __init__(self, limits: LogVolumeLimits):
+        self._limits = limits
+
+    def __call__(self, logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
+        return {key: value if key in _UNCAPPED_KEYS else _cap(value, self._limits) for key, value in event_dict.items()}
+
+
+def _processors(profile: LogProfile, limits: LogVolumeLimits | None) -> list[Processor]:
     """
     Pulled from: https://www.structlog.org/en/stable/standard-library.html#rendering-within-structlog
     """
-    shared_processors = [
-        # If log level is too low, abort pipeline and throw away log entry.
+    processors: list[Processor] = [
+        # If log level is too low, abort pipeline and throw away log entry. This comes first so filtered out events
+        # cost as little as possible.
         structlog.stdlib.filter_by_level,
+    ]
+    if limits is not None:
+        # Dropping events before anything else is done with them keeps the dropped ones cheap.
+        processors.append(_EventSampler(limits.sample_every))
+        if limits.coalesce_window_seconds > 0:
+            processors.append(_WarningCoalescer(limits.coalesce_window_seconds))
+    processors += [
         # Add the name of the logger to event dict.
         structlog.stdlib.add_logger_name,
         # Add log level to event dict.
@@ -18,42 +164,93 @@ def _configure_logging():
         structlog.stdlib.PositionalArgumentsFormatter(),
         # Add a timestamp in ISO 8601 format.
         structlog.processors.TimeStamper(fmt="iso"),
-        # If the "stack_info" key in the event dict is true, remove it and
-        # render the current stack trace in the "stack" key.
-        structlog.processors.StackInfoRenderer(),
+    ]
+    if profile == "dev":
+        processors += [
+            # If the "stack_info" key in the event dict is true, remove it and
+            # render the current stack trace in the "stack" key.
+            structlog.processors.StackInfoRenderer(),
+            # Add callsite parameters.
+            structlog.processors.CallsiteParameterAdder(_CALLSITE_PARAMETERS),
+        ]
+    else:
+        processors.append(_WarningCallsiteAdder())
+    if limits is not None:
+        # Before the traceback is rendered, so exceptions are kept whole.
+        processors.append(_FieldCapper(limits))
+    processors += [
         # If the "exc_info" key in the event dict is either true or a
         # sys.exc_info() tuple, remove "exc_info" and render the exception
         # with traceback into the "exception" key.
         structlog.processors.format_exc_info,
         # If some value is in bytes, decode it to a Unicode str.
         structlog.processors.UnicodeDecoder(),
-        # Add callsite parameters.
-        structlog.processors.CallsiteParameterAdder(
-            {
-                structlog.processors.CallsiteParameter.FILENAME,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-            }
-        ),
         # Render the final event dict as JSON.
         structlog.processors.JSONRenderer(),
     ]
-    # if sys.stderr.isatty():
-    #     # Pretty printing when we run in a terminal session.
-    #     # Automatically prints pretty tracebacks when "rich" is installed
-    #     processors = shared_processors + [
-    #         structlog.dev.ConsoleRenderer(),
-    #     ]
-    # else:
-    #     # Print JSON when we run, e.g., in a Docker container.
-    #     # Also print structured tracebacks.
-    #     processors = shared_processors + [
-    #         structlog.processors.dict_tracebacks,
-    #         structlog.processors.JSONRenderer(),
-    #     ]
+    return processors
+
+
+class BackgroundStreamHandler(logging.Handler):
+    """Handler that hands already rendered lines to a writer thread, which writes them to `stream` in batches.
+
+    The logging thread only pays for putting a string on a queue, and a burst of events costs one write and one flush.
+    The stdlib `QueueHandler` copies and re-formats every record and its listener writes line by line, which measured
+    slower than writing directly. `close()` (called by `logging.shutdown` at exit) waits for the queued lines.
+    """
+
+    def __init__(self, stream: TextIO):
+        super().__init__()
+        self._stream = stream
+        self._lines: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_lines, name="rfp-scraper-log-writer", daemon=True)
+        self._writer.start()
 
+    def emit(self, record: logging.LogRecord) -> None:
+        # structlog has rendered the whole event into the message already.
+        self._lines.put(record.getMessage())
+
+    def _write_lines(self) -> None:
+        while True:
+            batch = [self._lines.get()]
+            with suppress(queue.Empty):
+                while True:
+                    batch.append(self._lines.get_nowait())
+            lines = [line for line in batch if line is not None]
+            if lines:
+                _ = self._stream.write("\n".join(lines) + "\n")
+                self._stream.flush()
+            if None in batch:
+                return
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._lines.put(None)
+            self._writer.join()
+        super().close()
+
+
+def _configure_stdlib_logging(profile: LogProfile, level: int) -> None:
+    """Send the rendered JSON lines to stderr, directly for `dev` and through a writer thread for `production`."""
+    handler: logging.Handler
+    if profile == "production":
+        handler = BackgroundStreamHandler(sys.stderr)
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root_logger = logging.getLogger()
+    for existing_handler in root_logger.handlers[:]:
+        root_logger.removeHandler(existing_handler)
+        existing_handler.close()
+    root_logger.addHandler(handler)
+    root_logger.setLevel(level)
+
+
+def _configure_logging(profile: LogProfile, level: int, limits: LogVolumeLimits | None) -> None:
+    _configure_stdlib_logging(profile, level)
     structlog.configure(
-        processors=shared_processors,
+        processors=_processors(profile, limits),
         # `wrapper_class` is the bound logger that you get back from
         # get_logger(). This one imitates the API of `logging.Logger`.
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -67,29 +264,29 @@ def _configure_logging():
         cache_logger_on_first_use=True,
     )
 
-    # root_logger = logging.getLogger()
-    # root_logger.setLevel(logging.INFO)
-
-    # formatter = structlog.stdlib.ProcessorFormatter(
-    #     processors=[structlog.dev.ConsoleRenderer()],
-    # )
-
-    # handler = logging.StreamHandler()
-    # # Use OUR `ProcessorFormatter` to format all `logging` entries.
-    # handler.setFormatter(formatter)
-    # root_logger = logging.getLogger()
-    # root_logger.addHandler(handler)
-    # root_logger.setLevel(logging.INFO)
 
-    structlog.stdlib.recreate_defaults(log_level=logging.INFO)
-
-
-def configure_logging():
+def configure_logging(
+    profile: LogProfile | None = None,
+    level: int = logging.INFO,
+    limits: LogVolumeLimits | None = DEFAULT_LOG_VOLUME_LIMITS,
+    *,
+    force: bool = False,
+) -> None:
     """
     Configure logging for the application.
+
+    Args:
+        profile: Logging profile; defaults to the `RFP_LOG_PROFILE` environment variable, or `dev` when unset
+        level: Minimum level of the events that are rendered
+        limits: Sampling, coalescing and field size limits; `None` logs every event in full
+        force: Reconfigure even if logging was configured already. Loggers cached by earlier use keep the old
+            configuration, so call this before anything logs
     """
-    if not structlog.is_configured():
-        _configure_logging()
+    if structlog.is_configured() and not force:
+        return
+    if profile is None:
+        profile = "production" if os.environ.get(LOG_PROFILE_ENV_VAR) == "production" else "dev"
+    _configure_logging(profile, level, limits)
 
 
 def build_logger(name: str) -> structlog.stdlib.BoundLogger:
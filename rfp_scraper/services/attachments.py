@@ -0,0 +1,294 @@
+import asyncio
+import hashlib
+import os
+from collections.abc import AsyncGenerator, Callable, Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
+from email.message import Message
+from pathlib import Path
+from typing import Any, cast
+
+import httpx
+import structlog
+from pydantic import BaseModel
+
+from rfp_scraper import logging
+from rfp_scraper.services.files import write_atomically
+from rfp_scraper.services.http_client import DEFAULT_CLIENT_SETTINGS, ClientSettings, build_transport
+from rfp_scraper.services.retry import DEFAULT_RETRY_POLICY, RetryPolicy, RetryTransport
+
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 8
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 2
+CHUNK_SIZE = 1024 * 1024
+
+
+class AttachmentDownloadError(Exception):
+    """Raised when an attachment cannot be downloaded."""
+
+    def __init__(self, url: str, status_code: int):
+        super().__init__(f"Failed to download {url}: {status_code}")
+        self.url = url
+        self.status_code = status_code
+
+
+class AttachmentRecord(BaseModel):
+    url: str
+    sha256: str
+    size: int
+    filename: str | None
+    """File name from the `Content-Disposition` header, if the server sent one."""
+    content_type: str | None
+
+
+class DownloadSummary(BaseModel):
+    cnt_downloaded: int = 0
+    cnt_duplicate_content: int = 0
+    """Downloads whose content was already stored under another URL."""
+    cnt_skipped: int = 0
+    """URLs that were already downloaded."""
+    cnt_failed: int = 0
+
+
+def resource_links(opportunity: dict[str, Any]) -> list[str]:
+    """Attachment URLs of one opportunity record; `resourceLinks` is untyped upstream and often null."""
+    links = opportunity.get("resourceLinks")
+    if not isinstance(links, list):
+        return []
+    return [link for link in cast(list[Any], links) if isinstance(link, str)]
+
+
+class AttachmentStore:
+    """Content-addressed on-disk store of downloaded attachments.
+
+    File contents live once under `objects/<sha256>` however many URLs serve them, `urls/<url hash>.json` holds the
+    `AttachmentRecord` of each downloaded URL, and unfinished downloads wait under `partial/` to be resumed.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _record_path(self, url: str) -> Path:
+        return self.directory / "urls" / f"{self._url_key(url)}.json"
+
+    def partial_paths(self, url: str) -> tuple[Path, Path]:
+        """Paths of the partial body of `url` and of the validator (`ETag` or `Last-Modified`) it was fetched with."""
+        key = self._url_key(url)
+        return self.directory / "partial" / f"{key}.part", self.directory / "partial" / f"{key}.validator"
+
+    def object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / digest
+
+    def __contains__(self, url: str) -> bool:
+        return self._record_path(url).exists()
+
+    def get(self, url: str) -> AttachmentRecord | None:
+        try:
+            return AttachmentRecord.model_validate_json(self._record_path(url).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def put(self, record: AttachmentRecord) -> None:
+        _ = write_atomically(self._record_path(record.url), record.model_dump_json())
+
+
+@asynccontextmanager
+async def build_download_client(
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY, client_settings: ClientSettings = DEFAULT_CLIENT_SETTINGS
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create a client for downloading resource links, pooled according to `client_settings`.
+
+    This is a separate client from `build_authenticated_client`'s: resource links redirect to pre-signed storage URLs
+    on other hosts, which must not be sent the API key.
+    """
+    client = httpx.AsyncClient(
+        transport=RetryTransport(build_transport(client_settings), retry_policy),
+        follow_redirects=True,
+        timeout=client_settings.timeout(),
+    )
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+def _filename(response: httpx.Response) -> str | None:
+    content_disposition = response.headers.get("content-disposition")
+    if content_disposition is None:
+        return None
+    message = Message()
+    message["content-disposition"] = content_disposition
+    return message.get_filename()
+
+
+def _range_validator(response: httpx.Response) -> str | None:
+    # `If-Range` only accepts strong ETags.
+    etag = response.headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("last-modified")
+
+
+@asynccontextmanager
+async def _stream(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str], host_slot: Callable[[str], asyncio.Semaphore]
+) -> AsyncGenerator[httpx.Response, None]:
+    """Stream a GET of `url`, following redirects one hop at a time so every hop holds a slot of its own host.
+
+    Resource links all point at sam.gov and redirect to the storage hosts actually serving the files, so the per-host
+    cap has to be applied after the redirect to limit what it is meant to.
+    """
+    request = client.build_request("GET", url, headers=headers)
+    for _ in range(client.max_redirects + 1):
+        async with host_slot(request.url.host):
+            response = await client.send(request, stream=True, follow_redirects=False)
+            try:
+                if response.next_request is None:
+                    yield response
+                    return
+            finally:
+                await response.aclose()
+        request = response.next_request
+    raise httpx.TooManyRedirects("Exceeded maximum allowed redirects.", request=request)
+
+
+async def _download(
+    client: httpx.AsyncClient,
+    url: str,
+    store: AttachmentStore,
+    host_slot: Callable[[str], asyncio.Semaphore],
+    logger: structlog.stdlib.BoundLogger,
+) -> tuple[AttachmentRecord, bool]:
+    """Stream `url` into the store, resuming a previous partial download with a `Range` request when possible.
+
+    Returns:
+        The stored record, and whether its content was already stored under another URL
+    """
+    part_path, validator_path = store.partial_paths(url)
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    headers: dict[str, str] = {}
+    # Without a validator the server could not tell us the file changed in between, so such downloads restart.
+    if part_path.exists() and validator_path.exists():
+        headers["Range"] = f"bytes={part_path.stat().st_size}-"
+        headers["If-Range"] = validator_path.read_text()
+
+    hasher = hashlib.sha256()
+    async with _stream(client, url, headers, host_slot) as response:
+        if response.status_code == 416:
+            part_path.unlink(missing_ok=True)
+            validator_path.unlink(missing_ok=True)
+        if not response.is_success:
+            raise AttachmentDownloadError(url, response.status_code)
+
+        resumed = response.status_code == 206
+        logger.debug("Attachment download started", url=url, status=response.status_code, resumed=resumed)
+        if not resumed:
+            validator = _range_validator(response)
+            if validator is not None:
+                _ = validator_path.write_text(validator)
+            else:
+                validator_path.unlink(missing_ok=True)
+
+        with part_path.open("r+b" if resumed else "wb") as part_file:
+            if resumed:
+                while chunk := part_file.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                _ = part_file.write(chunk)
+                hasher.update(chunk)
+        filename = _filename(response)
+        content_type = response.headers.get("content-type")
+
+    digest = hasher.hexdigest()
+    object_path = store.object_path(digest)
+    duplicate_content = object_path.exists()
+    if duplicate_content:
+        part_path.unlink()
+    else:
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(part_path, object_path)
+    validator_path.unlink(missing_ok=True)
+
+    record = AttachmentRecord(
+        url=url, sha256=digest, size=object_path.stat().st_size, filename=filename, content_type=content_type
+    )
+    store.put(record)
+    return record, duplicate_content
+
+
+async def download_attachments(
+    urls: Iterable[str],
+    store: AttachmentStore,
+    *,
+    max_concurrent_downloads: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    client_settings: ClientSettings = DEFAULT_CLIENT_SETTINGS,
+    client: httpx.AsyncClient | None = None,
+) -> DownloadSummary:
+    """Download every URL not yet in `store`, streaming each body to disk in chunks.
+
+    Up to `max_concurrent_downloads` downloads run at once, and at most `max_connections_per_host` of them against
+    the same host, counted after redirects, i.e. against the storage host serving the file. URLs already in the store
+    are skipped, and content that is already stored under another URL is not kept twice. A download that fails part
+    way leaves its partial file behind and is resumed with a `Range` request by the next call. Failures are logged and
+    counted rather than raised, so one dead link does not stop the rest.
+
+    Args:
+        urls: Attachment URLs, e.g. from `resource_links`
+        store: Where attachments are stored
+        max_concurrent_downloads: Maximum number of downloads in flight at once
+        max_connections_per_host: Maximum number of requests in flight against one host
+        retry_policy: Retry behaviour of the client built for this call; ignored when `client` is given
+        client_settings: Pooling, timeouts and protocol of the client built for this call; ignored when `client` is
+            given
+        client: Optional client to reuse, e.g. from `build_download_client`; redirects are followed whatever its
+            `follow_redirects` says. One is built (and closed) for this call when omitted
+
+    Returns:
+        Counts of what was downloaded, skipped and failed
+    """
+    if max_concurrent_downloads < 1 or max_connections_per_host < 1:
+        raise ValueError("max_concurrent_downloads and max_connections_per_host must be at least 1")
+
+    logger = logging.build_logger(name=f"{__name__}.{download_attachments.__name__}")
+    summary = DownloadSummary()
+    requested_urls = dict.fromkeys(urls)
+    missing_urls = [url for url in requested_urls if url not in store]
+    summary.cnt_skipped = len(requested_urls) - len(missing_urls)
+    logger.info("Starting to download attachments", cnt_missing=len(missing_urls), cnt_skipped=summary.cnt_skipped)
+
+    download_slots = asyncio.Semaphore(max_concurrent_downloads)
+    host_slots: dict[str, asyncio.Semaphore] = {}
+
+    def host_slot(host: str) -> asyncio.Semaphore:
+        return host_slots.setdefault(host, asyncio.Semaphore(max_connections_per_host))
+
+    async with AsyncExitStack() as stack:
+        download_client = (
+            client
+            if client is not None
+            else await stack.enter_async_context(build_download_client(retry_policy, client_settings))
+        )
+
+        async def download(url: str) -> None:
+            # The host that will serve the file is only known after the redirect, so the host slot is taken inside.
+            async with download_slots:
+                try:
+                    record, duplicate_content = await _download(download_client, url, store, host_slot, logger)
+                except (httpx.HTTPError, AttachmentDownloadError) as e:
+                    summary.cnt_failed += 1
+                    logger.warning("Attachment download failed", url=url, error=repr(e))
+                    return
+            summary.cnt_downloaded += 1
+            summary.cnt_duplicate_content += duplicate_content
+            logger.debug("Attachment downloaded", url=url, sha256=record.sha256, size=record.size)
+
+        async with asyncio.TaskGroup() as task_group:
+            for url in missing_urls:
+                _ = task_group.create_task(download(url))
+
+    logger.info("Attachments downloaded", **summary.model_dump())
+    return summary
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from rfp_scraper.services.files import write_atomically
+
+
+class ShardProgress(BaseModel):
+    """Progress through the pages of one `postedFrom`/`postedTo` query."""
+
+    total_records: int | None = None
+    completed_offsets: set[int] = Field(default_factory=set[int])
+    seen_notice_ids: set[str] = Field(default_factory=set[str])
+    """Notices yielded from the completed pages, so a resumed scrape does not yield them again; emptied once all
+    pages are completed."""
+
+
+class ScrapeCheckpoint(BaseModel):
+    """Resumable record of a scrape, persisted as JSON after every completed page.
+
+    Resuming assumes the queried window is historical: if SAM.gov's `totalRecords` for a shard changes between runs,
+    records can shift across page boundaries.
+    """
+
+    query: dict[str, str] = Field(default_factory=dict)
+    """Parameters the scrape was started with; a resumed scrape must use the same ones."""
+    output_path: str | None = None
+    output_bytes: int = 0
+    """Size of `output_path` after the last completed page; anything past it is a partially written page."""
+    shards: dict[str, ShardProgress] = Field(default_factory=dict)
+
+    _path: Path | None = PrivateAttr(default=None)
+
+    @classmethod
+    def open(cls, path: Path, *, resume: bool = False) -> "ScrapeCheckpoint":
+        """Load the checkpoint at `path` when resuming, otherwise start a fresh one that will be saved there."""
+        checkpoint = cls.model_validate_json(path.read_bytes()) if resume and path.exists() else cls()
+        checkpoint._path = path
+        return checkpoint
+
+    def bind_query(self, query: dict[str, str]) -> None:
+        """Record the scrape parameters, refusing to continue a checkpoint that was written for different ones."""
+        if self.query and self.query != query:
+            raise ValueError(f"Checkpoint {self._path} was written for {self.query}, not {query}")
+        self.query = query
+
+    def shard(self, shard_key: str) -> ShardProgress:
+        return self.shards.setdefault(shard_key, ShardProgress())
+
+    def save(self) -> None:
+        """Atomically replace the checkpoint file."""
+        if self._path is not None:
+            _ = write_atomically(self._path, self.model_dump_json())
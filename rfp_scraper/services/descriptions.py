@@ -0,0 +1,158 @@
+import asyncio
+import hashlib
+import re
+from collections.abc import Iterable
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+import httpx
+import structlog
+from pydantic import BaseModel, ValidationError
+
+from rfp_scraper import logging
+from rfp_scraper.services.files import write_atomically
+from rfp_scraper.services.http_client import DEFAULT_CLIENT_SETTINGS, ClientSettings
+from rfp_scraper.services.rate_limit import TokenBucketRateLimiter
+from rfp_scraper.services.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from rfp_scraper.services.scrape_sam_gov import SamGovApiError, build_authenticated_client
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+_NOTICE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class _NoticeDescription(BaseModel):
+    description: str | None = None
+
+
+class HydrationSummary(BaseModel):
+    cnt_fetched: int = 0
+    cnt_skipped: int = 0
+    """Notices whose description was already stored."""
+    cnt_failed: int = 0
+
+
+class DescriptionStore:
+    """Content-addressed on-disk store of notice descriptions.
+
+    Each distinct text is stored once as `objects/<sha256>`, however many notices share it (amendments often repeat
+    their description verbatim), and `notices/<noticeId>` holds the hash of each notice's text. Notices without a
+    description are stored with an empty text so they are not fetched again.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def _notice_path(self, notice_id: str) -> Path:
+        if not _NOTICE_ID_PATTERN.match(notice_id):
+            raise ValueError(f"Unexpected noticeId {notice_id!r}")
+        return self.directory / "notices" / notice_id
+
+    def _object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / digest
+
+    def __contains__(self, notice_id: str) -> bool:
+        return self._notice_path(notice_id).exists()
+
+    def get(self, notice_id: str) -> str | None:
+        try:
+            digest = self._notice_path(notice_id).read_text()
+        except FileNotFoundError:
+            return None
+        return self._object_path(digest).read_text(encoding="utf-8")
+
+    def put(self, notice_id: str, description: str) -> None:
+        content = description.encode()
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        # The text is written before the notice points at it, so a crash never leaves a dangling notice entry.
+        if not object_path.exists():
+            _ = write_atomically(object_path, content)
+        _ = write_atomically(self._notice_path(notice_id), digest)
+
+
+async def _fetch_description(client: httpx.AsyncClient, notice_id: str, logger: structlog.stdlib.BoundLogger) -> str:
+    response = await client.get("/v1/noticedesc", params={"noticeid": notice_id})
+    logger.debug("SAM.gov notice description response", status=response.status_code, notice_id=notice_id)
+    if response.status_code == 404:
+        return ""
+    if not response.is_success:
+        raise SamGovApiError(response.status_code, response.text)
+    return _NoticeDescription.model_validate_json(response.content).description or ""
+
+
+async def hydrate_descriptions(
+    notice_ids: Iterable[str],
+    store: DescriptionStore,
+    *,
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    rate_limiter: TokenBucketRateLimiter | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    client_settings: ClientSettings = DEFAULT_CLIENT_SETTINGS,
+    client: httpx.AsyncClient | None = None,
+) -> HydrationSummary:
+    """Fetch the description of every notice not yet in `store` from `/v1/noticedesc` and store it.
+
+    Descriptions are fetched by `max_concurrent_requests` workers and stored as soon as each arrives, so an
+    interrupted run loses at most the requests in flight and a rerun only fetches what is still missing. Failures are
+    logged and counted rather than raised, so one notice that keeps failing does not stop the rest; it is tried again
+    by the next run.
+
+    Args:
+        notice_ids: Notices to hydrate; duplicates and notices already in `store` are skipped
+        store: Where descriptions are cached
+        max_concurrent_requests: Maximum number of description requests in flight at once
+        rate_limiter: Optional limiter applied to the client built for this call; ignored when `client` is given
+        retry_policy: Retry behaviour of the client built for this call; ignored when `client` is given
+        client_settings: Pooling, timeouts and protocol of the client built for this call; ignored when `client` is
+            given
+        client: Optional client to reuse, e.g. the one the scrape used; one is built (and closed) for this call when
+            omitted
+
+    Returns:
+        Counts of what was fetched, skipped and failed
+    """
+    if max_concurrent_requests < 1:
+        raise ValueError(f"max_concurrent_requests must be at least 1, got {max_concurrent_requests}")
+
+    logger = logging.build_logger(name=f"{__name__}.{hydrate_descriptions.__name__}")
+    summary = HydrationSummary()
+    requested_notice_ids = dict.fromkeys(notice_ids)
+    missing_notice_ids = [notice_id for notice_id in requested_notice_ids if notice_id not in store]
+    summary.cnt_skipped = len(requested_notice_ids) - len(missing_notice_ids)
+    logger.info(
+        "Starting to hydrate SAM.gov notice descriptions",
+        cnt_requested=len(requested_notice_ids),
+        cnt_missing=len(missing_notice_ids),
+    )
+
+    pending_notice_ids = iter(missing_notice_ids)
+    async with AsyncExitStack() as stack:
+        description_client = (
+            client
+            if client is not None
+            else await stack.enter_async_context(
+                build_authenticated_client(
+                    rate_limiter=rate_limiter, retry_policy=retry_policy, client_settings=client_settings
+                )
+            )
+        )
+
+        async def worker() -> None:
+            # Workers share one iterator, so each notice is handed to exactly one of them.
+            for notice_id in pending_notice_ids:
+                try:
+                    description = await _fetch_description(description_client, notice_id, logger)
+                except (httpx.HTTPError, SamGovApiError, ValidationError) as e:
+                    summary.cnt_failed += 1
+                    logger.warning("SAM.gov notice description failed", notice_id=notice_id, error=repr(e))
+                    continue
+                store.put(notice_id, description)
+                summary.cnt_fetched += 1
+
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(min(max_concurrent_requests, len(missing_notice_ids))):
+                _ = task_group.create_task(worker())
+
+    logger.info("SAM.gov notice descriptions hydrated", **summary.model_dump())
+    return summary
@@ -0,0 +1,19 @@
+import os
+from pathlib import Path
+
+
+def write_atomically(path: Path, data: bytes | str) -> int:
+    """Replace the file at `path` with `data` so a crash mid-write never leaves it truncated.
+
+    The data is written to a temporary file next to `path` that is then renamed over it; parent directories are created
+    as needed. Strings are encoded as UTF-8.
+
+    Returns:
+        Number of bytes written
+    """
+    content = data.encode() if isinstance(data, str) else data
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    written_bytes = tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return written_bytes
@@ -0,0 +1,57 @@
+import importlib.util
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ClientSettings(BaseModel):
+    """Connection pool, timeout and protocol settings of the HTTP clients talking to SAM.gov and its file storage.
+
+    Build one client from these per process and pass it to every stage (`client=`), so connections and their TLS
+    sessions are reused instead of being set up again for each call.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_connections: int = Field(default=32, ge=1)
+    """Open connections allowed at once; requests beyond it wait up to `pool_timeout` for a free one."""
+    max_keepalive_connections: int = Field(default=32, ge=0)
+    """Idle connections kept open for reuse."""
+    keepalive_expiry: float = Field(default=60.0, ge=0)
+    """Seconds an idle connection is kept before it is closed."""
+    connect_timeout: float = Field(default=10.0, gt=0)
+    read_timeout: float = Field(default=60.0, gt=0)
+    """Seconds to wait for each chunk of a response, not for the whole body."""
+    write_timeout: float = Field(default=30.0, gt=0)
+    pool_timeout: float = Field(default=30.0, gt=0)
+    """Seconds to wait for a connection from the pool."""
+    http2: bool = False
+    """Multiplex requests over HTTP/2 connections where the server supports it; needs the http2 extra."""
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout, read=self.read_timeout, write=self.write_timeout, pool=self.pool_timeout
+        )
+
+
+DEFAULT_CLIENT_SETTINGS = ClientSettings()
+
+
+def http2_available() -> bool:
+    """Whether the h2 package that HTTP/2 needs is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_transport(settings: ClientSettings = DEFAULT_CLIENT_SETTINGS) -> httpx.AsyncHTTPTransport:
+    """Create the network transport at the bottom of a client's transport stack, pooled according to `settings`."""
+    # httpx only imports h2 once the first HTTP/2 connection is made, so fail here rather than mid-scrape.
+    if settings.http2 and not http2_available():
+        raise ImportError("HTTP/2 needs the h2 package: install rfp-scraper with the `http2` extra")
+    return httpx.AsyncHTTPTransport(limits=settings.limits(), http2=settings.http2)
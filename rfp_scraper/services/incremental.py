@@ -0,0 +1,141 @@
+import datetime
+import hashlib
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from pathlib import Path
+from typing import Unpack
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from rfp_scraper import logging
+from rfp_scraper.services.files import write_atomically
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity, ScrapeOptions, iter_opportunity_pages
+
+DEFAULT_OVERLAP = datetime.timedelta(days=1)
+
+
+class SeenNotice(BaseModel):
+    posted_date: datetime.date
+    fingerprint: str
+
+
+class IncrementalState(BaseModel):
+    """High-water mark for incremental scrapes, persisted as JSON between runs.
+
+    `seen_notices` only keeps notices posted inside the overlap window below the high-water mark: those are the only
+    ones a later run can see again, so older entries are pruned to keep the state small.
+    """
+
+    high_water_mark: datetime.date | None = None
+    """Latest `postedDate` seen by a completed run."""
+    seen_notices: dict[str, SeenNotice] = Field(default_factory=dict[str, SeenNotice])
+
+    _path: Path | None = PrivateAttr(default=None)
+
+    @classmethod
+    def open(cls, path: Path) -> "IncrementalState":
+        """Load the state at `path`, or start an empty one that will be saved there."""
+        state = cls.model_validate_json(path.read_bytes()) if path.exists() else cls()
+        state._path = path
+        return state
+
+    def save(self) -> None:
+        """Atomically replace the state file; nothing is saved for a state that was not opened from a path."""
+        if self._path is not None:
+            _ = write_atomically(self._path, self.model_dump_json())
+
+
+def _posted_date(opportunity: SamGovOpportunity) -> datetime.date:
+    # `postedDate` is usually a bare date but is occasionally returned with a time component.
+    return datetime.date.fromisoformat(opportunity.postedDate[:10])
+
+
+def _fingerprint(opportunity: SamGovOpportunity) -> str:
+    return hashlib.sha256(opportunity.model_dump_json().encode()).hexdigest()
+
+
+async def iter_new_opportunity_pages(
+    state: IncrementalState,
+    initial_start_date: datetime.datetime,
+    end_date: datetime.datetime | None = None,
+    *,
+    overlap: datetime.timedelta = DEFAULT_OVERLAP,
+    **options: Unpack[ScrapeOptions],
+) -> AsyncGenerator[list[SamGovOpportunity], None]:
+    """Stream only the opportunities that are new or changed since the last completed run, one page at a time.
+
+    Queries from `overlap` before the stored high-water mark (or from `initial_start_date` on the first run) up to
+    `end_date` (default: now). Notices already seen with identical content are dropped. Every yielded notice is recorded
+    in `state.seen_notices` at once, so retrying a failed run with the same state object does not yield it again; the
+    high-water mark is only advanced, and the state saved, once every page has been consumed, so a run that dies midway
+    is simply repeated next time. Accepts the same keyword options as `iter_opportunity_pages` except `response_cache`:
+    the range ends at the current date, so every run of the day sends the same query and a cache would keep serving the
+    first answer to it.
+
+    Args:
+        state: High-water mark state, updated in place
+        initial_start_date: Start of the range when `state` has no high-water mark yet
+        end_date: End of the range; defaults to now
+        overlap: How far before the high-water mark to re-query, to catch late-indexed or amended notices
+
+    Yields:
+        The new or changed opportunities of each page
+    """
+    if options.get("response_cache") is not None:
+        raise ValueError("response caches are not supported for incremental scrapes; they would hide new notices")
+
+    logger = logging.build_logger(name=f"{__name__}.{iter_new_opportunity_pages.__name__}")
+    end_date = end_date if end_date is not None else datetime.datetime.now()
+    start_date = (
+        datetime.datetime.combine(state.high_water_mark - overlap, datetime.time())
+        if state.high_water_mark is not None
+        else initial_start_date
+    )
+    logger.info(
+        "Starting incremental SAM.gov scrape",
+        high_water_mark=state.high_water_mark,
+        start_date=start_date,
+        end_date=end_date,
+        cnt_seen_notices=len(state.seen_notices),
+    )
+
+    seen_notices = state.seen_notices
+    high_water_mark = state.high_water_mark
+    cnt_new = 0
+    cnt_changed = 0
+    cnt_unchanged = 0
+    pages = iter_opportunity_pages(start_date, end_date, **options)
+    async with aclosing(pages):
+        async for page in pages:
+            new_opportunities: list[SamGovOpportunity] = []
+            for opportunity in page:
+                posted_date = _posted_date(opportunity)
+                fingerprint = _fingerprint(opportunity)
+                previous = seen_notices.get(opportunity.noticeId)
+                if previous is not None and previous.fingerprint == fingerprint:
+                    cnt_unchanged += 1
+                    continue
+                if previous is None:
+                    cnt_new += 1
+                else:
+                    cnt_changed += 1
+                seen_notices[opportunity.noticeId] = SeenNotice(posted_date=posted_date, fingerprint=fingerprint)
+                high_water_mark = max(high_water_mark, posted_date) if high_water_mark is not None else posted_date
+                new_opportunities.append(opportunity)
+            yield new_opportunities
+
+    if high_water_mark is not None:
+        state.seen_notices = {
+            notice_id: seen_notice
+            for notice_id, seen_notice in seen_notices.items()
+            if seen_notice.posted_date >= high_water_mark - overlap
+        }
+    state.high_water_mark = high_water_mark
+    state.save()
+    logger.info(
+        "Incremental SAM.gov scrape complete",
+        high_water_mark=high_water_mark,
+        cnt_new=cnt_new,
+        cnt_changed=cnt_changed,
+        cnt_unchanged=cnt_unchanged,
+    )
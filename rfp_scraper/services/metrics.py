@@ -0,0 +1,202 @@
+import bisect
+import math
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from typing import Any, Literal
+
+import httpx
+from pydantic import BaseModel
+
+type Stage = Literal["connect", "request", "decode", "validate", "sink"]
+"""Timed steps of scraping one page.
+
+`connect` is only recorded when a request had to open a new connection (TCP and TLS), so its count is the number of
+connections opened. `request` covers sending the request and reading the whole response. `decode` is JSON parsing and
+`validate` is pydantic validation; the default decoder does both in a single `model_validate_json` pass, which is
+recorded as `validate` alone. `sink` is writing the page to every output.
+"""
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Upper bounds in seconds of the latency histogram buckets; a last, unbounded bucket catches the rest."""
+
+RESERVOIR_SIZE = 1024
+"""Observations per stage sampled for the percentiles."""
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values, e.g. `fraction=0.95` for p95; 0.0 when there are none."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(math.ceil(fraction * len(sorted_values)) - 1, 0)]
+
+
+class StageSummary(BaseModel):
+    count: int
+    total_seconds: float
+    p50_seconds: float
+    p95_seconds: float
+    p99_seconds: float
+    max_seconds: float
+
+
+class MetricsSummary(BaseModel):
+    elapsed_seconds: float
+    cnt_pages: int
+    cnt_records: int
+    """Valid records in the pages received, before de-duplication."""
+    cnt_bytes: int
+    """Response body bytes received."""
+    cnt_rejected_records: int
+    """Invalid records diverted to the quarantine."""
+    cnt_requests_by_status: dict[int, int]
+    """Requests sent over the network, retries included, by response status."""
+    cnt_transport_errors: int
+    """Requests that failed without a response, e.g. on a timeout or a dropped connection."""
+    cnt_retries: int
+    records_per_second: float
+    bytes_per_second: float
+    stages: dict[Stage, StageSummary]
+
+
+class StageStats:
+    """Running statistics of the durations of one stage, in constant memory however long the process runs.
+
+    The count, sum, maximum and histogram bucket counts are exact. Percentiles are taken from a uniform sample of at
+    most `reservoir_size` observations (reservoir sampling), so they are exact up to that many observations and
+    estimates after.
+    """
+
+    def __init__(self, reservoir_size: int = RESERVOIR_SIZE):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        """Observations per `LATENCY_BUCKETS` bucket, not cumulative; the last one is the unbounded bucket."""
+        self.reservoir: list[float] = []
+        self._reservoir_size = reservoir_size
+        self._random = random.Random()
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if len(self.reservoir) < self._reservoir_size:
+            self.reservoir.append(seconds)
+            return
+        index = self._random.randrange(self.count)
+        if index < self._reservoir_size:
+            self.reservoir[index] = seconds
+
+    def summary(self) -> StageSummary:
+        sorted_durations = sorted(self.reservoir)
+        return StageSummary(
+            count=self.count,
+            total_seconds=self.total_seconds,
+            p50_seconds=percentile(sorted_durations, 0.5),
+            p95_seconds=percentile(sorted_durations, 0.95),
+            p99_seconds=percentile(sorted_durations, 0.99),
+            max_seconds=self.max_seconds,
+        )
+
+
+class ScrapeMetrics:
+    """In-process timings and counters of a scrape, readable while it runs and after it ends.
+
+    Durations are aggregated per stage as they are observed (see `StageStats`), so a long-lived process can keep one
+    instance for good. The elapsed time runs from when the object is created, so create it right before the scrape it
+    measures.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.stages: dict[Stage, StageStats] = {}
+        self.cnt_pages = 0
+        self.cnt_records = 0
+        self.cnt_bytes = 0
+        self.cnt_rejected_records = 0
+        self.cnt_requests_by_status: Counter[int] = Counter()
+        self.cnt_transport_errors = 0
+        self.cnt_retries = 0
+
+    def observe(self, stage: Stage, seconds: float) -> None:
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.observe(seconds)
+
+    @contextmanager
+    def span(self, stage: Stage) -> Generator[None]:
+        """Time the body of the `with` block as one `stage` observation, also when it raises."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started_at)
+
+    def record_page(self, cnt_bytes: int, cnt_records: int) -> None:
+        self.cnt_pages += 1
+        self.cnt_bytes += cnt_bytes
+        self.cnt_records += cnt_records
+
+    def connect_tracer(self) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+        """Build an httpx `trace` extension for one request that records the time spent opening a new connection.
+
+        Requests served from a pooled connection (or answered without reaching the network) record nothing.
+        """
+        connect_started_at: float | None = None
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal connect_started_at
+            if event_name == "connection.connect_tcp.started":
+                connect_started_at = time.perf_counter()
+            elif event_name.endswith(".send_request_headers.started") and connect_started_at is not None:
+                self.observe("connect", time.perf_counter() - connect_started_at)
+                connect_started_at = None
+
+        return trace
+
+    def summary(self) -> MetricsSummary:
+        elapsed_seconds = time.perf_counter() - self.started_at
+        stages: dict[Stage, StageSummary] = {stage: stats.summary() for stage, stats in self.stages.items()}
+        return MetricsSummary(
+            elapsed_seconds=elapsed_seconds,
+            cnt_pages=self.cnt_pages,
+            cnt_records=self.cnt_records,
+            cnt_bytes=self.cnt_bytes,
+            cnt_rejected_records=self.cnt_rejected_records,
+            cnt_requests_by_status=dict(self.cnt_requests_by_status),
+            cnt_transport_errors=self.cnt_transport_errors,
+            cnt_retries=self.cnt_retries,
+            records_per_second=self.cnt_records / elapsed_seconds if elapsed_seconds > 0 else 0.0,
+            bytes_per_second=self.cnt_bytes / elapsed_seconds if elapsed_seconds > 0 else 0.0,
+            stages=stages,
+        )
+
+
+class MeteredTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that counts every request it sends in `metrics` by response status.
+
+    Placed at the bottom of a client's transport stack, below retries and rate limiting, it counts what actually
+    reaches the network and so what burns API quota.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: ScrapeMetrics):
+        self._transport = transport
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            self._metrics.cnt_transport_errors += 1
+            raise
+        self._metrics.cnt_requests_by_status[response.status_code] += 1
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,124 @@
+import datetime
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import AsyncExitStack, aclosing
+from functools import partial
+from pathlib import Path
+from typing import Unpack
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from rfp_scraper import logging
+from rfp_scraper.services.http_client import DEFAULT_CLIENT_SETTINGS
+from rfp_scraper.services.retry import DEFAULT_RETRY_POLICY
+from rfp_scraper.services.scrape_sam_gov import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    SamGovOpportunity,
+    ScrapeOptions,
+    build_authenticated_client,
+    iter_opportunity_pages,
+    merge_streams,
+)
+from rfp_scraper.services.search_filters import SearchFilters
+
+DEFAULT_MAX_CONCURRENT_QUERIES = 4
+
+
+class SavedQuery(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    filters: SearchFilters = Field(default_factory=SearchFilters)
+
+
+def load_saved_queries(path: Path) -> list[SavedQuery]:
+    """Read a JSON list of saved queries, e.g. `[{"name": "it-services", "filters": {"naics_code": "541511"}}]`."""
+    return TypeAdapter(list[SavedQuery]).validate_json(path.read_bytes())
+
+
+async def iter_multi_query_pages(
+    queries: Sequence[SavedQuery],
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+    *,
+    matches: dict[str, set[str]] | None = None,
+    max_concurrent_queries: int = DEFAULT_MAX_CONCURRENT_QUERIES,
+    **options: Unpack[ScrapeOptions],
+) -> AsyncGenerator[list[SamGovOpportunity], None]:
+    """Run several saved queries over the same date range and stream their combined results one page at a time.
+
+    Up to `max_concurrent_queries` queries are paged at once through a single client, so they share its connection
+    pool, rate limiter, retry budget and response cache. Notices are de-duplicated on `noticeId` across queries: each
+    is yielded once, by whichever query returns it first. Accepts the same keyword options as `iter_opportunity_pages`
+    except `filters` (given per query) and `checkpoint`.
+
+    Args:
+        queries: Saved queries to run; names must be unique
+        start_date: Start date for the search range
+        end_date: End date for the search range
+        matches: Optional mapping filled in place with the names of every query that matched each `noticeId`,
+            including queries whose copy of the notice was dropped as a duplicate
+        max_concurrent_queries: Maximum number of queries paged at once
+
+    Yields:
+        The not-yet-seen opportunities of each page, from all queries interleaved
+    """
+    query_names = [query.name for query in queries]
+    if len(set(query_names)) != len(query_names):
+        raise ValueError(f"Saved query names must be unique, got {query_names}")
+    if options.get("filters") is not None or options.get("checkpoint") is not None:
+        raise ValueError("filters are given per query and checkpoints are not supported for multi-query scrapes")
+    if max_concurrent_queries < 1:
+        raise ValueError(f"max_concurrent_queries must be at least 1, got {max_concurrent_queries}")
+
+    logger = logging.build_logger(name=f"{__name__}.{iter_multi_query_pages.__name__}")
+    matches = matches if matches is not None else {}
+    logger.info("Starting multi-query SAM.gov scrape", queries=query_names, start_date=start_date, end_date=end_date)
+    async with AsyncExitStack() as stack:
+        client = options.get("client")
+        shared_client = (
+            client
+            if client is not None
+            else await stack.enter_async_context(
+                build_authenticated_client(
+                    rate_limiter=options.get("rate_limiter"),
+                    retry_policy=options.get("retry_policy", DEFAULT_RETRY_POLICY),
+                    response_cache=options.get("response_cache"),
+                    client_settings=options.get("client_settings", DEFAULT_CLIENT_SETTINGS),
+                    metrics=options.get("metrics"),
+                )
+            )
+        )
+
+        async def query_pages(query: SavedQuery) -> AsyncGenerator[tuple[str, list[SamGovOpportunity]], None]:
+            query_options: ScrapeOptions = {**options, "filters": query.filters, "client": shared_client}
+            pages = iter_opportunity_pages(start_date, end_date, **query_options)
+            async with aclosing(pages):
+                async for page in pages:
+                    yield query.name, page
+
+        pages = merge_streams(
+            [partial(query_pages, query) for query in queries],
+            max_concurrent_streams=max_concurrent_queries,
+            buffer_size=options.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS),
+        )
+        seen_notice_ids: set[str] = set()
+        cnt_total_records = 0
+        cnt_duplicate_records = 0
+        async with aclosing(pages):
+            async for query_name, page in pages:
+                new_opportunities: list[SamGovOpportunity] = []
+                for opportunity in page:
+                    matches.setdefault(opportunity.noticeId, set()).add(query_name)
+                    if opportunity.noticeId in seen_notice_ids:
+                        cnt_duplicate_records += 1
+                        continue
+                    seen_notice_ids.add(opportunity.noticeId)
+                    new_opportunities.append(opportunity)
+                cnt_total_records += len(new_opportunities)
+                yield new_opportunities
+
+    logger.info(
+        "Multi-query SAM.gov scrape complete",
+        cnt_total_records=cnt_total_records,
+        cnt_duplicate_records=cnt_duplicate_records,
+    )
@@ -0,0 +1,201 @@
+# pyarrow ships without type information, so strict unknown-type checks are relaxed for this module only.
+# pyright: reportMissingTypeStubs=false, reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportUnknownParameterType=false
+
+"""Columnar export of scraped opportunities to hive-partitioned Parquet.
+
+Needs the optional `pyarrow` dependency: `uv sync --extra parquet` (or `pip install rfp-scraper[parquet]`). Import this
+module lazily from code paths that do not always need it.
+"""
+
+import json
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:
+    raise ImportError("Parquet export needs pyarrow: install rfp-scraper with the `parquet` extra") from e
+
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity
+
+DEFAULT_ROW_GROUP_SIZE = 10_000
+PARTITION_COLUMN = "posted_month"
+
+_LOCATION = pa.struct(
+    [
+        ("city", pa.struct([("name", pa.string())])),
+        ("state", pa.struct([("name", pa.string())])),
+        ("zip", pa.string()),
+        ("country", pa.struct([("code", pa.string()), ("name", pa.string())])),
+    ]
+)
+
+# Nested models are kept as struct columns so they can still be projected field by field. `placeOfPerformance` and
+# `resourceLinks` are untyped upstream and are stored as JSON strings.
+OPPORTUNITY_SCHEMA = pa.schema(
+    [
+        ("noticeId", pa.string()),
+        ("title", pa.string()),
+        ("solicitationNumber", pa.string()),
+        ("fullParentPathName", pa.string()),
+        ("fullParentPathCode", pa.string()),
+        ("postedDate", pa.string()),
+        ("type", pa.string()),
+        ("baseType", pa.string()),
+        ("archiveType", pa.string()),
+        ("archiveDate", pa.string()),
+        ("typeOfSetAsideDescription", pa.string()),
+        ("typeOfSetAside", pa.string()),
+        ("responseDeadLine", pa.string()),
+        ("naicsCode", pa.string()),
+        ("naicsCodes", pa.list_(pa.string())),
+        ("classificationCode", pa.string()),
+        ("active", pa.string()),
+        (
+            "award",
+            pa.struct(
+                [
+                    ("date", pa.string()),
+                    ("number", pa.string()),
+                    ("amount", pa.string()),
+                    (
+                        "awardee",
+                        pa.struct(
+                            [
+                                ("name", pa.string()),
+                                ("location", _LOCATION),
+                                ("ueiSAM", pa.string()),
+                                ("cageCode", pa.string()),
+                            ]
+                        ),
+                    ),
+                ]
+            ),
+        ),
+        (
+            "pointOfContact",
+            pa.list_(
+                pa.struct(
+                    [
+                        ("fax", pa.string()),
+                        ("type", pa.string()),
+                        ("email", pa.string()),
+                        ("phone", pa.string()),
+                        ("title", pa.string()),
+                        ("fullName", pa.string()),
+                    ]
+                )
+            ),
+        ),
+        ("description", pa.string()),
+        ("organizationType", pa.string()),
+        (
+            "officeAddress",
+            pa.struct(
+                [
+                    ("zipcode", pa.string()),
+                    ("city", pa.string()),
+                    ("countryCode", pa.string()),
+                    ("state", pa.string()),
+                ]
+            ),
+        ),
+        ("placeOfPerformance", pa.string()),
+        ("additionalInfoLink", pa.string()),
+        ("uiLink", pa.string()),
+        ("links", pa.list_(pa.struct([("rel", pa.string()), ("href", pa.string())]))),
+        ("resourceLinks", pa.string()),
+    ]
+)
+
+
+def _to_row(opportunity: SamGovOpportunity) -> dict[str, Any]:
+    row = opportunity.model_dump()
+    for json_column in ("placeOfPerformance", "resourceLinks"):
+        if row.get(json_column) is not None:
+            row[json_column] = json.dumps(row[json_column])
+    return row
+
+
+def _posted_month(opportunity: SamGovOpportunity) -> str:
+    return opportunity.postedDate[:7]
+
+
+def to_record_batch(opportunities: Sequence[SamGovOpportunity]) -> pa.RecordBatch:
+    """Convert opportunities into an Arrow record batch with `OPPORTUNITY_SCHEMA`."""
+    return pa.RecordBatch.from_pylist(
+        [_to_row(opportunity) for opportunity in opportunities], schema=OPPORTUNITY_SCHEMA
+    )
+
+
+class ParquetSink:
+    """Streams opportunities into Parquet files under `root`, partitioned hive-style by posted month.
+
+    Files land in `root/posted_month=YYYY-MM/part-<uuid>.parquet`, so `pyarrow.dataset.dataset(root,
+    partitioning="hive")` (or DuckDB, Polars, Spark) can prune whole months from a filter on `posted_month`. Each sink
+    writes new part files and never touches existing ones, so repeated runs accumulate into the same dataset.
+
+    Rows are buffered per partition and written in row groups of up to `row_group_size`. The buffers of all partitions
+    together never hold more than `row_group_size` rows: once they do, the largest partition is written out, so memory
+    stays bounded however many months a scrape spans. Files only become readable once `close` writes their footers, so
+    unlike `JsonlSink` this sink cannot be resumed from a checkpoint.
+    """
+
+    def __init__(self, root: Path, row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        self.root = root
+        self.row_group_size = row_group_size
+        self._part_name = f"part-{uuid.uuid4().hex}.parquet"
+        self._writers: dict[str, pq.ParquetWriter] = {}
+        self._buffers: dict[str, list[pa.RecordBatch]] = {}
+        self._cnt_buffered_rows = 0
+
+    def _flush(self, partition: str) -> None:
+        batches = self._buffers.pop(partition, [])
+        if not batches:
+            return
+        self._cnt_buffered_rows -= sum(batch.num_rows for batch in batches)
+        writer = self._writers.get(partition)
+        if writer is None:
+            partition_dir = self.root / f"{PARTITION_COLUMN}={partition}"
+            partition_dir.mkdir(parents=True, exist_ok=True)
+            writer = self._writers[partition] = pq.ParquetWriter(partition_dir / self._part_name, OPPORTUNITY_SCHEMA)
+        writer.write_table(
+            pa.Table.from_batches(batches, schema=OPPORTUNITY_SCHEMA), row_group_size=self.row_group_size
+        )
+
+    def write_page(self, opportunities: Sequence[SamGovOpportunity]) -> None:
+        by_partition: dict[str, list[SamGovOpportunity]] = {}
+        for opportunity in opportunities:
+            by_partition.setdefault(_posted_month(opportunity), []).append(opportunity)
+
+        # Pages are converted to Arrow as they arrive, so only columnar data is buffered until a row group fills.
+        for partition, partition_opportunities in by_partition.items():
+            self._buffers.setdefault(partition, []).append(to_record_batch(partition_opportunities))
+            self._cnt_buffered_rows += len(partition_opportunities)
+        while self._cnt_buffered_rows >= self.row_group_size:
+            self._flush(
+                max(self._buffers, key=lambda partition: sum(batch.num_rows for batch in self._buffers[partition]))
+            )
+
+    def close(self) -> None:
+        for partition in list(self._buffers):
+            self._flush(partition)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,75 @@
+from collections.abc import Iterator
+from wsgiref.simple_server import WSGIServer
+
+from prometheus_client import start_http_server
+from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily, Metric
+from prometheus_client.registry import Collector, CollectorRegistry
+
+from rfp_scraper.services.metrics import LATENCY_BUCKETS, ScrapeMetrics
+
+
+def _cumulative_buckets(bucket_counts: list[int]) -> list[tuple[str, float]]:
+    bounds = [str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+    buckets: list[tuple[str, float]] = []
+    cnt_observations = 0
+    for bound, count in zip(bounds, bucket_counts, strict=True):
+        cnt_observations += count
+        buckets.append((bound, cnt_observations))
+    return buckets
+
+
+class ScrapeMetricsCollector(Collector):
+    """Exposes a `ScrapeMetrics` in the Prometheus format, reading its current values on every scrape of `/metrics`.
+
+    Reading happens on the exporter's thread while the scrape keeps updating the metrics on the event loop, so only
+    copies of its containers are iterated. Every read costs the same however many pages were scraped.
+    """
+
+    def __init__(self, metrics: ScrapeMetrics):
+        self._metrics = metrics
+
+    def collect(self) -> Iterator[Metric]:
+        metrics = self._metrics
+        requests = CounterMetricFamily(
+            "rfp_sam_gov_requests", "Requests sent to SAM.gov over the network, retries included.", labels=["status"]
+        )
+        for status_code, count in metrics.cnt_requests_by_status.copy().items():
+            requests.add_metric([str(status_code)], count)
+        yield requests
+        yield CounterMetricFamily(
+            "rfp_sam_gov_transport_errors",
+            "Requests to SAM.gov that failed without a response.",
+            value=metrics.cnt_transport_errors,
+        )
+        yield CounterMetricFamily("rfp_sam_gov_retries", "Retried SAM.gov requests.", value=metrics.cnt_retries)
+        yield CounterMetricFamily(
+            "rfp_sam_gov_received_bytes", "Search response body bytes received.", value=metrics.cnt_bytes
+        )
+        yield CounterMetricFamily("rfp_sam_gov_pages", "Search pages decoded.", value=metrics.cnt_pages)
+        yield CounterMetricFamily(
+            "rfp_sam_gov_records_validated", "Opportunity records that passed validation.", value=metrics.cnt_records
+        )
+        yield CounterMetricFamily(
+            "rfp_sam_gov_records_rejected",
+            "Opportunity records that failed validation and were quarantined.",
+            value=metrics.cnt_rejected_records,
+        )
+
+        latency = HistogramMetricFamily(
+            "rfp_sam_gov_page_stage_seconds", "Time spent on each stage of a search page.", labels=["stage"]
+        )
+        for stage, stats in metrics.stages.copy().items():
+            latency.add_metric([stage], _cumulative_buckets(list(stats.bucket_counts)), sum_value=stats.total_seconds)
+        yield latency
+
+
+def start_metrics_server(metrics: ScrapeMetrics, port: int, addr: str = "127.0.0.1") -> WSGIServer:
+    """Serve `metrics` at `http://<addr>:<port>/metrics` from a background thread.
+
+    The thread is a daemon, so it never keeps the process alive; call `shutdown()` on the returned server to stop it
+    earlier. Pass `port=0` to pick a free port, then read it from `server.server_port`.
+    """
+    registry = CollectorRegistry()
+    registry.register(ScrapeMetricsCollector(metrics))
+    server, _ = start_http_server(port, addr, registry=registry)
+    return server
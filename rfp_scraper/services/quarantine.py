@@ -0,0 +1,68 @@
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Self, cast
+
+from pydantic import BaseModel, ValidationError
+
+from rfp_scraper import logging
+
+
+class QuarantinedRecord(BaseModel):
+    offset: int
+    """Offset of the search page the record came from."""
+    notice_id: str | None
+    errors: list[dict[str, Any]]
+    record: Any
+    """The record exactly as SAM.gov returned it."""
+
+
+class RecordQuarantine:
+    """Append-only JSON Lines file of search records that failed validation, one `QuarantinedRecord` per line.
+
+    The file is only created once the first record is quarantined.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.cnt_quarantined = 0
+        self._file: IO[str] | None = None
+        self._logger = logging.build_logger(name=f"{__name__}.{RecordQuarantine.__name__}")
+
+    def add(self, offset: int, record: Any, error: ValidationError) -> None:
+        notice_id = cast(dict[str, Any], record).get("noticeId") if isinstance(record, dict) else None
+        quarantined = QuarantinedRecord(
+            offset=offset,
+            notice_id=notice_id if isinstance(notice_id, str) else None,
+            errors=[
+                dict(details) for details in error.errors(include_url=False, include_context=False, include_input=False)
+            ],
+            record=record,
+        )
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+        _ = self._file.write(quarantined.model_dump_json() + "\n")
+        self._file.flush()
+        self.cnt_quarantined += 1
+        self._logger.warning(
+            "Quarantined invalid SAM.gov record",
+            offset=offset,
+            notice_id=quarantined.notice_id,
+            cnt_errors=error.error_count(),
+        )
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import httpx
+
+
+class TokenBucketRateLimiter:
+    """Async token bucket: allows bursts of up to `burst` requests, refilled at `requests_per_second`.
+
+    One limiter is meant to be shared by every request made with a given API key, so concurrent pages, shards and
+    stages all draw from the same quota. Waiters are served in arrival order.
+    """
+
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        if requests_per_second <= 0:
+            raise ValueError(f"requests_per_second must be positive, got {requests_per_second}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.requests_per_second)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # Holding the lock while sleeping queues later callers behind the current one instead of letting them race
+        # for the next token.
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.requests_per_second)
+                self._refill()
+            self._tokens -= 1
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that takes a token from `rate_limiter` before every request it sends."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, rate_limiter: TokenBucketRateLimiter):
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._rate_limiter.acquire()
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,154 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import httpx
+from pydantic import BaseModel
+
+from rfp_scraper import logging
+from rfp_scraper.services.files import write_atomically
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Query parameters that authenticate rather than select data; they never take part in the cache key.
+_EXCLUDED_PARAMS = frozenset({"api_key"})
+# Only headers that still describe the stored (already decoded) body are kept.
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+class _CacheEntry(BaseModel):
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    stored_at: float
+
+
+def cache_key(request: httpx.Request) -> str:
+    """Canonical cache key: method, URL without query, and the sorted query parameters minus `api_key`."""
+    params = sorted((key, value) for key, value in request.url.params.multi_items() if key not in _EXCLUDED_PARAMS)
+    canonical = f"{request.method} {request.url.copy_with(query=None)}?{urlencode(params)}"
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResponseCache:
+    """On-disk cache of successful GET responses with a TTL and a size-bounded LRU eviction policy.
+
+    Each entry is a `<key>.json` metadata file next to a `<key>.body` file. Reads touch the metadata file, so file
+    modification times double as the LRU order and survive restarts.
+    """
+
+    def __init__(self, directory: Path, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Upper bound on the cache size (overwrites are counted twice) so a full directory scan is only needed once the
+        # cache may actually be over budget.
+        self._approx_bytes: int | None = None
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def load(self, key: str) -> tuple[_CacheEntry, bytes] | None:
+        meta_path, body_path = self._paths(key)
+        try:
+            entry = _CacheEntry.model_validate_json(meta_path.read_bytes())
+            body = body_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(meta_path)
+        return entry, body
+
+    def is_fresh(self, entry: _CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl_seconds
+
+    def store(self, key: str, entry: _CacheEntry, body: bytes | None = None) -> None:
+        """Write an entry (and its body, unless only the metadata is being refreshed), then evict down to size."""
+        meta_path, body_path = self._paths(key)
+        written_bytes = write_atomically(body_path, body) if body is not None else 0
+        written_bytes += write_atomically(meta_path, entry.model_dump_json())
+
+        if self._approx_bytes is not None:
+            self._approx_bytes += written_bytes
+        if self._approx_bytes is None or self._approx_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits in `max_bytes`."""
+        entries: list[tuple[float, int, Path, Path]] = []
+        total_bytes = 0
+        for meta_path in self.directory.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                size = meta_path.stat().st_size + body_path.stat().st_size
+                entries.append((meta_path.stat().st_mtime, size, meta_path, body_path))
+            except FileNotFoundError:
+                continue
+            total_bytes += size
+
+        for _, size, meta_path, body_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            total_bytes -= size
+        self._approx_bytes = total_bytes
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that serves GET requests from a `ResponseCache`.
+
+    Fresh entries are returned without touching the network. Stale entries that carried an `ETag` or `Last-Modified`
+    header are revalidated with a conditional request, and a `304 Not Modified` answer renews them in place. Only `200`
+    responses are stored.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache):
+        self._transport = transport
+        self.cache = cache
+        self._logger = logging.build_logger(name=f"{__name__}.{CachingTransport.__name__}")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        key = cache_key(request)
+        cached = self.cache.load(key)
+        if cached is not None:
+            entry, body = cached
+            if self.cache.is_fresh(entry):
+                self._logger.debug("Response cache hit", url=entry.url)
+                return httpx.Response(entry.status_code, headers=entry.headers, content=body, request=request)
+            if "etag" in entry.headers:
+                request.headers["If-None-Match"] = entry.headers["etag"]
+            if "last-modified" in entry.headers:
+                request.headers["If-Modified-Since"] = entry.headers["last-modified"]
+
+        response = await self._transport.handle_async_request(request)
+
+        if cached is not None and response.status_code == 304:
+            entry, body = cached
+            await response.aclose()
+            self.cache.store(key, entry.model_copy(update={"stored_at": time.time()}))
+            self._logger.debug("Response cache revalidated", url=entry.url)
+            return httpx.Response(entry.status_code, headers=entry.headers, content=body, request=request)
+
+        if response.status_code != 200:
+            return response
+
+        body = await response.aread()
+        headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        entry = _CacheEntry(
+            url=str(request.url.copy_remove_param("api_key")),
+            status_code=response.status_code,
+            headers=headers,
+            stored_at=time.time(),
+        )
+        self.cache.store(key, entry, body)
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,110 @@
+import asyncio
+import datetime
+import email.utils
+import random
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from rfp_scraper import logging
+from rfp_scraper.services.metrics import ScrapeMetrics
+
+
+class RetryPolicy(BaseModel):
+    """How `RetryTransport` retries failed requests.
+
+    Delays use "full jitter" exponential backoff: a random duration between zero and
+    `min(backoff_max_seconds, backoff_base_seconds * 2**attempt)`, unless the response carries a `Retry-After` header,
+    which wins (capped at `backoff_max_seconds`).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_retries: int = Field(default=5, ge=0)
+    """Retries per request, on top of the first attempt."""
+    retry_budget: int | None = Field(default=None, ge=0)
+    """Total retries allowed across every request sent through one client; `None` means unlimited."""
+    backoff_base_seconds: float = Field(default=0.5, gt=0)
+    backoff_max_seconds: float = Field(default=60.0, gt=0)
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given either as delay-seconds or as an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.datetime.now(tz=datetime.UTC)).total_seconds(), 0.0)
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that retries retryable status codes and transport errors according to a `RetryPolicy`.
+
+    The retry budget is tracked per transport, so it is shared by every request made with the client it belongs to.
+    Retries are also counted in `metrics` when given.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        metrics: ScrapeMetrics | None = None,
+    ):
+        self._transport = transport
+        self.policy = policy
+        self.cnt_retries = 0
+        self._metrics = metrics
+        self._logger = logging.build_logger(name=f"{__name__}.{RetryTransport.__name__}")
+
+    def _can_retry(self, attempt: int) -> bool:
+        if attempt >= self.policy.max_retries:
+            return False
+        return self.policy.retry_budget is None or self.cnt_retries < self.policy.retry_budget
+
+    def _backoff_delay(self, attempt: int, retry_after: float | None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.policy.backoff_max_seconds)
+        return random.uniform(0, min(self.policy.backoff_max_seconds, self.policy.backoff_base_seconds * 2**attempt))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                if not self._can_retry(attempt):
+                    raise
+                delay = self._backoff_delay(attempt, retry_after=None)
+                reason = repr(e)
+            else:
+                if response.status_code not in self.policy.retry_statuses or not self._can_retry(attempt):
+                    return response
+                delay = self._backoff_delay(attempt, _parse_retry_after(response.headers.get("Retry-After")))
+                reason = str(response.status_code)
+                await response.aclose()
+
+            attempt += 1
+            self.cnt_retries += 1
+            if self._metrics is not None:
+                self._metrics.cnt_retries += 1
+            self._logger.warning(
+                "SAM.gov request retry",
+                url=str(request.url.copy_remove_param("api_key")),
+                attempt=attempt,
+                reason=reason,
+                delay_seconds=round(delay, 3),
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
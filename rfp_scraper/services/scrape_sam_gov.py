@@ -1,25 +1,64 @@
+import asyncio
 import datetime
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-from typing import Any
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Collection, Sequence
+from contextlib import AsyncExitStack, aclosing, asynccontextmanager
+from functools import cache, partial
+from itertools import islice
+from typing import Any, Literal, TypedDict, Unpack
 
 import httpx
-from pydantic import BaseModel, Field, ValidationError
+import pydantic_core
+import structlog
+from pydantic import BaseModel, Field, ValidationError, create_model
 
 from rfp_scraper import logging, secrets
+from rfp_scraper.services.checkpoint import ScrapeCheckpoint, ShardProgress
+from rfp_scraper.services.http_client import DEFAULT_CLIENT_SETTINGS, ClientSettings, build_transport
+from rfp_scraper.services.metrics import MeteredTransport, ScrapeMetrics
+from rfp_scraper.services.quarantine import RecordQuarantine
+from rfp_scraper.services.rate_limit import RateLimitedTransport, TokenBucketRateLimiter
+from rfp_scraper.services.response_cache import CachingTransport, ResponseCache
+from rfp_scraper.services.retry import DEFAULT_RETRY_POLICY, RetryPolicy, RetryTransport
+from rfp_scraper.services.search_filters import SearchFilters
 
 
 @asynccontextmanager
-async def _build_authenticated_client() -> AsyncGenerator[httpx.AsyncClient, None]:
-    """Create an authenticated HTTP client for SAM.gov API with default query parameters."""
+async def build_authenticated_client(
+    rate_limiter: TokenBucketRateLimiter | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    response_cache: ResponseCache | None = None,
+    client_settings: ClientSettings = DEFAULT_CLIENT_SETTINGS,
+    metrics: ScrapeMetrics | None = None,
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create an authenticated HTTP client for SAM.gov API with default query parameters.
+
+    Failed requests are retried according to `retry_policy`. When `rate_limiter` is given, every attempt (including
+    retries) first takes a token from it. When `response_cache` is given, cached responses are served before any of
+    that happens, so cache hits cost neither quota nor retries. Connection pooling, timeouts and HTTP/2 follow
+    `client_settings`; the client is meant to be long-lived and shared by every stage that talks to the API. With
+    `metrics`, every request that reaches the network and every retry is counted in it.
+    """
     params = {
         "api_key": secrets.SAM_GOV_API_KEY,
     }
 
+    transport: httpx.AsyncBaseTransport = build_transport(client_settings)
+    if metrics is not None:
+        transport = MeteredTransport(transport, metrics)
+    if rate_limiter is not None:
+        transport = RateLimitedTransport(transport, rate_limiter)
+    transport = RetryTransport(transport, retry_policy, metrics)
+    if response_cache is not None:
+        transport = CachingTransport(transport, response_cache)
+
     # Create client with base URL and default params
     client = httpx.AsyncClient(
         base_url="https://api.sam.gov/opportunities",
         params=params,
+        transport=transport,
+        timeout=client_settings.timeout(),
     )
 
     try:
@@ -113,6 +152,15 @@ class SamGovOpportunity(BaseModel):
     resourceLinks: Any | None = None
 
 
+class SamGovApiError(Exception):
+    """Raised when SAM.gov answers with a non-success status after any retries."""
+
+    def __init__(self, status_code: int, body: str):
+        super().__init__(f"Failed to scrape SAM.gov: {status_code} {body}")
+        self.status_code = status_code
+        self.body = body
+
+
 class SamGovSearchResponse(BaseModel):
     totalRecords: int
     limit: int
@@ -121,68 +169,567 @@ class SamGovSearchResponse(BaseModel):
     links: list[Link]
 
 
-async def run_scraping(start_date: datetime.datetime, end_date: datetime.datetime) -> list[SamGovOpportunity]:
-    """Fetch opportunities data from SAM.gov API.
+class _LenientSearchResponse(BaseModel):
+    """Search response envelope whose records are left unvalidated, so they can be checked one by one."""
 
-    Args:
-        start_date: Start date for the search range
-        end_date: End date for the search range
+    totalRecords: int
+    limit: int
+    offset: int
+    opportunitiesData: list[Any]
+    links: list[Link]
+
+
+API_MAX_LIMIT = 1000
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_MAX_CONCURRENT_SHARDS = 4
 
-    Returns:
-        List of opportunity data dictionaries
-    """
-    logger = logging.build_logger(name=f"{__name__}.{run_scraping.__name__}")
-    logger.info("Starting to scrape SAM.gov opportunities", start_date=start_date, end_date=end_date)
-    async with _build_authenticated_client() as client:
-        all_opportunities: list[SamGovOpportunity] = []
-        api_max_limit = 1000
-        search_params = {
-            "limit": str(api_max_limit),
-            "postedFrom": start_date.strftime(format="%m/%d/%Y"),
-            "postedTo": end_date.strftime(format="%m/%d/%Y"),
-        }
-        # breakpoint()
-        response = await client.get(url="/v2/search", params=search_params)
 
-        logger.info("SAM.gov search response", status=response.status_code)
+JsonBackend = Literal["pydantic", "orjson"]
+type PageDecoder[R] = Callable[[bytes], tuple[int, list[R]]]
+"""Decodes a raw `/v2/search` response body into its `totalRecords` and its records."""
+type RecordDecoder[R] = Callable[
+    [bytes, JsonBackend, RecordQuarantine | None, frozenset[str] | None, ScrapeMetrics], tuple[int, list[R]]
+]
+"""A `PageDecoder` that also gets the scrape's `json_backend`, `quarantine`, projected `fields` and `metrics`."""
 
-        if not response.is_success:
-            raise Exception(f"Failed to scrape SAM.gov: {response.status_code} {response.text}")
 
-        initial_response_json = response.json()
+def load_json(content: bytes, json_backend: JsonBackend = "pydantic") -> Any:
+    """Parse JSON without validating it, with pydantic-core's parser or with orjson."""
+    if json_backend == "orjson":
         try:
-            initial_response_data = SamGovSearchResponse.model_validate(initial_response_json)
-        except ValidationError as e:
-            logger.error("Validation errors", errors=e.errors(), response_json=initial_response_json)
-            raise e
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "The orjson JSON backend needs orjson: install rfp-scraper with the `orjson` extra"
+            ) from e
+        return orjson.loads(content)
+    return pydantic_core.from_json(content)
+
+
+ALWAYS_PROJECTED_FIELDS = frozenset({"noticeId", "postedDate"})
+"""Fields every projection keeps, since de-duplication, incremental state and the sinks rely on them."""
+
+
+@cache
+def projected_opportunity_model(fields: frozenset[str]) -> type[SamGovOpportunity]:
+    """Subclass of `SamGovOpportunity` that only decodes and validates `fields` (and `ALWAYS_PROJECTED_FIELDS`).
+
+    Every other field is always None and left out of serialized output. Their validation alias is a key SAM.gov never
+    sends, so their input is skipped like any unknown key instead of being converted and validated.
+    """
+    unknown_fields = fields - SamGovOpportunity.model_fields.keys()
+    if unknown_fields:
+        raise ValueError(f"Unknown SamGovOpportunity fields: {', '.join(sorted(unknown_fields))}")
+    dropped_fields = SamGovOpportunity.model_fields.keys() - fields - ALWAYS_PROJECTED_FIELDS
+    field_definitions: dict[str, Any] = {
+        name: (None, Field(default=None, validation_alias=f"\0{name}", exclude=True)) for name in sorted(dropped_fields)
+    }
+    return create_model("ProjectedSamGovOpportunity", __base__=SamGovOpportunity, **field_definitions)
+
+
+@cache
+def _projected_search_response_model(fields: frozenset[str]) -> type[SamGovSearchResponse]:
+    opportunity_model = projected_opportunity_model(fields)
+    return create_model(
+        "ProjectedSamGovSearchResponse",
+        __base__=SamGovSearchResponse,
+        opportunitiesData=(list[opportunity_model], ...),  # pyright: ignore[reportInvalidTypeForm]
+    )
+
+
+def decode_search_page(
+    content: bytes,
+    json_backend: JsonBackend = "pydantic",
+    quarantine: RecordQuarantine | None = None,
+    fields: frozenset[str] | None = None,
+    metrics: ScrapeMetrics | None = None,
+) -> SamGovSearchResponse:
+    """Decode and validate a raw `/v2/search` response body.
+
+    The default `pydantic` backend validates straight from the bytes with `model_validate_json`, skipping the
+    intermediate `dict` tree that `json.loads` + `model_validate` would build. The `orjson` backend parses with orjson
+    first, which can win on very large pages when orjson is installed.
+
+    Without `quarantine`, one invalid record fails the whole page. With it, records are validated one by one and the
+    invalid ones are written to the quarantine and left out of the returned page; only a malformed envelope still
+    raises.
+
+    With `fields`, only those fields are validated and kept; see `projected_opportunity_model`.
+
+    With `metrics`, the time spent decoding and validating is recorded in it.
+    """
+    metrics = metrics if metrics is not None else ScrapeMetrics()
+    opportunity_model = projected_opportunity_model(fields) if fields is not None else SamGovOpportunity
+    if quarantine is None:
+        response_model = _projected_search_response_model(fields) if fields is not None else SamGovSearchResponse
+        if json_backend == "orjson":
+            with metrics.span("decode"):
+                data = load_json(content, json_backend)
+            with metrics.span("validate"):
+                return response_model.model_validate(data)
+        with metrics.span("validate"):
+            return response_model.model_validate_json(content)
+
+    # The lenient envelope leaves the records unvalidated, so building it is all decoding.
+    with metrics.span("decode"):
+        if json_backend == "orjson":
+            envelope = _LenientSearchResponse.model_validate(load_json(content, json_backend))
+        else:
+            envelope = _LenientSearchResponse.model_validate_json(content)
+    opportunities: list[SamGovOpportunity] = []
+    with metrics.span("validate"):
+        for record in envelope.opportunitiesData:
+            try:
+                opportunities.append(opportunity_model.model_validate(record))
+            except ValidationError as e:
+                quarantine.add(envelope.offset, record, e)
+                metrics.cnt_rejected_records += 1
+    # Everything is validated by now, so the page is assembled without validating it again.
+    return SamGovSearchResponse.model_construct(
+        totalRecords=envelope.totalRecords,
+        limit=envelope.limit,
+        offset=envelope.offset,
+        opportunitiesData=opportunities,
+        links=envelope.links,
+    )
 
-        num_additional_pages = initial_response_data.totalRecords // api_max_limit
-        all_opportunities.extend(initial_response_data.opportunitiesData)
 
+async def _fetch_search_page[R](
+    client: httpx.AsyncClient,
+    search_params: dict[str, str | list[str]],
+    offset: int,
+    semaphore: asyncio.Semaphore,
+    decode_page: PageDecoder[R],
+    metrics: ScrapeMetrics,
+    logger: structlog.stdlib.BoundLogger,
+) -> tuple[int, list[R]]:
+    """Fetch and decode a single `/v2/search` page, holding a slot of `semaphore` while the request is in flight."""
+    async with semaphore:
+        started_at = time.perf_counter()
+        response = await client.get(
+            url="/v2/search",
+            params={
+                **search_params,
+                "offset": str(offset),
+            },
+            extensions={"trace": metrics.connect_tracer()},
+        )
+        request_seconds = time.perf_counter() - started_at
+    metrics.observe("request", request_seconds)
+
+    logger.info(
+        "SAM.gov search response",
+        status=response.status_code,
+        offset=offset,
+        request_ms=round(request_seconds * 1000, 1),
+        cnt_bytes=len(response.content),
+    )
+
+    if not response.is_success:
+        raise SamGovApiError(response.status_code, response.text)
+
+    try:
+        total_records, records = decode_page(response.content)
+    except ValidationError as e:
+        logger.error("Validation errors", errors=e.errors(), response_text=response.text)
+        raise e
+    metrics.record_page(len(response.content), len(records))
+    return total_records, records
+
+
+async def _iter_search_pages[R](
+    client: httpx.AsyncClient,
+    search_params: dict[str, str | list[str]],
+    semaphore: asyncio.Semaphore,
+    max_concurrent_requests: int,
+    progress: ShardProgress,
+    decode_page: PageDecoder[R],
+    metrics: ScrapeMetrics,
+    logger: structlog.stdlib.BoundLogger,
+) -> AsyncGenerator[tuple[int, list[R]], None]:
+    """Yield `(offset, records)` for every `/v2/search` page of `search_params` not yet in `progress`, in offset order.
+
+    The first page is fetched on its own to learn `totalRecords` (unless `progress` already has it from a checkpoint).
+    The remaining offsets are fetched through a sliding window of at most `max_concurrent_requests` tasks, so no more
+    than that many pages are ever in flight or buffered waiting for the consumer.
+    """
+    if progress.total_records is None or 0 not in progress.completed_offsets:
+        progress.total_records, initial_records = await _fetch_search_page(
+            client, search_params, 0, semaphore, decode_page, metrics, logger
+        )
+    else:
+        initial_records = None
+
+    # Offsets beyond the first page; stopping short of `totalRecords` so an exact multiple of the limit does not
+    # request an empty page.
+    next_page_offsets = [
+        offset
+        for offset in range(API_MAX_LIMIT, progress.total_records, API_MAX_LIMIT)
+        if offset not in progress.completed_offsets
+    ]
+    num_additional_pages = max(progress.total_records - 1, 0) // API_MAX_LIMIT
+    logger.info(
+        "SAM.gov search pagination determination",
+        num_additional_pages=num_additional_pages,
+        num_remaining_pages=len(next_page_offsets),
+        api_max_limit=API_MAX_LIMIT,
+        cnt_records=progress.total_records,
+        max_concurrent_requests=max_concurrent_requests,
+    )
+    if initial_records is not None:
+        yield 0, initial_records
+
+    def schedule_next_page(next_page_offset: int) -> asyncio.Task[tuple[int, list[R]]]:
         logger.info(
-            "SAM.gov search pagination determination",
+            "SAM.gov search pagination",
+            offset_index=next_page_offset // API_MAX_LIMIT,
             num_additional_pages=num_additional_pages,
-            api_max_limit=api_max_limit,
-            cnt_records=initial_response_data.totalRecords,
+            next_page_offset=next_page_offset,
+        )
+        return asyncio.create_task(
+            _fetch_search_page(client, search_params, next_page_offset, semaphore, decode_page, metrics, logger)
         )
 
-        for offset_index in range(1, num_additional_pages + 1):
-            next_page_offset = offset_index * api_max_limit
-            logger.info(
-                "SAM.gov search pagination",
-                offset_index=offset_index,
-                num_additional_pages=num_additional_pages,
-                next_page_offset=next_page_offset,
+    offsets = iter(next_page_offsets)
+    pending: deque[tuple[int, asyncio.Task[tuple[int, list[R]]]]] = deque(
+        (offset, schedule_next_page(offset)) for offset in islice(offsets, max_concurrent_requests)
+    )
+    try:
+        while pending:
+            # Awaiting the oldest task keeps pages in offset order while later ones are still downloading.
+            next_page_offset, next_page_task = pending.popleft()
+            _, next_page_records = await next_page_task
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append((offset, schedule_next_page(offset)))
+            yield next_page_offset, next_page_records
+    finally:
+        for _, task in pending:
+            _ = task.cancel()
+        _ = await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+
+def _build_date_shards(
+    start_date: datetime.date, end_date: datetime.date, shard_size: datetime.timedelta | None
+) -> list[tuple[datetime.date, datetime.date]]:
+    """Split the inclusive `start_date`..`end_date` range into consecutive, non-overlapping shards of `shard_size`."""
+    if shard_size is None:
+        return [(start_date, end_date)]
+    if shard_size < datetime.timedelta(days=1):
+        raise ValueError(f"shard_size must be at least one day, got {shard_size}")
+
+    # `postedFrom`/`postedTo` are inclusive and day-granular, so a shard covers `shard_size.days` calendar days.
+    shard_days = datetime.timedelta(days=shard_size.days)
+    shards: list[tuple[datetime.date, datetime.date]] = []
+    shard_start = start_date
+    while shard_start <= end_date:
+        shard_end = min(shard_start + shard_days - datetime.timedelta(days=1), end_date)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end + datetime.timedelta(days=1)
+    return shards
+
+
+async def merge_streams[T](
+    stream_factories: Sequence[Callable[[], AsyncGenerator[T, None]]],
+    max_concurrent_streams: int,
+    buffer_size: int,
+) -> AsyncGenerator[T, None]:
+    """Drain up to `max_concurrent_streams` generators at once and yield their items as they arrive.
+
+    Items from one stream keep their relative order; items from different streams interleave. At most `buffer_size`
+    items wait for the consumer at any time. The first failure in any stream cancels the rest and is re-raised.
+    """
+    queue: asyncio.Queue[tuple[T] | None] = asyncio.Queue()
+    buffer_slots = asyncio.Semaphore(buffer_size)
+    stream_slots = asyncio.Semaphore(max_concurrent_streams)
+
+    async def drain(stream_factory: Callable[[], AsyncGenerator[T, None]]) -> None:
+        async with stream_slots:
+            stream = stream_factory()
+            async with aclosing(stream):
+                async for item in stream:
+                    _ = await buffer_slots.acquire()
+                    queue.put_nowait((item,))
+
+    async def produce() -> None:
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for stream_factory in stream_factories:
+                    _ = task_group.create_task(drain(stream_factory))
+        except BaseExceptionGroup as e:
+            raise e.exceptions[0] from None
+        finally:
+            queue.put_nowait(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (entry := await queue.get()) is not None:
+            buffer_slots.release()
+            yield entry[0]
+        await producer
+    finally:
+        _ = producer.cancel()
+        _ = await asyncio.gather(producer, return_exceptions=True)
+
+
+class ScrapeOptions(TypedDict, total=False):
+    """Keyword options shared by `iter_opportunity_pages` and the functions built on top of it."""
+
+    filters: SearchFilters | None
+    max_concurrent_requests: int
+    shard_size: datetime.timedelta | None
+    max_concurrent_shards: int
+    rate_limiter: TokenBucketRateLimiter | None
+    retry_policy: RetryPolicy
+    response_cache: ResponseCache | None
+    client_settings: ClientSettings
+    json_backend: JsonBackend
+    quarantine: RecordQuarantine | None
+    fields: Collection[str] | None
+    checkpoint: ScrapeCheckpoint | None
+    metrics: ScrapeMetrics | None
+    client: httpx.AsyncClient | None
+
+
+async def iter_opportunity_pages(
+    start_date: datetime.datetime, end_date: datetime.datetime, **options: Unpack[ScrapeOptions]
+) -> AsyncGenerator[list[SamGovOpportunity], None]:
+    """Stream opportunities from the SAM.gov API one validated page at a time.
+
+    Only a bounded number of pages is held in memory regardless of how large the date range is. Wrap the generator in
+    `contextlib.aclosing` when breaking out of it early so outstanding requests are cancelled promptly.
+
+    Without `shard_size` the whole range is one query and pages come back in offset order. With it, the range is
+    split into `shard_size` date shards that are each paged on their own, up to `max_concurrent_shards` at a time, and
+    pages from different shards interleave. All shards share the `max_concurrent_requests` budget. Sharding is opt-in
+    because every shard costs at least one request, which wastes the daily API quota on sparse (e.g. filtered) ranges.
+
+    Records are de-duplicated on `noticeId` within each query (offset paging can repeat a record when notices are
+    added while it runs). Shards do not overlap, so a notice is only returned by two of them if its posted date
+    changed in between, and then both versions are yielded.
+
+    With a `checkpoint`, a page is marked done (and the checkpoint saved) once the consumer asks for the next page,
+    i.e. after it has finished with the previous one, and pages already marked done are skipped.
+
+    Args:
+        start_date: Start date for the search range
+        end_date: End date for the search range
+        filters: Optional server-side filters sent with every `/v2/search` request
+        max_concurrent_requests: Maximum number of `/v2/search` requests in flight at once
+        shard_size: Optional size of the date shards the range is split into, in whole days
+        max_concurrent_shards: Maximum number of shards paged at once when sharding
+        rate_limiter: Optional limiter applied to the client built for this call; ignored when `client` is given
+        retry_policy: Retry behaviour of the client built for this call; ignored when `client` is given
+        response_cache: Optional on-disk response cache for the client built for this call; ignored when `client` is
+            given
+        client_settings: Pooling, timeouts and protocol of the client built for this call; ignored when `client` is
+            given
+        json_backend: How page bodies are decoded; see `decode_search_page`
+        quarantine: Optional quarantine that invalid records are diverted to instead of failing their page
+        fields: Optional names of the `SamGovOpportunity` fields to decode and keep; the others are skipped and None
+        checkpoint: Optional checkpoint to resume from and record progress in
+        metrics: Optional metrics to record timings and counters in, e.g. to read or export them while the scrape
+            runs; a summary is logged at the end either way. Requests and retries are only counted by the client built
+            for this call; pass the same metrics to `build_authenticated_client` when giving `client`
+        client: Optional client to reuse; one is built (and closed) for this call when omitted
+
+    Yields:
+        The not-yet-seen opportunities of each page
+    """
+    fields = options.get("fields")
+    if fields is not None:
+        _ = projected_opportunity_model(frozenset(fields))
+
+    pages = iter_record_pages(
+        start_date, end_date, _decode_opportunities, lambda opportunity: opportunity.noticeId, **options
+    )
+    async with aclosing(pages):
+        async for page in pages:
+            yield page
+
+
+def _decode_opportunities(
+    content: bytes,
+    json_backend: JsonBackend,
+    quarantine: RecordQuarantine | None,
+    fields: frozenset[str] | None,
+    metrics: ScrapeMetrics,
+) -> tuple[int, list[SamGovOpportunity]]:
+    page = decode_search_page(content, json_backend, quarantine, fields, metrics)
+    return page.totalRecords, page.opportunitiesData
+
+
+async def iter_record_pages[R](
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+    decode_records: RecordDecoder[R],
+    notice_id: Callable[[R], str],
+    *,
+    filters: SearchFilters | None = None,
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    shard_size: datetime.timedelta | None = None,
+    max_concurrent_shards: int = DEFAULT_MAX_CONCURRENT_SHARDS,
+    rate_limiter: TokenBucketRateLimiter | None = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    response_cache: ResponseCache | None = None,
+    client_settings: ClientSettings = DEFAULT_CLIENT_SETTINGS,
+    json_backend: JsonBackend = "pydantic",
+    quarantine: RecordQuarantine | None = None,
+    fields: Collection[str] | None = None,
+    checkpoint: ScrapeCheckpoint | None = None,
+    metrics: ScrapeMetrics | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> AsyncGenerator[list[R], None]:
+    """Page through SAM.gov like `iter_opportunity_pages`, with the records built by `decode_records`.
+
+    This is the paging, sharding, de-duplication and checkpointing behind `iter_opportunity_pages`, for callers that
+    want another record type (see `compact.iter_compact_opportunity_pages`), and accepts the same keyword options.
+    `json_backend`, `quarantine` and `fields` are handed to `decode_records` to apply; here the quarantined records
+    are only counted and `fields` is recorded in the checkpoint.
+
+    Args:
+        decode_records: Decodes a raw page body into its `totalRecords` and records
+        notice_id: The `noticeId` of a record, that records are de-duplicated on
+
+    Yields:
+        The not-yet-seen records of each page
+    """
+    if max_concurrent_requests < 1:
+        raise ValueError(f"max_concurrent_requests must be at least 1, got {max_concurrent_requests}")
+    if max_concurrent_shards < 1:
+        raise ValueError(f"max_concurrent_shards must be at least 1, got {max_concurrent_shards}")
+
+    projected_fields = frozenset(fields) if fields is not None else None
+    logger = logging.build_logger(name=f"{__name__}.{iter_opportunity_pages.__name__}")
+    metrics = metrics if metrics is not None else ScrapeMetrics()
+    shards = _build_date_shards(start_date.date(), end_date.date(), shard_size)
+    checkpoint = checkpoint if checkpoint is not None else ScrapeCheckpoint()
+    checkpoint.bind_query(
+        {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "shard_size_days": str(shard_size.days) if shard_size is not None else "",
+            "fields": ",".join(sorted(projected_fields)) if projected_fields is not None else "",
+            "filters": filters.model_dump_json(exclude_defaults=True) if filters is not None else "",
+        }
+    )
+    logger.info(
+        "Starting to scrape SAM.gov opportunities", start_date=start_date, end_date=end_date, cnt_shards=len(shards)
+    )
+    async with AsyncExitStack() as stack:
+        search_client = (
+            client
+            if client is not None
+            else await stack.enter_async_context(
+                build_authenticated_client(
+                    rate_limiter=rate_limiter,
+                    retry_policy=retry_policy,
+                    response_cache=response_cache,
+                    client_settings=client_settings,
+                    metrics=metrics,
+                )
             )
-            response = await client.get(
-                url="/v2/search",
-                params={
-                    **search_params,
-                    "offset": str(next_page_offset),
-                },
+        )
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        def decode_page(content: bytes) -> tuple[int, list[R]]:
+            return decode_records(content, json_backend, quarantine, projected_fields, metrics)
+
+        filter_params = filters.to_params() if filters is not None else {}
+
+        async def shard_pages(
+            shard_start: datetime.date, shard_end: datetime.date
+        ) -> AsyncGenerator[tuple[ShardProgress, int, list[R]], None]:
+            posted_from = shard_start.strftime("%m/%d/%Y")
+            posted_to = shard_end.strftime("%m/%d/%Y")
+            search_params = {
+                **filter_params,
+                "limit": str(API_MAX_LIMIT),
+                "postedFrom": posted_from,
+                "postedTo": posted_to,
+            }
+            progress = checkpoint.shard(f"{posted_from}-{posted_to}")
+            shard_logger = logger.bind(posted_from=posted_from, posted_to=posted_to)
+            pages = _iter_search_pages(
+                search_client,
+                search_params,
+                semaphore,
+                max_concurrent_requests,
+                progress,
+                decode_page,
+                metrics,
+                shard_logger,
             )
-            next_page_response_data = SamGovSearchResponse.model_validate(response.json())
-            all_opportunities.extend(next_page_response_data.opportunitiesData)
+            async with aclosing(pages):
+                async for offset, records in pages:
+                    yield progress, offset, records
+
+        pages = merge_streams(
+            [partial(shard_pages, shard_start, shard_end) for shard_start, shard_end in shards],
+            max_concurrent_streams=max_concurrent_shards,
+            buffer_size=max_concurrent_requests,
+        )
+        cnt_total_records = 0
+        cnt_duplicate_records = 0
+        async with aclosing(pages):
+            async for progress, offset, records in pages:
+                new_records: list[R] = []
+                for record in records:
+                    record_notice_id = notice_id(record)
+                    if record_notice_id in progress.seen_notice_ids:
+                        cnt_duplicate_records += 1
+                        continue
+                    progress.seen_notice_ids.add(record_notice_id)
+                    new_records.append(record)
+                cnt_total_records += len(new_records)
+                yield new_records
+
+                progress.completed_offsets.add(offset)
+                if progress.total_records is not None and progress.completed_offsets.issuperset(
+                    range(0, max(progress.total_records, 1), API_MAX_LIMIT)
+                ):
+                    # No page of the shard is left to repeat a notice, so the checkpoint need not keep them.
+                    progress.seen_notice_ids.clear()
+                checkpoint.save()
 
-        logger.info("SAM.gov search pagination complete", cnt_total_records=len(all_opportunities))
-        return all_opportunities
+        logger.info(
+            "SAM.gov search pagination complete",
+            cnt_total_records=cnt_total_records,
+            cnt_duplicate_records=cnt_duplicate_records,
+            cnt_quarantined_records=quarantine.cnt_quarantined if quarantine is not None else None,
+        )
+        logger.info("SAM.gov scrape metrics", **metrics.summary().model_dump())
+
+
+async def iter_opportunities(
+    start_date: datetime.datetime, end_date: datetime.datetime, **options: Unpack[ScrapeOptions]
+) -> AsyncGenerator[SamGovOpportunity, None]:
+    """Stream opportunities from the SAM.gov API record by record.
+
+    Flattens `iter_opportunity_pages`, and accepts the same keyword options.
+    """
+    pages = iter_opportunity_pages(start_date, end_date, **options)
+    async with aclosing(pages):
+        async for page in pages:
+            for opportunity in page:
+                yield opportunity
+
+
+async def run_scraping(
+    start_date: datetime.datetime, end_date: datetime.datetime, **options: Unpack[ScrapeOptions]
+) -> list[SamGovOpportunity]:
+    """Fetch opportunities data from SAM.gov API.
+
+    Thin wrapper that collects everything `iter_opportunities` yields; prefer the generator for large ranges. Accepts
+    the same keyword options as `iter_opportunity_pages`.
+
+    Args:
+        start_date: Start date for the search range
+        end_date: End date for the search range
+
+    Returns:
+        List of opportunity data dictionaries; in offset order unless sharded
+    """
+    opportunities = iter_opportunities(start_date, end_date, **options)
+    async with aclosing(opportunities):
+        return [opportunity async for opportunity in opportunities]
@@ -0,0 +1,78 @@
+import datetime
+from typing import Annotated, Literal, Self
+
+from pydantic import BaseModel, ConfigDict, StringConstraints, field_serializer, model_validator
+
+ProcurementType = Literal["u", "p", "a", "r", "s", "o", "g", "k", "i"]
+"""SAM.gov procurement type codes accepted by `ptype`.
+
+u: Justification (J&A), p: Pre solicitation, a: Award Notice, r: Sources Sought, s: Special Notice, o: Solicitation,
+g: Sale of Surplus Property, k: Combined Synopsis/Solicitation, i: Intent to Bundle Requirements (DoD-Funded).
+"""
+
+_NonEmptyString = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+def _format_date(value: datetime.date) -> str:
+    return value.strftime("%m/%d/%Y")
+
+
+class SearchFilters(BaseModel):
+    """Filters of the `/v2/search` endpoint, sent upstream so SAM.gov only returns matching notices.
+
+    Every filter is optional and they combine with AND; `procurement_types` matches any of the given types.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    procurement_types: frozenset[ProcurementType] = frozenset()
+    notice_id: _NonEmptyString | None = None
+    solicitation_number: _NonEmptyString | None = None
+    title: _NonEmptyString | None = None
+    state: Annotated[str, StringConstraints(pattern=r"^[A-Z]{2}$")] | None = None
+    """Place of performance state, as a two-letter code."""
+    zip: Annotated[str, StringConstraints(pattern=r"^\d{5}$")] | None = None
+    """Place of performance ZIP code."""
+    type_of_set_aside: _NonEmptyString | None = None
+    """Set-aside code, e.g. `SBA` or `8A`."""
+    type_of_set_aside_description: _NonEmptyString | None = None
+    naics_code: Annotated[str, StringConstraints(pattern=r"^\d{2,6}$")] | None = None
+    classification_code: _NonEmptyString | None = None
+    response_deadline_from: datetime.date | None = None
+    response_deadline_to: datetime.date | None = None
+
+    @model_validator(mode="after")
+    def _check_response_deadline_range(self) -> Self:
+        if (
+            self.response_deadline_from is not None
+            and self.response_deadline_to is not None
+            and self.response_deadline_from > self.response_deadline_to
+        ):
+            raise ValueError("response_deadline_from must not be after response_deadline_to")
+        return self
+
+    @field_serializer("procurement_types")
+    def _serialize_procurement_types(self, procurement_types: frozenset[ProcurementType]) -> list[ProcurementType]:
+        # Set iteration order changes with the hash seed; the serialized filters key checkpoints across processes.
+        return sorted(procurement_types)
+
+    def to_params(self) -> dict[str, str | list[str]]:
+        """Query parameters for `/v2/search`; unset filters are left out."""
+        params: dict[str, str | list[str]] = {}
+        if self.procurement_types:
+            params["ptype"] = sorted(self.procurement_types)
+        optional_params = {
+            "noticeid": self.notice_id,
+            "solnum": self.solicitation_number,
+            "title": self.title,
+            "state": self.state,
+            "zip": self.zip,
+            "typeOfSetAside": self.type_of_set_aside,
+            "typeOfSetAsideDescription": self.type_of_set_aside_description,
+            "ncode": self.naics_code,
+            "ccode": self.classification_code,
+            "rdlfrom": _format_date(self.response_deadline_from) if self.response_deadline_from is not None else None,
+            "rdlto": _format_date(self.response_deadline_to) if self.response_deadline_to is not None else None,
+        }
+        params.update({name: value for name, value in optional_params.items() if value is not None})
+        return params
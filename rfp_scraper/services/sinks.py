@@ -0,0 +1,95 @@
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import aclosing, nullcontext
+from pathlib import Path
+from types import TracebackType
+from typing import Protocol, Self
+
+from rfp_scraper.services.checkpoint import ScrapeCheckpoint
+from rfp_scraper.services.metrics import ScrapeMetrics
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity
+
+
+class OpportunitySink(Protocol):
+    """Destination for scraped pages; `write_page` must have durably stored the page by the time it returns.
+
+    The one exception is `ParquetSink`, which buffers rows and only stores them durably on `close`. Do not combine it
+    with anything that records progress per page, such as checkpoints.
+    """
+
+    def write_page(self, opportunities: Sequence[SamGovOpportunity]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+async def drain_pages(
+    pages: AsyncGenerator[list[SamGovOpportunity], None],
+    sinks: Sequence[OpportunitySink],
+    metrics: ScrapeMetrics | None = None,
+) -> int:
+    """Write every page to every sink before requesting the next one.
+
+    Because the page generators only mark a page done once the next one is requested, this ordering is what makes
+    checkpoints and high-water marks safe: progress is never recorded for a page that has not been written. With
+    `metrics`, writing each page is timed as its `sink` stage.
+
+    Returns:
+        Number of opportunities written
+    """
+    cnt_written = 0
+    async with aclosing(pages):
+        async for page in pages:
+            with metrics.span("sink") if metrics is not None else nullcontext():
+                for sink in sinks:
+                    sink.write_page(page)
+            cnt_written += len(page)
+    return cnt_written
+
+
+class JsonlSink:
+    """Writes opportunities to a JSON Lines file, one opportunity per line, flushing after every page.
+
+    With a `checkpoint`, the output location and its size after each page are recorded in it. When resuming from that
+    checkpoint the file is truncated back to the end of the last completed page, dropping any partially written one,
+    and appended to from there. With `append`, new lines are added to an existing file instead of replacing it.
+    """
+
+    def __init__(self, output_path: Path, checkpoint: ScrapeCheckpoint | None = None, *, append: bool = False):
+        resuming = checkpoint is not None and checkpoint.output_path is not None
+        if checkpoint is not None:
+            if resuming and checkpoint.output_path != str(output_path):
+                raise ValueError(f"Checkpoint output is {checkpoint.output_path}, not {output_path}")
+            if checkpoint.output_bytes and not output_path.exists():
+                raise ValueError(
+                    f"Checkpoint has {checkpoint.output_bytes} bytes of output but {output_path} is missing"
+                )
+            checkpoint.output_path = str(output_path)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if append:
+            self._file = output_path.open("ab")
+        else:
+            self._file = output_path.open("r+b" if resuming and output_path.exists() else "wb")
+            if checkpoint is not None:
+                _ = self._file.truncate(checkpoint.output_bytes)
+                _ = self._file.seek(checkpoint.output_bytes)
+        self._checkpoint = checkpoint
+
+    def write_page(self, opportunities: Sequence[SamGovOpportunity]) -> None:
+        self._file.writelines(opportunity.model_dump_json().encode() + b"\n" for opportunity in opportunities)
+        self._file.flush()
+        if self._checkpoint is not None:
+            self._checkpoint.output_bytes = self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
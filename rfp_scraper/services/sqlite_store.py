@@ -0,0 +1,123 @@
+import sqlite3
+from collections.abc import Iterable, Sequence
+from itertools import batched
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity
+
+DEFAULT_BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS opportunities (
+    notice_id TEXT PRIMARY KEY,
+    posted_date TEXT NOT NULL,
+    naics_code TEXT,
+    response_deadline TEXT,
+    type_of_set_aside TEXT,
+    title TEXT,
+    solicitation_number TEXT,
+    type TEXT,
+    active TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS opportunities_posted_date ON opportunities (posted_date);
+CREATE INDEX IF NOT EXISTS opportunities_naics_code ON opportunities (naics_code);
+CREATE INDEX IF NOT EXISTS opportunities_response_deadline ON opportunities (response_deadline);
+CREATE INDEX IF NOT EXISTS opportunities_type_of_set_aside ON opportunities (type_of_set_aside);
+"""
+
+_UPSERT = """
+INSERT INTO opportunities (
+    notice_id, posted_date, naics_code, response_deadline, type_of_set_aside, title, solicitation_number, type, active,
+    data
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (notice_id) DO UPDATE SET
+    posted_date = excluded.posted_date,
+    naics_code = excluded.naics_code,
+    response_deadline = excluded.response_deadline,
+    type_of_set_aside = excluded.type_of_set_aside,
+    title = excluded.title,
+    solicitation_number = excluded.solicitation_number,
+    type = excluded.type,
+    active = excluded.active,
+    data = excluded.data
+"""
+
+type _Row = tuple[str, str, str | None, str | None, str | None, str | None, str | None, str | None, str | None, str]
+
+
+def _to_row(opportunity: SamGovOpportunity) -> _Row:
+    return (
+        opportunity.noticeId,
+        opportunity.postedDate,
+        opportunity.naicsCode,
+        opportunity.responseDeadLine,
+        opportunity.typeOfSetAside,
+        opportunity.title,
+        opportunity.solicitationNumber,
+        opportunity.type,
+        opportunity.active,
+        opportunity.model_dump_json(),
+    )
+
+
+class OpportunityStore:
+    """Local SQLite database of opportunities keyed by `noticeId`.
+
+    The commonly filtered fields get their own indexed columns; the full record is kept as JSON in `data` and can be
+    queried with SQLite's JSON functions or turned back into a model with `SamGovOpportunity.model_validate_json`.
+    Records scraped with a `fields` projection only store the projected fields, so their columns may be NULL and
+    `get` cannot rebuild them.
+    """
+
+    def __init__(self, path: Path | str):
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        # WAL lets readers query the store while a scrape is writing to it.
+        _ = self._connection.execute("PRAGMA journal_mode = WAL")
+        _ = self._connection.execute("PRAGMA synchronous = NORMAL")
+        _ = self._connection.executescript(_SCHEMA)
+
+    def upsert(self, opportunities: Iterable[SamGovOpportunity], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Insert or replace opportunities with one `executemany` per batch, each batch in its own transaction.
+
+        Returns:
+            Number of opportunities written
+        """
+        cnt_written = 0
+        for batch in batched((_to_row(opportunity) for opportunity in opportunities), batch_size):
+            with self._connection:
+                _ = self._connection.executemany(_UPSERT, batch)
+            cnt_written += len(batch)
+        return cnt_written
+
+    def get(self, notice_id: str) -> SamGovOpportunity | None:
+        row: tuple[str] | None = self._connection.execute(
+            "SELECT data FROM opportunities WHERE notice_id = ?", (notice_id,)
+        ).fetchone()
+        return SamGovOpportunity.model_validate_json(row[0]) if row is not None else None
+
+    def count(self) -> int:
+        row: tuple[int] = self._connection.execute("SELECT COUNT(*) FROM opportunities").fetchone()
+        return row[0]
+
+    def write_page(self, opportunities: Sequence[SamGovOpportunity]) -> None:
+        _ = self.upsert(opportunities)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,155 @@
+import asyncio
+import datetime
+from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack, aclosing
+from typing import Self, Unpack
+from zoneinfo import ZoneInfo
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from rfp_scraper import logging
+from rfp_scraper.services.http_client import DEFAULT_CLIENT_SETTINGS
+from rfp_scraper.services.incremental import DEFAULT_OVERLAP, IncrementalState, iter_new_opportunity_pages
+from rfp_scraper.services.retry import DEFAULT_RETRY_POLICY
+from rfp_scraper.services.scrape_sam_gov import (
+    SamGovApiError,
+    SamGovOpportunity,
+    ScrapeOptions,
+    build_authenticated_client,
+)
+
+
+class PollSchedule(BaseModel):
+    """How often `watch_opportunity_pages` polls SAM.gov.
+
+    After a poll that found new or changed notices the next one follows after `min_interval_seconds`; every poll that
+    found nothing multiplies the interval by `backoff_factor`, up to `max_interval_seconds`. During the busy hours,
+    when most notices are posted, the interval is capped at `busy_max_interval_seconds`.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    min_interval_seconds: float = Field(default=60.0, ge=0)
+    max_interval_seconds: float = Field(default=1800.0, ge=0)
+    backoff_factor: float = Field(default=2.0, ge=1)
+    busy_max_interval_seconds: float = Field(default=300.0, ge=0)
+    busy_hours: tuple[int, int] = (8, 18)
+    """Start and end hour (exclusive) of the busy hours on weekdays, in `busy_timezone`."""
+    busy_timezone: str = "America/New_York"
+
+    @model_validator(mode="after")
+    def _check_intervals(self) -> Self:
+        if self.min_interval_seconds > self.max_interval_seconds:
+            raise ValueError("min_interval_seconds must not be above max_interval_seconds")
+        start_hour, end_hour = self.busy_hours
+        if not 0 <= start_hour <= end_hour <= 24:
+            raise ValueError(f"busy_hours must be two hours between 0 and 24 in order, got {self.busy_hours}")
+        _ = ZoneInfo(self.busy_timezone)
+        return self
+
+    def is_busy(self, now: datetime.datetime) -> bool:
+        local_now = now.astimezone(ZoneInfo(self.busy_timezone))
+        start_hour, end_hour = self.busy_hours
+        return local_now.weekday() < 5 and start_hour <= local_now.hour < end_hour
+
+    def next_interval(self, interval: float, cnt_new: int, now: datetime.datetime) -> float:
+        """Seconds to wait after a poll that found `cnt_new` new or changed notices, `interval` after the last one."""
+        if cnt_new:
+            next_interval = self.min_interval_seconds
+        else:
+            next_interval = min(
+                max(interval * self.backoff_factor, self.min_interval_seconds), self.max_interval_seconds
+            )
+        if self.is_busy(now):
+            next_interval = min(next_interval, max(self.busy_max_interval_seconds, self.min_interval_seconds))
+        return next_interval
+
+
+DEFAULT_POLL_SCHEDULE = PollSchedule()
+
+
+async def watch_opportunity_pages(
+    state: IncrementalState,
+    initial_start_date: datetime.datetime,
+    *,
+    schedule: PollSchedule = DEFAULT_POLL_SCHEDULE,
+    overlap: datetime.timedelta = DEFAULT_OVERLAP,
+    max_polls: int | None = None,
+    **options: Unpack[ScrapeOptions],
+) -> AsyncGenerator[list[SamGovOpportunity], None]:
+    """Poll SAM.gov for new or changed notices until cancelled, streaming them one page at a time.
+
+    Every poll is an incremental scrape (see `iter_new_opportunity_pages`) from the high-water mark in `state` up to
+    now, so only notices posted since the last poll (plus `overlap`) are fetched, and `state` is saved after each
+    completed poll. All polls share one client, and so its connection pool, rate limiter and retry budget. A poll that
+    still fails after its retries, with an error status or a transport error, is logged and its range is covered again
+    by the next poll, which skips the notices the failed poll already yielded. Accepts the same keyword options as
+    `iter_opportunity_pages` except `checkpoint` and `response_cache`, which would serve every poll the same pages.
+
+    Args:
+        state: High-water mark state, updated in place after every poll
+        initial_start_date: Start of the first poll when `state` has no high-water mark yet
+        schedule: Adaptive polling interval
+        overlap: How far before the high-water mark every poll re-queries, to catch late-indexed or amended notices
+        max_polls: Stop after this many polls; `None` polls until the generator is closed or cancelled
+
+    Yields:
+        The new or changed opportunities of each page that has any
+    """
+    if options.get("checkpoint") is not None or options.get("response_cache") is not None:
+        raise ValueError("checkpoints and response caches are not supported when watching for new notices")
+    if max_polls is not None and max_polls < 1:
+        raise ValueError(f"max_polls must be at least 1, got {max_polls}")
+
+    logger = logging.build_logger(name=f"{__name__}.{watch_opportunity_pages.__name__}")
+    logger.info("Watching SAM.gov for new notices", high_water_mark=state.high_water_mark, schedule=schedule)
+    async with AsyncExitStack() as stack:
+        client = options.get("client")
+        shared_client = (
+            client
+            if client is not None
+            else await stack.enter_async_context(
+                build_authenticated_client(
+                    rate_limiter=options.get("rate_limiter"),
+                    retry_policy=options.get("retry_policy", DEFAULT_RETRY_POLICY),
+                    client_settings=options.get("client_settings", DEFAULT_CLIENT_SETTINGS),
+                    metrics=options.get("metrics"),
+                )
+            )
+        )
+        poll_options: ScrapeOptions = {**options, "client": shared_client}
+
+        interval = schedule.min_interval_seconds
+        cnt_polls = 0
+        while max_polls is None or cnt_polls < max_polls:
+            cnt_polls += 1
+            cnt_new = 0
+            pages = iter_new_opportunity_pages(state, initial_start_date, overlap=overlap, **poll_options)
+            try:
+                async with aclosing(pages):
+                    async for page in pages:
+                        if page:
+                            cnt_new += len(page)
+                            yield page
+            except (httpx.HTTPError, SamGovApiError) as e:
+                # The state is only advanced by completed polls, so the next one covers this one's range again.
+                interval = schedule.next_interval(interval, cnt_new, datetime.datetime.now(tz=datetime.UTC))
+                logger.warning(
+                    "SAM.gov poll failed",
+                    cnt_polls=cnt_polls,
+                    cnt_new=cnt_new,
+                    next_poll_in_seconds=interval,
+                    error=repr(e),
+                )
+            else:
+                interval = schedule.next_interval(interval, cnt_new, datetime.datetime.now(tz=datetime.UTC))
+                logger.info(
+                    "SAM.gov poll complete",
+                    cnt_polls=cnt_polls,
+                    cnt_new=cnt_new,
+                    high_water_mark=state.high_water_mark,
+                    next_poll_in_seconds=interval,
+                )
+            if max_polls is None or cnt_polls < max_polls:
+                await asyncio.sleep(interval)
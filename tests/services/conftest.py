@@ -1,3 +1,9 @@
+import asyncio
+import datetime
+from collections.abc import Callable
+from typing import Any
+
+import httpx
 import pytest
 
 
@@ -52311,3 +52317,72 @@ def sam_gov_api_response_json_complex():  # pyright: ignore[reportUnknownParamet
             }
         ],
     }  # pyright: ignore[reportUnknownVariableType]
+
+
+class FakeSamGov:
+    """In-memory stand-in for the `/v2/search` endpoint, served through `httpx.MockTransport`.
+
+    Honors `limit`, `offset`, `postedFrom`, `postedTo`, `ncode` and `typeOfSetAside`, and records every request it
+    sees along with the highest number of requests that were in flight at the same time.
+    """
+
+    def __init__(self, opportunities: list[dict[str, Any]], latency: float = 0.01):
+        self.opportunities = opportunities
+        self.latency = latency
+        self.requests: list[httpx.Request] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _matching(self, params: httpx.QueryParams) -> list[dict[str, Any]]:
+        posted_from = datetime.datetime.strptime(params["postedFrom"], "%m/%d/%Y").date()
+        posted_to = datetime.datetime.strptime(params["postedTo"], "%m/%d/%Y").date()
+        return [
+            opportunity
+            for opportunity in self.opportunities
+            if posted_from <= datetime.date.fromisoformat(opportunity["postedDate"][:10]) <= posted_to
+            and params.get("ncode", opportunity["naicsCode"]) == opportunity["naicsCode"]
+            and params.get("typeOfSetAside", opportunity["typeOfSetAside"]) == opportunity["typeOfSetAside"]
+        ]
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params.get("offset", "0"))
+        matching = self._matching(request.url.params)
+        return httpx.Response(
+            200,
+            json={
+                "totalRecords": len(matching),
+                "limit": limit,
+                "offset": offset,
+                "opportunitiesData": matching[offset : offset + limit],
+                "links": [],
+            },
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url="https://api.sam.gov/opportunities", transport=httpx.MockTransport(self.handler)
+        )
+
+
+@pytest.fixture
+def make_opportunity_json(sam_gov_api_response_json_basic: dict[str, Any]) -> Callable[..., dict[str, Any]]:
+    """Build opportunity payloads from the basic fixture record with a given `noticeId` and `postedDate`."""
+
+    def make(notice_id: str, posted_date: str = "2025-04-28", **overrides: Any) -> dict[str, Any]:
+        return {
+            **sam_gov_api_response_json_basic["opportunitiesData"][0],
+            "noticeId": notice_id,
+            "postedDate": posted_date,
+            **overrides,
+        }
+
+    return make
@@ -0,0 +1,159 @@
+import asyncio
+import hashlib
+from pathlib import Path
+
+import httpx
+
+from rfp_scraper.services.attachments import AttachmentStore, DownloadSummary, download_attachments, resource_links
+
+
+class FakeFileServer:
+    """Serves fixed bodies with strong ETags and honors `Range` + `If-Range`, like the storage behind resource links."""
+
+    def __init__(self, files: dict[str, bytes], latency: float = 0.01, redirects: dict[str, str] | None = None):
+        self.files = files
+        self.latency = latency
+        self.redirects = redirects or {}
+        self.requests: list[httpx.Request] = []
+        self.in_flight_by_host: dict[str, int] = {}
+        self.max_in_flight_by_host: dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @staticmethod
+    def etag(body: bytes) -> str:
+        return f'"{hashlib.md5(body).hexdigest()}"'
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if str(request.url) in self.redirects:
+            return httpx.Response(303, headers={"location": self.redirects[str(request.url)]})
+        host = request.url.host
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.in_flight_by_host[host] = self.in_flight_by_host.get(host, 0) + 1
+        self.max_in_flight_by_host[host] = max(self.max_in_flight_by_host.get(host, 0), self.in_flight_by_host[host])
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+            self.in_flight_by_host[host] -= 1
+
+        url = str(request.url)
+        if url not in self.files:
+            return httpx.Response(404)
+        body = self.files[url]
+        etag = self.etag(body)
+        headers = {"etag": etag, "content-disposition": 'attachment; filename="package.zip"'}
+        range_header = request.headers.get("range")
+        if range_header is not None and request.headers.get("if-range") == etag:
+            start = int(range_header.removeprefix("bytes=").removesuffix("-"))
+            return httpx.Response(206, headers=headers, content=body[start:])
+        return httpx.Response(200, headers=headers, content=body)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler), follow_redirects=True)
+
+
+def test_resource_links_ignores_missing_and_malformed_links():
+    assert resource_links({"resourceLinks": None}) == []
+    assert resource_links({"resourceLinks": ["https://sam.gov/a", 3]}) == ["https://sam.gov/a"]
+
+
+def test_download_attachments_deduplicates_and_caps_per_host(tmp_path: Path):
+    files = {f"https://files.example/{index}": f"file {index % 3}".encode() * 1000 for index in range(9)}
+    files["https://other.example/0"] = b"other"
+    server = FakeFileServer(files)
+    store = AttachmentStore(tmp_path)
+
+    async def download() -> DownloadSummary:
+        async with server.client() as client:
+            return await download_attachments(
+                [*files, "https://files.example/0", "https://files.example/missing"],
+                store,
+                max_concurrent_downloads=4,
+                max_connections_per_host=2,
+                client=client,
+            )
+
+    summary = asyncio.run(download())
+
+    assert summary == DownloadSummary(cnt_downloaded=10, cnt_duplicate_content=6, cnt_skipped=0, cnt_failed=1)
+    assert server.max_in_flight_by_host["files.example"] == 2
+    assert len([path for path in (tmp_path / "objects").rglob("*") if path.is_file()]) == 4
+    record = store.get("https://files.example/4")
+    assert record is not None
+    assert record.filename == "package.zip"
+    assert store.object_path(record.sha256).read_bytes() == files["https://files.example/4"]
+
+    server.requests.clear()
+    assert asyncio.run(download()).cnt_skipped == 10
+    assert [str(request.url) for request in server.requests] == ["https://files.example/missing"]
+
+
+def test_download_attachments_caps_the_storage_host_after_redirects(tmp_path: Path):
+    redirects = {
+        f"https://sam.gov/api/file/{index}": f"https://{'a' if index % 2 else 'b'}.example/{index}"
+        for index in range(8)
+    }
+    server = FakeFileServer({url: url.encode() for url in redirects.values()}, redirects=redirects)
+
+    async def download() -> DownloadSummary:
+        async with server.client() as client:
+            return await download_attachments(
+                redirects,
+                AttachmentStore(tmp_path),
+                max_concurrent_downloads=4,
+                max_connections_per_host=2,
+                client=client,
+            )
+
+    assert asyncio.run(download()).cnt_downloaded == 8
+    assert server.max_in_flight_by_host == {"a.example": 2, "b.example": 2}
+    # Every link is on sam.gov, but the downloads from the two storage hosts still overlap.
+    assert server.max_in_flight == 4
+
+
+def test_download_attachments_resumes_partial_download_with_range(tmp_path: Path):
+    url = "https://files.example/large.zip"
+    body = bytes(range(256)) * 4096
+    server = FakeFileServer({url: body})
+    store = AttachmentStore(tmp_path)
+    # Leftovers of a download that was cut off after 300 kB.
+    part_path, validator_path = store.partial_paths(url)
+    part_path.parent.mkdir(parents=True)
+    _ = part_path.write_bytes(body[:300_000])
+    _ = validator_path.write_text(server.etag(body))
+
+    async def download() -> DownloadSummary:
+        async with server.client() as client:
+            return await download_attachments([url], store, client=client)
+
+    assert asyncio.run(download()).cnt_downloaded == 1
+    (request,) = server.requests
+    assert request.headers["range"] == "bytes=300000-"
+    record = store.get(url)
+    assert record is not None
+    assert record.sha256 == hashlib.sha256(body).hexdigest()
+    assert store.object_path(record.sha256).read_bytes() == body
+    assert not part_path.exists()
+
+
+def test_download_attachments_restarts_when_file_changed(tmp_path: Path):
+    url = "https://files.example/large.zip"
+    body = b"new version" * 1000
+    server = FakeFileServer({url: body})
+    store = AttachmentStore(tmp_path)
+    part_path, validator_path = store.partial_paths(url)
+    part_path.parent.mkdir(parents=True)
+    _ = part_path.write_bytes(b"old version")
+    _ = validator_path.write_text(server.etag(b"old version" * 1000))
+
+    async def download() -> DownloadSummary:
+        async with server.client() as client:
+            return await download_attachments([url], store, client=client)
+
+    assert asyncio.run(download()).cnt_downloaded == 1
+    record = store.get(url)
+    assert record is not None
+    assert store.object_path(record.sha256).read_bytes() == body
@@ -0,0 +1,171 @@
+"""Benchmark suite for the parse/validate/export hot path.
+
+Run with `pytest -m benchmark -s`. Results are written as JSON to `$RFP_BENCHMARK_OUTPUT` (default
+`.rfp_scraper/benchmarks/latest.json`). Point `$RFP_BENCHMARK_BASELINE` at the results of an earlier release to fail
+the run when a stage's throughput dropped by more than `$RFP_BENCHMARK_TOLERANCE` (default 0.2).
+"""
+
+import datetime
+import itertools
+import json
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+import pydantic
+import pydantic_core
+import pytest
+from pydantic import BaseModel
+
+from rfp_scraper.services.compact import decode_compact_page
+from rfp_scraper.services.scrape_sam_gov import SamGovSearchResponse, decode_search_page
+from rfp_scraper.services.sinks import JsonlSink
+from rfp_scraper.services.sqlite_store import OpportunityStore
+
+_ROUNDS = 5
+_SCALED_PAGE_RECORDS = 10_000
+_PROJECTED_FIELDS = frozenset(
+    {"title", "solicitationNumber", "type", "typeOfSetAside", "responseDeadLine", "naicsCode", "active", "uiLink"}
+)
+
+
+class StageResult(BaseModel):
+    stage: str
+    cnt_records: int
+    records_per_second: float
+    """Best of the timed rounds."""
+    peak_bytes: int
+    """Peak memory traced while the stage ran once, including its result."""
+    cnt_retained_blocks: int
+    """Memory blocks the stage allocated that were still alive at its end, i.e. roughly what its result costs."""
+
+
+class BenchmarkRun(BaseModel):
+    created_at: datetime.datetime
+    python_version: str
+    pydantic_version: str
+    results: list[StageResult]
+
+
+def _scaled_page(page: dict[str, Any], cnt_records: int) -> dict[str, Any]:
+    """A page of `cnt_records` records cycled from `page`, each with its own noticeId."""
+    records: list[dict[str, Any]] = page["opportunitiesData"]
+    scaled_records = [
+        {**records[index % len(records)], "noticeId": f"{records[index % len(records)]['noticeId']}-{index}"}
+        for index in range(cnt_records)
+    ]
+    return {**page, "totalRecords": cnt_records, "limit": cnt_records, "opportunitiesData": scaled_records}
+
+
+def _measure(stage: str, cnt_records: int, run: Callable[[], object]) -> StageResult:
+    _ = run()  # Warm up caches, e.g. the projected models.
+    elapsed: list[float] = []
+    for _ in range(_ROUNDS):
+        started_at = time.perf_counter()
+        _ = run()
+        elapsed.append(time.perf_counter() - started_at)
+
+    # Traced separately since tracemalloc slows allocations down considerably.
+    tracemalloc.start()
+    try:
+        result = run()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    return StageResult(
+        stage=stage,
+        cnt_records=cnt_records,
+        records_per_second=cnt_records / min(elapsed),
+        peak_bytes=peak_bytes,
+        cnt_retained_blocks=sum(stat.count for stat in snapshot.statistics("filename")),
+    )
+
+
+def _page_stages(content: bytes, tmp_path: Path) -> dict[str, Callable[[], object]]:
+    parsed = pydantic_core.from_json(content)
+    page = SamGovSearchResponse.model_validate_json(content)
+    stages: dict[str, Callable[[], object]] = {
+        "decode": lambda: pydantic_core.from_json(content),
+        "validate": lambda: SamGovSearchResponse.model_validate(parsed),
+        "decode+validate": lambda: decode_search_page(content),
+        "decode+validate, 8 fields": lambda: decode_search_page(content, fields=_PROJECTED_FIELDS),
+        "decode compact": lambda: decode_compact_page(content),
+        "decode compact, raw kept": lambda: decode_compact_page(content, keep_raw=True),
+    }
+    if find_spec("orjson") is not None:
+        stages["decode+validate, orjson"] = lambda: decode_search_page(content, "orjson")
+
+    def export_jsonl() -> None:
+        with JsonlSink(tmp_path / "opportunities.jsonl") as sink:
+            sink.write_page(page.opportunitiesData)
+
+    def export_sqlite() -> None:
+        with OpportunityStore(":memory:") as store:
+            store.write_page(page.opportunitiesData)
+
+    stages["export jsonl"] = export_jsonl
+    stages["export sqlite"] = export_sqlite
+    if find_spec("pyarrow") is not None:
+        from rfp_scraper.services.parquet_export import ParquetSink
+
+        parquet_roots = (tmp_path / f"parquet-{index}" for index in itertools.count())
+
+        def export_parquet() -> None:
+            with ParquetSink(next(parquet_roots)) as sink:
+                sink.write_page(page.opportunitiesData)
+
+        stages["export parquet"] = export_parquet
+    return stages
+
+
+def _regressions(results: list[StageResult], baseline: BenchmarkRun, tolerance: float) -> list[str]:
+    baseline_results = {(result.stage, result.cnt_records): result for result in baseline.results}
+    regressions: list[str] = []
+    for result in results:
+        previous = baseline_results.get((result.stage, result.cnt_records))
+        if previous is not None and result.records_per_second < previous.records_per_second * (1 - tolerance):
+            regressions.append(
+                f"{result.stage} ({result.cnt_records} records): {result.records_per_second:.0f} records/s, "
+                f"baseline {previous.records_per_second:.0f}"
+            )
+    return regressions
+
+
+@pytest.mark.benchmark
+def test_benchmark_hot_path(sam_gov_api_response_json_complex: dict[str, Any], tmp_path: Path):
+    pages = [sam_gov_api_response_json_complex, _scaled_page(sam_gov_api_response_json_complex, _SCALED_PAGE_RECORDS)]
+
+    results: list[StageResult] = []
+    for page in pages:
+        content = json.dumps(page).encode()
+        cnt_records = len(page["opportunitiesData"])
+        for stage, run in _page_stages(content, tmp_path).items():
+            result = _measure(stage, cnt_records, run)
+            print(
+                f"{stage} ({cnt_records} records): {result.records_per_second:,.0f} records/s, "
+                f"peak {result.peak_bytes / 1024 / 1024:.1f} MiB, {result.cnt_retained_blocks:,} blocks retained"
+            )
+            results.append(result)
+
+    benchmark_run = BenchmarkRun(
+        created_at=datetime.datetime.now(tz=datetime.UTC),
+        python_version=platform.python_version(),
+        pydantic_version=pydantic.VERSION,
+        results=results,
+    )
+    output_path = Path(os.environ.get("RFP_BENCHMARK_OUTPUT", ".rfp_scraper/benchmarks/latest.json"))
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _ = output_path.write_text(benchmark_run.model_dump_json(indent=2))
+
+    baseline_path = os.environ.get("RFP_BENCHMARK_BASELINE")
+    if baseline_path is not None:
+        baseline = BenchmarkRun.model_validate_json(Path(baseline_path).read_bytes())
+        tolerance = float(os.environ.get("RFP_BENCHMARK_TOLERANCE", "0.2"))
+        assert _regressions(results, baseline, tolerance) == []
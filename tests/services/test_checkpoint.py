@@ -0,0 +1,105 @@
+import asyncio
+import datetime
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from rfp_scraper.services.checkpoint import ScrapeCheckpoint
+from rfp_scraper.services.scrape_sam_gov import API_MAX_LIMIT, SamGovApiError, iter_opportunity_pages
+from rfp_scraper.services.sinks import JsonlSink, drain_pages
+from tests.services.conftest import FakeSamGov
+
+START_DATE = datetime.datetime(2025, 4, 28)
+END_DATE = datetime.datetime(2025, 4, 29)
+
+
+class FlakySamGov(FakeSamGov):
+    """Fails every request for `fail_offset` until `healthy` is set."""
+
+    def __init__(self, opportunities: list[dict[str, Any]], fail_offset: int):
+        super().__init__(opportunities)
+        self.fail_offset = fail_offset
+        self.healthy = False
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if not self.healthy and request.url.params.get("offset") == str(self.fail_offset):
+            self.requests.append(request)
+            return httpx.Response(400, text="simulated crash")
+        return await super().handler(request)
+
+
+def _scrape(fake_sam_gov: FakeSamGov, output_path: Path, checkpoint: ScrapeCheckpoint) -> int:
+    async def scrape() -> int:
+        async with fake_sam_gov.client() as client:
+            pages = iter_opportunity_pages(
+                START_DATE, END_DATE, max_concurrent_requests=1, checkpoint=checkpoint, client=client
+            )
+            with JsonlSink(output_path, checkpoint) as sink:
+                return await drain_pages(pages, [sink])
+
+    return asyncio.run(scrape())
+
+
+def test_scrape_resumes_from_checkpoint_after_failure(
+    tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]
+):
+    output_path = tmp_path / "opportunities.jsonl"
+    checkpoint_path = tmp_path / "checkpoint.json"
+    fake_sam_gov = FlakySamGov(
+        [make_opportunity_json(f"notice-{index:05d}") for index in range(API_MAX_LIMIT * 4 + 10)],
+        fail_offset=API_MAX_LIMIT * 3,
+    )
+
+    with pytest.raises(SamGovApiError):
+        _ = _scrape(fake_sam_gov, output_path, ScrapeCheckpoint.open(checkpoint_path))
+
+    checkpoint = ScrapeCheckpoint.open(checkpoint_path, resume=True)
+    [progress] = checkpoint.shards.values()
+    assert progress.completed_offsets == {0, API_MAX_LIMIT, API_MAX_LIMIT * 2}
+    assert checkpoint.output_path == str(output_path)
+
+    fake_sam_gov.healthy = True
+    fake_sam_gov.requests.clear()
+    assert _scrape(fake_sam_gov, output_path, checkpoint) == API_MAX_LIMIT + 10
+
+    assert sorted(request.url.params["offset"] for request in fake_sam_gov.requests) == [
+        str(API_MAX_LIMIT * 3),
+        str(API_MAX_LIMIT * 4),
+    ]
+    written_notice_ids = [json.loads(line)["noticeId"] for line in output_path.read_text().splitlines()]
+    assert written_notice_ids == [opportunity["noticeId"] for opportunity in fake_sam_gov.opportunities]
+
+
+def test_resumed_scrape_skips_notices_yielded_before_the_failure(
+    tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]
+):
+    output_path = tmp_path / "opportunities.jsonl"
+    checkpoint_path = tmp_path / "checkpoint.json"
+    opportunities = [make_opportunity_json(f"notice-{index:05d}") for index in range(API_MAX_LIMIT + 10)]
+    # Offset paging served the first notice again on the second page, which fails until the scrape is resumed.
+    opportunities.insert(API_MAX_LIMIT, opportunities[0])
+    fake_sam_gov = FlakySamGov(opportunities, fail_offset=API_MAX_LIMIT)
+
+    with pytest.raises(SamGovApiError):
+        _ = _scrape(fake_sam_gov, output_path, ScrapeCheckpoint.open(checkpoint_path))
+
+    fake_sam_gov.healthy = True
+    checkpoint = ScrapeCheckpoint.open(checkpoint_path, resume=True)
+    assert _scrape(fake_sam_gov, output_path, checkpoint) == 10
+
+    written_notice_ids = [json.loads(line)["noticeId"] for line in output_path.read_text().splitlines()]
+    assert len(written_notice_ids) == len(set(written_notice_ids)) == API_MAX_LIMIT + 10
+    [progress] = checkpoint.shards.values()
+    assert progress.seen_notice_ids == set()
+
+
+def test_checkpoint_rejects_different_query(tmp_path: Path):
+    checkpoint = ScrapeCheckpoint.open(tmp_path / "checkpoint.json")
+    checkpoint.bind_query({"start_date": "2025-04-28T00:00:00"})
+
+    with pytest.raises(ValueError):
+        checkpoint.bind_query({"start_date": "2025-01-01T00:00:00"})
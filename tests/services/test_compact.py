@@ -0,0 +1,85 @@
+import asyncio
+import dataclasses
+import datetime
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from rfp_scraper.services.compact import CompactOpportunity, decode_compact_page, iter_compact_opportunity_pages
+from rfp_scraper.services.metrics import ScrapeMetrics
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity, SamGovSearchResponse
+from tests.services.conftest import FakeSamGov
+
+
+def test_compact_opportunity_round_trips_to_model(make_opportunity_json: Callable[..., dict[str, Any]]):
+    record = make_opportunity_json("notice-1", naicsCode="541511")
+
+    compact = CompactOpportunity.from_json(record, keep_raw=True)
+
+    assert compact.notice_id == "notice-1"
+    assert compact.naics_code == "541511"
+    assert compact.to_model() == SamGovOpportunity.model_validate(record)
+    assert not hasattr(compact, "__dict__")
+
+
+def test_compact_opportunity_without_raw_cannot_convert(make_opportunity_json: Callable[..., dict[str, Any]]):
+    compact = CompactOpportunity.from_json(make_opportunity_json("notice-1"))
+
+    with pytest.raises(ValueError):
+        _ = compact.to_model()
+
+
+def test_compact_opportunity_rejects_null_required_fields(make_opportunity_json: Callable[..., dict[str, Any]]):
+    with pytest.raises(ValidationError, match="title"):
+        _ = CompactOpportunity.from_json(make_opportunity_json("notice-1", title=None))
+    with pytest.raises(ValidationError, match="naicsCode"):
+        _ = CompactOpportunity.from_json(make_opportunity_json("notice-1", naicsCode=541511))
+
+
+def test_decode_compact_page_matches_validated_page(sam_gov_api_response_json_complex: dict[str, Any]):
+    content = json.dumps(sam_gov_api_response_json_complex).encode()
+
+    total_records, opportunities = decode_compact_page(content)
+    _, opportunities_with_raw = decode_compact_page(content, keep_raw=True)
+
+    page = SamGovSearchResponse.model_validate_json(content)
+    assert total_records == page.totalRecords
+    assert [opportunity.notice_id for opportunity in opportunities] == [
+        opportunity.noticeId for opportunity in page.opportunitiesData
+    ]
+    assert [dataclasses.replace(opportunity, raw=None) for opportunity in opportunities_with_raw] == opportunities
+    assert opportunities_with_raw[-1].to_model() == page.opportunitiesData[-1]
+
+
+def test_iter_compact_opportunity_pages_scrapes_compact_records(make_opportunity_json: Callable[..., dict[str, Any]]):
+    fake_sam_gov = FakeSamGov([make_opportunity_json(f"notice-{index}") for index in range(1500)])
+    metrics = ScrapeMetrics()
+
+    async def scrape() -> list[list[CompactOpportunity]]:
+        async with fake_sam_gov.client() as client:
+            pages = iter_compact_opportunity_pages(
+                datetime.datetime(2025, 4, 28),
+                datetime.datetime(2025, 4, 29),
+                metrics=metrics,
+                client=client,
+            )
+            return [page async for page in pages]
+
+    pages = asyncio.run(scrape())
+
+    assert [len(page) for page in pages] == [1000, 500]
+    assert pages[0][0].notice_id == "notice-0"
+    assert pages[0][0].raw is None
+    assert metrics.summary().stages["validate"].count == 2
+
+
+def test_iter_compact_opportunity_pages_rejects_quarantine_and_fields():
+    pages = iter_compact_opportunity_pages(
+        datetime.datetime(2025, 4, 28), datetime.datetime(2025, 4, 29), fields=["title"]
+    )
+
+    with pytest.raises(ValueError):
+        _ = asyncio.run(anext(pages))
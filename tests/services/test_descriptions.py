@@ -0,0 +1,90 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from rfp_scraper.services.descriptions import DescriptionStore, HydrationSummary, hydrate_descriptions
+
+
+class FakeNoticeDescriptions:
+    def __init__(self, descriptions: dict[str, str], latency: float = 0.01):
+        self.descriptions = descriptions
+        self.latency = latency
+        self.requested_notice_ids: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        notice_id = request.url.params["noticeid"]
+        self.requested_notice_ids.append(notice_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        if notice_id not in self.descriptions:
+            return httpx.Response(404, json={"error": "Description Not Found"})
+        return httpx.Response(200, json={"description": self.descriptions[notice_id]})
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url="https://api.sam.gov/opportunities", transport=httpx.MockTransport(self.handler)
+        )
+
+
+def test_description_store_deduplicates_content(tmp_path: Path):
+    store = DescriptionStore(tmp_path)
+    store.put("notice-1", "<p>Same text</p>")
+    store.put("notice-2", "<p>Same text</p>")
+
+    assert "notice-1" in store
+    assert "notice-3" not in store
+    assert store.get("notice-2") == "<p>Same text</p>"
+    assert store.get("notice-3") is None
+    assert len([path for path in (tmp_path / "objects").rglob("*") if path.is_file()]) == 1
+    with pytest.raises(ValueError):
+        _ = store.get("../escape")
+
+
+def test_hydrate_descriptions_fetches_concurrently_and_skips_cached(tmp_path: Path):
+    fake_sam_gov = FakeNoticeDescriptions({f"notice-{index}": f"Description {index}" for index in range(20)})
+    store = DescriptionStore(tmp_path)
+    store.put("notice-0", "Description 0")
+    notice_ids = [f"notice-{index}" for index in range(20)] + ["notice-1", "notice-missing"]
+
+    async def hydrate() -> HydrationSummary:
+        async with fake_sam_gov.client() as client:
+            return await hydrate_descriptions(notice_ids, store, max_concurrent_requests=4, client=client)
+
+    assert asyncio.run(hydrate()) == HydrationSummary(cnt_fetched=20, cnt_skipped=1)
+    assert sorted(fake_sam_gov.requested_notice_ids) == sorted(notice_ids[1:20] + ["notice-missing"])
+    assert fake_sam_gov.max_in_flight == 4
+    assert store.get("notice-7") == "Description 7"
+    assert store.get("notice-missing") == ""
+
+    fake_sam_gov.requested_notice_ids.clear()
+    assert asyncio.run(hydrate()).cnt_fetched == 0
+    assert fake_sam_gov.requested_notice_ids == []
+
+
+def test_hydrate_descriptions_counts_failures_and_finishes_the_rest(tmp_path: Path):
+    fake_sam_gov = FakeNoticeDescriptions({f"notice-{index}": f"Description {index}" for index in range(10)})
+    store = DescriptionStore(tmp_path)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["noticeid"] == "notice-3":
+            return httpx.Response(500, text="Internal Server Error")
+        return await fake_sam_gov.handler(request)
+
+    async def hydrate() -> HydrationSummary:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(base_url="https://api.sam.gov/opportunities", transport=transport) as client:
+            return await hydrate_descriptions(
+                [f"notice-{index}" for index in range(10)], store, max_concurrent_requests=2, client=client
+            )
+
+    assert asyncio.run(hydrate()) == HydrationSummary(cnt_fetched=9, cnt_failed=1)
+    assert "notice-3" not in store
+    assert store.get("notice-9") == "Description 9"
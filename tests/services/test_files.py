@@ -0,0 +1,13 @@
+from pathlib import Path
+
+from rfp_scraper.services.files import write_atomically
+
+
+def test_write_atomically_replaces_file_and_creates_parents(tmp_path: Path):
+    path = tmp_path / "state" / "incremental.json"
+
+    assert write_atomically(path, "first") == 5
+    assert write_atomically(path, b"second") == 6
+
+    assert path.read_text() == "second"
+    assert [child.name for child in path.parent.iterdir()] == ["incremental.json"]
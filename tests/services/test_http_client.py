@@ -0,0 +1,39 @@
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+
+from rfp_scraper.services.attachments import build_download_client
+from rfp_scraper.services.http_client import ClientSettings, build_transport
+from rfp_scraper.services.scrape_sam_gov import build_authenticated_client
+
+
+def test_build_transport_applies_pool_limits():
+    transport = build_transport(ClientSettings(max_connections=7, max_keepalive_connections=3, keepalive_expiry=90.0))
+    pool = transport._pool  # pyright: ignore[reportPrivateUsage]
+
+    assert pool._max_connections == 7  # pyright: ignore[reportPrivateUsage]
+    assert pool._max_keepalive_connections == 3  # pyright: ignore[reportPrivateUsage]
+    assert pool._keepalive_expiry == 90.0  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+def test_build_transport_requires_h2_for_http2():
+    with pytest.raises(ImportError, match="http2"):
+        _ = build_transport(ClientSettings(http2=True))
+
+
+def test_clients_use_configured_timeouts():
+    settings = ClientSettings(connect_timeout=2.0, read_timeout=45.0)
+
+    async def timeouts() -> list[httpx.Timeout]:
+        async with (
+            build_authenticated_client(client_settings=settings) as api_client,
+            build_download_client(client_settings=settings) as download_client,
+        ):
+            return [api_client.timeout, download_client.timeout]
+
+    for timeout in asyncio.run(timeouts()):
+        assert timeout.connect == 2.0
+        assert timeout.read == 45.0
@@ -0,0 +1,65 @@
+import asyncio
+import datetime
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from rfp_scraper.services.incremental import IncrementalState, iter_new_opportunity_pages
+from rfp_scraper.services.response_cache import ResponseCache
+from tests.services.conftest import FakeSamGov
+
+
+def _scrape_new(fake_sam_gov: FakeSamGov, state: IncrementalState, end_date: datetime.datetime) -> list[str]:
+    async def scrape() -> list[str]:
+        notice_ids: list[str] = []
+        async with fake_sam_gov.client() as client:
+            async for page in iter_new_opportunity_pages(
+                state, datetime.datetime(2025, 4, 1), end_date, overlap=datetime.timedelta(days=1), client=client
+            ):
+                notice_ids.extend(opportunity.noticeId for opportunity in page)
+        return notice_ids
+
+    return asyncio.run(scrape())
+
+
+def test_incremental_scrape_only_emits_new_or_changed_notices(
+    tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]
+):
+    state_path = tmp_path / "state.json"
+    fake_sam_gov = FakeSamGov(
+        [
+            make_opportunity_json("old", posted_date="2025-04-01"),
+            make_opportunity_json("edge", posted_date="2025-04-09"),
+            make_opportunity_json("latest", posted_date="2025-04-10"),
+        ]
+    )
+
+    first_run = _scrape_new(fake_sam_gov, IncrementalState.open(state_path), datetime.datetime(2025, 4, 10))
+    assert first_run == ["old", "edge", "latest"]
+
+    state = IncrementalState.open(state_path)
+    assert state.high_water_mark == datetime.date(2025, 4, 10)
+    # Only notices inside the overlap window below the high-water mark are worth remembering.
+    assert set(state.seen_notices) == {"edge", "latest"}
+
+    fake_sam_gov.opportunities[2] = make_opportunity_json("latest", posted_date="2025-04-10", title="Amended")
+    fake_sam_gov.opportunities.append(make_opportunity_json("new", posted_date="2025-04-11"))
+    fake_sam_gov.requests.clear()
+
+    second_run = _scrape_new(fake_sam_gov, state, datetime.datetime(2025, 4, 12))
+    assert second_run == ["latest", "new"]
+    assert {request.url.params["postedFrom"] for request in fake_sam_gov.requests} == {"04/09/2025"}
+    assert IncrementalState.open(state_path).high_water_mark == datetime.date(2025, 4, 11)
+
+
+def test_incremental_scrape_rejects_response_cache(tmp_path: Path):
+    async def scrape() -> None:
+        async for _ in iter_new_opportunity_pages(
+            IncrementalState(), datetime.datetime(2025, 4, 1), response_cache=ResponseCache(tmp_path)
+        ):
+            pass
+
+    with pytest.raises(ValueError, match="response caches"):
+        asyncio.run(scrape())
@@ -0,0 +1,91 @@
+import asyncio
+import datetime
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from rfp_scraper.services.metrics import LATENCY_BUCKETS, ScrapeMetrics, StageStats, percentile
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity, iter_opportunity_pages
+from rfp_scraper.services.sinks import drain_pages
+from tests.services.conftest import FakeSamGov
+
+
+class ListSink:
+    def __init__(self):
+        self.opportunities: list[SamGovOpportunity] = []
+
+    def write_page(self, opportunities: Sequence[SamGovOpportunity]) -> None:
+        self.opportunities.extend(opportunities)
+
+    def close(self) -> None:
+        pass
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([3.0], 0.95) == 3.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_stage_stats_stay_bounded_and_keep_exact_totals():
+    stats = StageStats(reservoir_size=100)
+    for index in range(10_000):
+        stats.observe(index / 10_000)
+
+    assert len(stats.reservoir) == 100
+    assert stats.count == 10_000
+    assert stats.max_seconds == 0.9999
+    assert sum(stats.bucket_counts) == 10_000
+    # 0.0 up to and including 0.005 falls in the first bucket.
+    assert stats.bucket_counts[0] == 51
+    # Above 0.5 up to and including 1.0.
+    assert stats.bucket_counts[LATENCY_BUCKETS.index(1.0)] == 4999
+    summary = stats.summary()
+    assert summary.p50_seconds <= summary.p99_seconds <= summary.max_seconds
+
+
+def test_connect_tracer_only_records_new_connections():
+    metrics = ScrapeMetrics()
+
+    async def trace_requests() -> None:
+        new_connection = metrics.connect_tracer()
+        for event_name in ["connection.connect_tcp.started", "connection.start_tls.complete"]:
+            await new_connection(event_name, {})
+        await new_connection("http11.send_request_headers.started", {})
+        await metrics.connect_tracer()("http11.send_request_headers.started", {})
+
+    asyncio.run(trace_requests())
+
+    assert metrics.stages["connect"].count == 1
+
+
+def test_scrape_records_stage_timings_and_throughput(make_opportunity_json: Callable[..., dict[str, Any]]):
+    fake_sam_gov = FakeSamGov([make_opportunity_json(f"notice-{index}") for index in range(2500)])
+    metrics = ScrapeMetrics()
+    sink = ListSink()
+
+    async def scrape() -> int:
+        async with fake_sam_gov.client() as client:
+            pages = iter_opportunity_pages(
+                datetime.datetime(2025, 4, 28), datetime.datetime(2025, 4, 29), metrics=metrics, client=client
+            )
+            return await drain_pages(pages, [sink], metrics)
+
+    assert asyncio.run(scrape()) == 2500
+
+    summary = metrics.summary()
+    assert summary.cnt_pages == 3
+    assert summary.cnt_records == 2500
+    assert summary.cnt_bytes > 0
+    assert summary.records_per_second > 0
+    assert {stage: stage_summary.count for stage, stage_summary in summary.stages.items()} == {
+        "request": 3,
+        "validate": 3,
+        "sink": 3,
+    }
+    request_summary = summary.stages["request"]
+    assert request_summary.p50_seconds <= request_summary.p95_seconds <= request_summary.p99_seconds
+    assert request_summary.p99_seconds <= request_summary.max_seconds
+    assert request_summary.p50_seconds >= fake_sam_gov.latency
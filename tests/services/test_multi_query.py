@@ -0,0 +1,69 @@
+import asyncio
+import datetime
+from collections.abc import Callable
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from rfp_scraper.services.multi_query import SavedQuery, iter_multi_query_pages, load_saved_queries
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity
+from rfp_scraper.services.search_filters import SearchFilters
+from tests.services.conftest import FakeSamGov
+
+
+def test_multi_query_deduplicates_and_records_matches(make_opportunity_json: Callable[..., dict[str, Any]]):
+    fake_sam_gov = FakeSamGov(
+        [
+            make_opportunity_json("it-sba", naicsCode="541511", typeOfSetAside="SBA"),
+            make_opportunity_json("it", naicsCode="541511", typeOfSetAside=None),
+            make_opportunity_json("furniture-sba", naicsCode="337214", typeOfSetAside="SBA"),
+            make_opportunity_json("furniture", naicsCode="337214", typeOfSetAside=None),
+        ]
+    )
+    queries = [
+        SavedQuery(name="it-services", filters=SearchFilters(naics_code="541511")),
+        SavedQuery(name="small-business", filters=SearchFilters(type_of_set_aside="SBA")),
+    ]
+    matches: dict[str, set[str]] = {}
+
+    async def scrape() -> list[SamGovOpportunity]:
+        async with fake_sam_gov.client() as client:
+            pages = iter_multi_query_pages(
+                queries, datetime.datetime(2025, 4, 28), datetime.datetime(2025, 4, 29), matches=matches, client=client
+            )
+            async with aclosing(pages):
+                return [opportunity async for page in pages for opportunity in page]
+
+    notice_ids = [opportunity.noticeId for opportunity in asyncio.run(scrape())]
+
+    assert sorted(notice_ids) == ["furniture-sba", "it", "it-sba"]
+    assert matches == {
+        "it-sba": {"it-services", "small-business"},
+        "it": {"it-services"},
+        "furniture-sba": {"small-business"},
+    }
+    assert len(fake_sam_gov.requests) == 2
+
+
+def test_multi_query_rejects_duplicate_names():
+    queries = [SavedQuery(name="same"), SavedQuery(name="same")]
+
+    async def scrape() -> None:
+        pages = iter_multi_query_pages(queries, datetime.datetime(2025, 4, 28), datetime.datetime(2025, 4, 29))
+        async with aclosing(pages):
+            _ = await anext(pages)
+
+    with pytest.raises(ValueError, match="unique"):
+        asyncio.run(scrape())
+
+
+def test_load_saved_queries(tmp_path: Path):
+    path = tmp_path / "queries.json"
+    _ = path.write_text('[{"name": "it-services", "filters": {"naics_code": "541511"}}, {"name": "everything"}]')
+
+    assert load_saved_queries(path) == [
+        SavedQuery(name="it-services", filters=SearchFilters(naics_code="541511")),
+        SavedQuery(name="everything"),
+    ]
@@ -0,0 +1,73 @@
+# pyarrow ships without type information, so strict unknown-type checks are relaxed for this module only.
+# pyright: reportMissingTypeStubs=false, reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from rfp_scraper.services.scrape_sam_gov import SamGovSearchResponse
+
+pytest.importorskip("pyarrow")
+
+import pyarrow.dataset as ds  # noqa: E402
+
+from rfp_scraper.services.parquet_export import ParquetSink  # noqa: E402
+
+
+def test_parquet_sink_writes_month_partitions(tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]):
+    opportunities = SamGovSearchResponse.model_validate(
+        {
+            "totalRecords": 3,
+            "limit": 1000,
+            "offset": 0,
+            "opportunitiesData": [
+                make_opportunity_json("march", posted_date="2025-03-31"),
+                make_opportunity_json("april-1", posted_date="2025-04-01"),
+                make_opportunity_json("april-2", posted_date="2025-04-02", placeOfPerformance={"zip": "22060"}),
+            ],
+            "links": [],
+        }
+    ).opportunitiesData
+
+    with ParquetSink(tmp_path, row_group_size=2) as sink:
+        sink.write_page(opportunities[:2])
+        sink.write_page(opportunities[2:])
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["posted_month=2025-03", "posted_month=2025-04"]
+    dataset = ds.dataset(tmp_path, partitioning="hive")
+    april = dataset.to_table(filter=ds.field("posted_month") == "2025-04").to_pylist()
+    assert sorted(row["noticeId"] for row in april) == ["april-1", "april-2"]
+    assert april[0]["award"]["awardee"]["name"] == "GRAND STANDS, INC."
+    assert {row["placeOfPerformance"] for row in april} == {None, '{"zip": "22060"}'}
+
+
+def test_parquet_sink_bounds_rows_buffered_across_partitions(
+    tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]
+):
+    opportunities = SamGovSearchResponse.model_validate(
+        {
+            "totalRecords": 4,
+            "limit": 1000,
+            "offset": 0,
+            "opportunitiesData": [
+                make_opportunity_json("march-1", posted_date="2025-03-30"),
+                make_opportunity_json("march-2", posted_date="2025-03-31"),
+                make_opportunity_json("april-1", posted_date="2025-04-01"),
+                make_opportunity_json("may-1", posted_date="2025-05-01"),
+            ],
+            "links": [],
+        }
+    ).opportunitiesData
+
+    with ParquetSink(tmp_path, row_group_size=3) as sink:
+        sink.write_page(opportunities[:2])
+        sink.write_page(opportunities[2:3])
+        # No single month has filled a row group, but together they hold three rows: the largest month is written.
+        assert [path.name for path in tmp_path.iterdir()] == ["posted_month=2025-03"]
+        sink.write_page(opportunities[3:])
+
+    dataset = ds.dataset(tmp_path, partitioning="hive")
+    assert sorted(dataset.to_table().column("noticeId").to_pylist()) == ["april-1", "march-1", "march-2", "may-1"]
@@ -0,0 +1,51 @@
+import asyncio
+import urllib.request
+
+import httpx
+import pytest
+
+from rfp_scraper.services.metrics import MeteredTransport, ScrapeMetrics
+from rfp_scraper.services.retry import RetryPolicy, RetryTransport
+
+pytest.importorskip("prometheus_client")
+
+from rfp_scraper.services.prometheus_export import start_metrics_server  # noqa: E402
+
+
+def test_metrics_endpoint_exposes_counters_and_latency_histograms():
+    metrics = ScrapeMetrics()
+    statuses = iter([503, 200])
+    transport = RetryTransport(
+        MeteredTransport(httpx.MockTransport(lambda request: httpx.Response(next(statuses))), metrics),
+        RetryPolicy(backoff_base_seconds=0.001),
+        metrics,
+    )
+
+    async def request() -> int:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return (await client.get("https://api.sam.gov/opportunities/v2/search")).status_code
+
+    assert asyncio.run(request()) == 200
+    metrics.observe("request", 0.2)
+    metrics.record_page(cnt_bytes=2048, cnt_records=10)
+    metrics.cnt_rejected_records += 1
+
+    server = start_metrics_server(metrics, port=0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+
+    for line in [
+        'rfp_sam_gov_requests_total{status="503"} 1.0',
+        'rfp_sam_gov_requests_total{status="200"} 1.0',
+        "rfp_sam_gov_retries_total 1.0",
+        "rfp_sam_gov_received_bytes_total 2048.0",
+        "rfp_sam_gov_records_validated_total 10.0",
+        "rfp_sam_gov_records_rejected_total 1.0",
+        'rfp_sam_gov_page_stage_seconds_bucket{le="0.1",stage="request"} 0.0',
+        'rfp_sam_gov_page_stage_seconds_bucket{le="0.25",stage="request"} 1.0',
+        'rfp_sam_gov_page_stage_seconds_count{stage="request"} 1.0',
+    ]:
+        assert line in body.splitlines()
@@ -0,0 +1,49 @@
+import asyncio
+import datetime
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from rfp_scraper.services.quarantine import QuarantinedRecord, RecordQuarantine
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity, run_scraping
+from tests.services.conftest import FakeSamGov
+
+
+def test_run_scraping_quarantines_invalid_records_and_keeps_the_rest(
+    tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]
+):
+    opportunities_json = [make_opportunity_json(f"notice-{index}") for index in range(5)]
+    del opportunities_json[1]["title"]
+    opportunities_json[3]["pointOfContact"] = [{"type": None}]
+    fake_sam_gov = FakeSamGov(opportunities_json)
+    quarantine_path = tmp_path / "quarantine.jsonl"
+
+    async def scrape(quarantine: RecordQuarantine | None) -> list[SamGovOpportunity]:
+        async with fake_sam_gov.client() as client:
+            return await run_scraping(
+                datetime.datetime(2025, 4, 28), datetime.datetime(2025, 4, 29), quarantine=quarantine, client=client
+            )
+
+    with pytest.raises(ValidationError):
+        _ = asyncio.run(scrape(None))
+
+    with RecordQuarantine(quarantine_path) as quarantine:
+        opportunities = asyncio.run(scrape(quarantine))
+
+    assert [opportunity.noticeId for opportunity in opportunities] == ["notice-0", "notice-2", "notice-4"]
+    assert quarantine.cnt_quarantined == 2
+    quarantined = [QuarantinedRecord.model_validate_json(line) for line in quarantine_path.read_text().splitlines()]
+    assert [record.notice_id for record in quarantined] == ["notice-1", "notice-3"]
+    assert quarantined[0].errors[0]["loc"] == ["title"]
+    assert quarantined[1].record == opportunities_json[3]
+
+
+def test_quarantine_file_is_only_created_for_invalid_records(tmp_path: Path):
+    with RecordQuarantine(tmp_path / "quarantine.jsonl") as quarantine:
+        pass
+
+    assert quarantine.cnt_quarantined == 0
+    assert not (tmp_path / "quarantine.jsonl").exists()
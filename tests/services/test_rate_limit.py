@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from rfp_scraper.services.rate_limit import RateLimitedTransport, TokenBucketRateLimiter
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    async def acquire_all() -> list[float]:
+        rate_limiter = TokenBucketRateLimiter(requests_per_second=50, burst=2)
+        started_at = time.monotonic()
+        elapsed: list[float] = []
+        for _ in range(6):
+            await rate_limiter.acquire()
+            elapsed.append(time.monotonic() - started_at)
+        return elapsed
+
+    elapsed = asyncio.run(acquire_all())
+
+    # Two tokens are available up front; the other four each wait ~1/50s for a refill.
+    assert elapsed[1] < 0.01
+    assert elapsed[-1] >= 4 / 50 * 0.9
+
+
+def test_token_bucket_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        _ = TokenBucketRateLimiter(requests_per_second=0)
+    with pytest.raises(ValueError):
+        _ = TokenBucketRateLimiter(requests_per_second=1, burst=0)
+
+
+def test_rate_limited_transport_throttles_concurrent_requests():
+    async def send_concurrently() -> float:
+        transport = RateLimitedTransport(
+            httpx.MockTransport(lambda request: httpx.Response(200)),
+            TokenBucketRateLimiter(requests_per_second=100, burst=1),
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            started_at = time.monotonic()
+            _ = await asyncio.gather(*(client.get("https://api.sam.gov/") for _ in range(11)))
+            return time.monotonic() - started_at
+
+    assert asyncio.run(send_concurrently()) >= 10 / 100 * 0.9
@@ -0,0 +1,76 @@
+import asyncio
+import os
+from pathlib import Path
+
+import httpx
+
+from rfp_scraper.services.response_cache import CachingTransport, ResponseCache, cache_key
+
+
+def _get_all(transport: CachingTransport, urls: list[str]) -> list[httpx.Response]:
+    async def get_all() -> list[httpx.Response]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return [await client.get(url) for url in urls]
+
+    return asyncio.run(get_all())
+
+
+def test_cache_key_ignores_api_key_and_parameter_order():
+    assert cache_key(httpx.Request("GET", "https://api.sam.gov/v2/search?limit=1&postedFrom=a&api_key=one")) == (
+        cache_key(httpx.Request("GET", "https://api.sam.gov/v2/search?api_key=two&postedFrom=a&limit=1"))
+    )
+    assert cache_key(httpx.Request("GET", "https://api.sam.gov/v2/search?offset=0")) != (
+        cache_key(httpx.Request("GET", "https://api.sam.gov/v2/search?offset=1000"))
+    )
+
+
+def test_fresh_entries_are_served_without_network(tmp_path: Path):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"offset": request.url.params["offset"]})
+
+    transport = CachingTransport(httpx.MockTransport(handler), ResponseCache(tmp_path))
+    responses = _get_all(
+        transport,
+        [
+            "https://api.sam.gov/v2/search?offset=0&api_key=one",
+            "https://api.sam.gov/v2/search?offset=0&api_key=two",
+            "https://api.sam.gov/v2/search?offset=1000&api_key=one",
+        ],
+    )
+
+    assert [response.json() for response in responses] == [{"offset": "0"}, {"offset": "0"}, {"offset": "1000"}]
+    assert len(requests) == 2
+
+
+def test_stale_entries_are_revalidated_with_etag(tmp_path: Path):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"version": 1}, headers={"ETag": '"v1"'})
+
+    transport = CachingTransport(httpx.MockTransport(handler), ResponseCache(tmp_path, ttl_seconds=0))
+    responses = _get_all(transport, ["https://api.sam.gov/v2/search"] * 2)
+
+    assert [response.json() for response in responses] == [{"version": 1}, {"version": 1}]
+    assert [response.status_code for response in responses] == [200, 200]
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path):
+    cache = ResponseCache(tmp_path, max_bytes=2500)
+    transport = CachingTransport(httpx.MockTransport(lambda request: httpx.Response(200, content=b"x" * 1000)), cache)
+
+    _ = _get_all(transport, ["https://api.sam.gov/a", "https://api.sam.gov/b"])
+    # Make "a" the most recently used entry before "c" pushes the cache over budget.
+    meta_path_a = tmp_path / f"{cache_key(httpx.Request('GET', 'https://api.sam.gov/a'))}.json"
+    os.utime(meta_path_a, (meta_path_a.stat().st_atime, meta_path_a.stat().st_mtime + 10))
+    _ = _get_all(transport, ["https://api.sam.gov/c"])
+
+    cached_urls = {cache_key(httpx.Request("GET", url)) for url in ["https://api.sam.gov/a", "https://api.sam.gov/c"]}
+    assert {path.stem for path in tmp_path.glob("*.json")} == cached_urls
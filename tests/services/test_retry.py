@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from rfp_scraper.services.retry import RetryPolicy, RetryTransport
+
+FAST_RETRY_POLICY = RetryPolicy(max_retries=3, backoff_base_seconds=0.001, backoff_max_seconds=0.01)
+
+
+def _send(
+    handler: Callable[[httpx.Request], httpx.Response], policy: RetryPolicy, cnt_requests: int = 1
+) -> list[httpx.Response]:
+    async def send() -> list[httpx.Response]:
+        transport = RetryTransport(httpx.MockTransport(handler), policy)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return [await client.get("https://api.sam.gov/opportunities/v2/search") for _ in range(cnt_requests)]
+
+    return asyncio.run(send())
+
+
+def test_retry_transport_retries_transient_statuses_until_success():
+    statuses = iter([503, 429, 200])
+
+    [response] = _send(lambda request: httpx.Response(next(statuses), headers={"Retry-After": "0"}), FAST_RETRY_POLICY)
+
+    assert response.status_code == 200
+
+
+def test_retry_transport_gives_up_after_max_retries():
+    attempts: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(500)
+
+    [response] = _send(handler, FAST_RETRY_POLICY)
+
+    assert response.status_code == 500
+    assert len(attempts) == 4
+
+
+def test_retry_transport_does_not_retry_client_errors():
+    attempts: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(400)
+
+    [response] = _send(handler, FAST_RETRY_POLICY)
+
+    assert response.status_code == 400
+    assert len(attempts) == 1
+
+
+def test_retry_transport_retries_transport_errors():
+    attempts: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200)
+
+    [response] = _send(handler, FAST_RETRY_POLICY)
+
+    assert response.status_code == 200
+
+
+def test_retry_budget_is_shared_across_requests():
+    attempts: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(502)
+
+    responses = _send(handler, FAST_RETRY_POLICY.model_copy(update={"retry_budget": 2}), cnt_requests=3)
+
+    assert [response.status_code for response in responses] == [502, 502, 502]
+    # Two retries on the first request exhaust the budget; the other requests get a single attempt each.
+    assert len(attempts) == 5
+
+
+@pytest.mark.parametrize(("retry_after", "expected_delay"), [("2", 2.0), ("120", 60.0)])
+def test_retry_after_header_is_honored_and_capped(retry_after: str, expected_delay: float):
+    transport = RetryTransport(httpx.MockTransport(lambda request: httpx.Response(200)))
+    assert transport._backoff_delay(0, float(retry_after)) == expected_delay  # pyright: ignore[reportPrivateUsage]
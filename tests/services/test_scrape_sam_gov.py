@@ -1,6 +1,24 @@
-from typing import Any
+import asyncio
+import datetime
+import json
+from collections.abc import Callable
+from contextlib import aclosing
+from typing import Any, Literal
 
-from rfp_scraper.services.scrape_sam_gov import SamGovSearchResponse
+import httpx
+import pytest
+
+from rfp_scraper.services.scrape_sam_gov import (
+    API_MAX_LIMIT,
+    SamGovApiError,
+    SamGovOpportunity,
+    SamGovSearchResponse,
+    _build_date_shards,  # pyright: ignore[reportPrivateUsage]
+    decode_search_page,
+    iter_opportunities,
+    run_scraping,
+)
+from tests.services.conftest import FakeSamGov
 
 
 def test_sam_gov_opportunities_validation_basic(sam_gov_api_response_json_basic: dict[str, Any]):
@@ -12,3 +30,136 @@ def test_sam_gov_opportunities_validation_basic(sam_gov_api_response_json_basic:
 def test_sam_gov_opportunities_validation_complex(sam_gov_api_response_json_complex: dict[str, Any]):
     opportunities = SamGovSearchResponse.model_validate(sam_gov_api_response_json_complex)
     assert len(opportunities.opportunitiesData) == len(sam_gov_api_response_json_complex["opportunitiesData"])
+
+
+@pytest.mark.parametrize("json_backend", ["pydantic", "orjson"])
+def test_decode_search_page_matches_model_validate(
+    sam_gov_api_response_json_complex: dict[str, Any], json_backend: Literal["pydantic", "orjson"]
+):
+    if json_backend == "orjson":
+        _ = pytest.importorskip("orjson")
+    content = json.dumps(sam_gov_api_response_json_complex).encode()
+
+    decoded = decode_search_page(content, json_backend)
+
+    assert decoded == SamGovSearchResponse.model_validate(sam_gov_api_response_json_complex)
+
+
+def test_decode_search_page_projects_fields(sam_gov_api_response_json_complex: dict[str, Any]):
+    content = json.dumps(sam_gov_api_response_json_complex).encode()
+
+    page = decode_search_page(content, fields=frozenset({"title", "award"}))
+
+    full_page = SamGovSearchResponse.model_validate_json(content)
+    opportunity = page.opportunitiesData[0]
+    assert isinstance(opportunity, SamGovOpportunity)
+    assert opportunity.title == full_page.opportunitiesData[0].title
+    assert opportunity.award == full_page.opportunitiesData[0].award
+    assert opportunity.pointOfContact is None
+    assert opportunity.model_dump().keys() == {"noticeId", "postedDate", "title", "award"}
+
+
+def test_run_scraping_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="notAField"):
+        _ = asyncio.run(
+            run_scraping(datetime.datetime(2025, 4, 28), datetime.datetime(2025, 4, 29), fields=["title", "notAField"])
+        )
+
+
+def test_run_scraping_fetches_pages_concurrently_in_offset_order(
+    make_opportunity_json: Callable[..., dict[str, Any]],
+):
+    fake_sam_gov = FakeSamGov([make_opportunity_json(f"notice-{index:05d}") for index in range(API_MAX_LIMIT * 4 + 1)])
+
+    async def scrape() -> list[SamGovOpportunity]:
+        async with fake_sam_gov.client() as client:
+            return await run_scraping(
+                datetime.datetime(2025, 4, 28),
+                datetime.datetime(2025, 4, 29),
+                max_concurrent_requests=2,
+                client=client,
+            )
+
+    opportunities = asyncio.run(scrape())
+
+    assert [opportunity.noticeId for opportunity in opportunities] == [
+        opportunity["noticeId"] for opportunity in fake_sam_gov.opportunities
+    ]
+    assert len(fake_sam_gov.requests) == 5
+    assert fake_sam_gov.max_in_flight == 2
+
+
+def test_iter_opportunities_does_not_fetch_ahead_of_window(make_opportunity_json: Callable[..., dict[str, Any]]):
+    fake_sam_gov = FakeSamGov([make_opportunity_json(f"notice-{index:05d}") for index in range(API_MAX_LIMIT * 10)])
+
+    async def take_first_page() -> list[str]:
+        notice_ids: list[str] = []
+        async with fake_sam_gov.client() as client:
+            opportunities = iter_opportunities(
+                datetime.datetime(2025, 4, 28),
+                datetime.datetime(2025, 4, 29),
+                max_concurrent_requests=2,
+                client=client,
+            )
+            async with aclosing(opportunities):
+                async for opportunity in opportunities:
+                    notice_ids.append(opportunity.noticeId)
+                    if len(notice_ids) == API_MAX_LIMIT:
+                        break
+        return notice_ids
+
+    assert asyncio.run(take_first_page()) == [f"notice-{index:05d}" for index in range(API_MAX_LIMIT)]
+    # The first page plus one window of look-ahead requests; the other seven pages are never requested.
+    assert len(fake_sam_gov.requests) <= 3
+
+
+def test_build_date_shards_covers_range_without_overlap():
+    shards = _build_date_shards(datetime.date(2025, 1, 1), datetime.date(2025, 1, 10), datetime.timedelta(weeks=1))
+    assert shards == [
+        (datetime.date(2025, 1, 1), datetime.date(2025, 1, 7)),
+        (datetime.date(2025, 1, 8), datetime.date(2025, 1, 10)),
+    ]
+
+
+def test_iter_opportunities_shards_range_and_deduplicates(make_opportunity_json: Callable[..., dict[str, Any]]):
+    opportunities_json = [
+        make_opportunity_json(f"notice-{day}-{index}", posted_date=f"2025-04-{day:02d}")
+        for day in range(1, 11)
+        for index in range(3)
+    ]
+    # The same notice served twice by one shard must only be yielded once.
+    opportunities_json.append(make_opportunity_json("notice-1-0", posted_date="2025-04-02"))
+    fake_sam_gov = FakeSamGov(opportunities_json)
+
+    async def scrape() -> list[SamGovOpportunity]:
+        async with fake_sam_gov.client() as client:
+            return await run_scraping(
+                datetime.datetime(2025, 4, 1),
+                datetime.datetime(2025, 4, 10),
+                shard_size=datetime.timedelta(days=2),
+                client=client,
+            )
+
+    notice_ids = [opportunity.noticeId for opportunity in asyncio.run(scrape())]
+
+    assert sorted(notice_ids) == sorted({opportunity["noticeId"] for opportunity in opportunities_json})
+    assert {
+        (request.url.params["postedFrom"], request.url.params["postedTo"]) for request in fake_sam_gov.requests
+    } == {
+        ("04/01/2025", "04/02/2025"),
+        ("04/03/2025", "04/04/2025"),
+        ("04/05/2025", "04/06/2025"),
+        ("04/07/2025", "04/08/2025"),
+        ("04/09/2025", "04/10/2025"),
+    }
+
+
+def test_run_scraping_raises_sam_gov_api_error_on_failed_page():
+    async def scrape() -> list[SamGovOpportunity]:
+        transport = httpx.MockTransport(lambda request: httpx.Response(403, text="API_KEY_INVALID"))
+        async with httpx.AsyncClient(base_url="https://api.sam.gov/opportunities", transport=transport) as client:
+            return await run_scraping(datetime.datetime(2025, 4, 28), datetime.datetime(2025, 4, 29), client=client)
+
+    with pytest.raises(SamGovApiError) as exc_info:
+        _ = asyncio.run(scrape())
+    assert exc_info.value.status_code == 403
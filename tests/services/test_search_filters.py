@@ -0,0 +1,94 @@
+import asyncio
+import datetime
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity, run_scraping
+from rfp_scraper.services.search_filters import SearchFilters
+from tests.services.conftest import FakeSamGov
+
+
+def test_search_filters_to_params():
+    filters = SearchFilters(
+        procurement_types=frozenset({"o", "k"}),
+        state="VA",
+        naics_code="541511",
+        response_deadline_from=datetime.date(2025, 5, 1),
+        response_deadline_to=datetime.date(2025, 6, 30),
+    )
+
+    assert filters.to_params() == {
+        "ptype": ["k", "o"],
+        "state": "VA",
+        "ncode": "541511",
+        "rdlfrom": "05/01/2025",
+        "rdlto": "06/30/2025",
+    }
+    assert SearchFilters().to_params() == {}
+
+
+def test_search_filters_serialize_the_same_across_hash_seeds():
+    # Set iteration order depends on PYTHONHASHSEED, so a checkpoint written by one process must match in the next.
+    script = (
+        "from rfp_scraper.services.search_filters import SearchFilters; "
+        "print(SearchFilters(procurement_types=frozenset(['o', 'p', 'k', 'r'])).model_dump_json(exclude_defaults=True))"
+    )
+    dumps = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in range(8)
+    }
+
+    assert dumps == {'{"procurement_types":["k","o","p","r"]}'}
+
+
+@pytest.mark.parametrize(
+    "invalid_filters",
+    [
+        {"procurement_types": frozenset({"x"})},
+        {"state": "Virginia"},
+        {"zip": "2210"},
+        {"naics_code": "54151a"},
+        {"title": "  "},
+        {"response_deadline_from": datetime.date(2025, 7, 1), "response_deadline_to": datetime.date(2025, 6, 30)},
+    ],
+)
+def test_search_filters_rejects_invalid_values(invalid_filters: dict[str, Any]):
+    with pytest.raises(ValidationError):
+        _ = SearchFilters.model_validate(invalid_filters)
+
+
+def test_run_scraping_sends_filters_upstream(make_opportunity_json: Callable[..., dict[str, Any]]):
+    fake_sam_gov = FakeSamGov(
+        [
+            make_opportunity_json(f"notice-{index}", naicsCode="541511" if index % 4 == 0 else "337214")
+            for index in range(20)
+        ]
+    )
+
+    async def scrape() -> list[SamGovOpportunity]:
+        async with fake_sam_gov.client() as client:
+            return await run_scraping(
+                datetime.datetime(2025, 4, 28),
+                datetime.datetime(2025, 4, 29),
+                filters=SearchFilters(naics_code="541511", procurement_types=frozenset({"a"})),
+                client=client,
+            )
+
+    opportunities = asyncio.run(scrape())
+
+    assert [opportunity.noticeId for opportunity in opportunities] == [f"notice-{index}" for index in range(0, 20, 4)]
+    (request,) = fake_sam_gov.requests
+    assert request.url.params["ncode"] == "541511"
+    assert request.url.params.get_list("ptype") == ["a"]
@@ -0,0 +1,46 @@
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from rfp_scraper.services.scrape_sam_gov import SamGovOpportunity, projected_opportunity_model
+from rfp_scraper.services.sqlite_store import OpportunityStore
+
+
+def test_upsert_inserts_then_updates_by_notice_id(tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]):
+    opportunities = [
+        SamGovOpportunity.model_validate(make_opportunity_json(f"notice-{index}", naicsCode=f"33721{index % 3}"))
+        for index in range(25)
+    ]
+
+    with OpportunityStore(tmp_path / "opportunities.db") as store:
+        assert store.upsert(opportunities, batch_size=10) == 25
+        amended = opportunities[0].model_copy(update={"title": "Amended"})
+        assert store.upsert([amended]) == 1
+
+        assert store.count() == 25
+        assert store.get("notice-0") == amended
+        assert store.get("missing") is None
+
+
+def test_store_indexes_query_columns(tmp_path: Path):
+    path = tmp_path / "opportunities.db"
+    OpportunityStore(path).close()
+
+    with sqlite3.connect(path) as connection:
+        indexed_columns = {
+            row[0]
+            for row in connection.execute(
+                "SELECT ii.name FROM pragma_index_list('opportunities') AS il, pragma_index_info(il.name) AS ii"
+            )
+        }
+    assert {"posted_date", "naics_code", "response_deadline", "type_of_set_aside"} <= indexed_columns
+
+
+def test_upsert_accepts_projected_opportunities(tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]):
+    projected_model = projected_opportunity_model(frozenset({"naicsCode"}))
+    opportunity = projected_model.model_validate(make_opportunity_json("notice-1", naicsCode="541511"))
+
+    with OpportunityStore(tmp_path / "opportunities.db") as store:
+        assert store.upsert([opportunity]) == 1
+        assert store.count() == 1
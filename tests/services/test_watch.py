@@ -0,0 +1,116 @@
+import asyncio
+import datetime
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from rfp_scraper.services.incremental import IncrementalState
+from rfp_scraper.services.scrape_sam_gov import API_MAX_LIMIT
+from rfp_scraper.services.watch import PollSchedule, watch_opportunity_pages
+from tests.services.conftest import FakeSamGov
+
+# A Sunday, so outside the busy hours.
+_QUIET_TIME = datetime.datetime(2025, 4, 27, 12, tzinfo=datetime.UTC)
+# Tuesday 10:00 in New York.
+_BUSY_TIME = datetime.datetime(2025, 4, 29, 14, tzinfo=datetime.UTC)
+
+
+def test_poll_schedule_backs_off_when_quiet_and_speeds_up_when_busy():
+    schedule = PollSchedule(min_interval_seconds=60, max_interval_seconds=600, busy_max_interval_seconds=120)
+
+    assert schedule.next_interval(60, 0, _QUIET_TIME) == 120
+    assert schedule.next_interval(480, 0, _QUIET_TIME) == 600
+    assert schedule.next_interval(600, 3, _QUIET_TIME) == 60
+    assert schedule.next_interval(600, 0, _BUSY_TIME) == 120
+
+
+def test_watch_polls_through_one_client_and_only_yields_new_notices(
+    tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]
+):
+    today = datetime.date.today().isoformat()
+    fake_sam_gov = FakeSamGov([make_opportunity_json("first", posted_date=today)])
+    state = IncrementalState.open(tmp_path / "state.json")
+
+    async def watch() -> list[list[str]]:
+        polled: list[list[str]] = []
+        async with fake_sam_gov.client() as client:
+            pages = watch_opportunity_pages(
+                state,
+                datetime.datetime(2025, 4, 1),
+                schedule=PollSchedule(min_interval_seconds=0, max_interval_seconds=0, busy_max_interval_seconds=0),
+                max_polls=3,
+                client=client,
+            )
+            async for page in pages:
+                polled.append([opportunity.noticeId for opportunity in page])
+                if len(polled) == 1:
+                    fake_sam_gov.opportunities.append(make_opportunity_json("second", posted_date=today))
+        return polled
+
+    assert asyncio.run(watch()) == [["first"], ["second"]]
+    assert len(fake_sam_gov.requests) == 3
+    assert IncrementalState.open(tmp_path / "state.json").seen_notices.keys() == {"first", "second"}
+
+
+def test_watch_survives_a_failed_poll(tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]):
+    fake_sam_gov = FakeSamGov([make_opportunity_json("first", posted_date=datetime.date.today().isoformat())])
+    statuses = iter([503])
+
+    async def flaky_handler(request: httpx.Request) -> httpx.Response:
+        status_code = next(statuses, None)
+        if status_code is not None:
+            return httpx.Response(status_code, text="Service Unavailable")
+        return await fake_sam_gov.handler(request)
+
+    async def watch() -> list[list[str]]:
+        polled: list[list[str]] = []
+        async with httpx.AsyncClient(
+            base_url="https://api.sam.gov/opportunities", transport=httpx.MockTransport(flaky_handler)
+        ) as client:
+            async for page in watch_opportunity_pages(
+                IncrementalState.open(tmp_path / "state.json"),
+                datetime.datetime(2025, 4, 1),
+                schedule=PollSchedule(min_interval_seconds=0, max_interval_seconds=0, busy_max_interval_seconds=0),
+                max_polls=2,
+                client=client,
+            ):
+                polled.append([opportunity.noticeId for opportunity in page])
+        return polled
+
+    assert asyncio.run(watch()) == [["first"]]
+
+
+def test_watch_does_not_repeat_notices_from_a_failed_poll(
+    tmp_path: Path, make_opportunity_json: Callable[..., dict[str, Any]]
+):
+    today = datetime.date.today().isoformat()
+    fake_sam_gov = FakeSamGov(
+        [make_opportunity_json(f"notice-{index:05d}", posted_date=today) for index in range(API_MAX_LIMIT + 1)]
+    )
+    failed_offsets: set[str] = set()
+
+    async def flaky_handler(request: httpx.Request) -> httpx.Response:
+        offset = request.url.params.get("offset", "0")
+        if offset != "0" and offset not in failed_offsets:
+            failed_offsets.add(offset)
+            return httpx.Response(503, text="Service Unavailable")
+        return await fake_sam_gov.handler(request)
+
+    async def watch() -> list[int]:
+        polled: list[int] = []
+        async with httpx.AsyncClient(
+            base_url="https://api.sam.gov/opportunities", transport=httpx.MockTransport(flaky_handler)
+        ) as client:
+            async for page in watch_opportunity_pages(
+                IncrementalState.open(tmp_path / "state.json"),
+                datetime.datetime(2025, 4, 1),
+                schedule=PollSchedule(min_interval_seconds=0, max_interval_seconds=0, busy_max_interval_seconds=0),
+                max_polls=2,
+                client=client,
+            ):
+                polled.append(len(page))
+        return polled
+
+    assert asyncio.run(watch()) == [API_MAX_LIMIT, 1]
@@ -0,0 +1,99 @@
+import io
+import logging
+import sys
+
+import pytest
+import structlog
+
+from rfp_scraper.logging import (
+    BackgroundStreamHandler,
+    LogVolumeLimits,
+    _EventSampler,  # pyright: ignore[reportPrivateUsage]
+    _FieldCapper,  # pyright: ignore[reportPrivateUsage]
+    _WarningCallsiteAdder,  # pyright: ignore[reportPrivateUsage]
+    _WarningCoalescer,  # pyright: ignore[reportPrivateUsage]
+)
+
+
+def test_background_stream_handler_writes_every_line_by_close():
+    stream = io.StringIO()
+    handler = BackgroundStreamHandler(stream)
+    logger = logging.getLogger("tests.background_stream_handler")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for index in range(1000):
+            logger.warning('{"event": "page", "offset": %d}', index)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1000
+    assert lines[-1] == '{"event": "page", "offset": 999}'
+
+
+def test_warning_callsite_adder_skips_info_events():
+    add_callsite = _WarningCallsiteAdder()
+
+    assert add_callsite(None, "info", {"event": "page"}) == {"event": "page"}
+    warning = add_callsite(None, "warning", {"event": "retry"})
+    assert warning["func_name"] == "test_warning_callsite_adder_skips_info_events"
+    assert warning["filename"] == "test_logging.py"
+
+
+def test_event_sampler_logs_every_nth_info_event_and_all_warnings():
+    sample = _EventSampler({"page": 3})
+    logged: list[int] = []
+    for offset in range(7):
+        try:
+            event = sample(None, "info", {"event": "page", "offset": offset})
+        except structlog.DropEvent:
+            continue
+        assert event["sampled_every"] == 3
+        logged.append(offset)
+
+    assert logged == [0, 3, 6]
+    assert sample(None, "warning", {"event": "page"}) == {"event": "page"}
+    assert sample(None, "info", {"event": "other"}) == {"event": "other"}
+
+
+def test_warning_coalescer_counts_repeats_dropped_within_window(monkeypatch: pytest.MonkeyPatch):
+    now = 100.0
+    monkeypatch.setattr("rfp_scraper.logging.time.monotonic", lambda: now)
+    coalesce = _WarningCoalescer(window_seconds=10)
+    logger = logging.getLogger("tests.coalescer")
+
+    assert coalesce(logger, "warning", {"event": "retry"}) == {"event": "retry"}
+    for _ in range(4):
+        with pytest.raises(structlog.DropEvent):
+            _ = coalesce(logger, "warning", {"event": "retry"})
+    assert coalesce(logger, "error", {"event": "retry"}) == {"event": "retry"}
+
+    now = 110.0
+    assert coalesce(logger, "warning", {"event": "retry"}) == {"event": "retry", "cnt_coalesced": 4}
+
+
+def test_field_capper_cuts_long_strings_and_collections():
+    cap = _FieldCapper(LogVolumeLimits(max_field_chars=5, max_field_items=2))
+
+    event = cap(None, "error", {"event": "bad", "response_text": "x" * 12, "errors": [{"a": 1}] * 5})
+
+    assert event["event"] == "bad"
+    assert event["response_text"] == "xxxxx...[7 more chars]"
+    assert event["errors"] == [{"a": 1}, {"a": 1}, "...3 more items"]
+
+
+def test_field_capper_keeps_exc_info_for_the_traceback_renderer():
+    cap = _FieldCapper(LogVolumeLimits(max_field_chars=5, max_field_items=2))
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        exc_info = sys.exc_info()
+
+    event = structlog.processors.format_exc_info(
+        None, "error", cap(None, "error", {"event": "bad", "exc_info": exc_info})
+    )
+
+    assert "exc_info" not in event
+    assert 'raise RuntimeError("boom")' in event["exception"]